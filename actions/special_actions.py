@@ -99,7 +99,7 @@ class EscapeGrappleAction(Action):
             prof_text = f" +{performer.get_proficiency_bonus()} (Prof)" if acrobatics_has_prof else ""
 
         # Make the escape attempt
-        escape_roll, _ = roll_d20()
+        escape_roll, _ = roll_d20(purpose='check')
         my_total = escape_roll + my_modifier
 
         # Get escape DC (should be stored from when grapple was applied)
@@ -59,7 +59,7 @@ class UnarmedStrikeAction(Action):
                 print(f"CRIT DAMAGE: +1 additional damage")
 
             print(f"{performer.name} deals {damage} bludgeoning damage (1 base +{str_mod} [STR])")
-            target.take_damage(damage, attacker=performer)
+            target.take_damage(damage, attacker=performer, source='Unarmed Strike')
             return True
         else:
             print("The unarmed strike misses.")
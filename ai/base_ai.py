@@ -1,20 +1,60 @@
 from actions.base_actions import AttackAction
+from .group_blackboard import get_faction
+from .turn_budget import TURN_BUDGET_STATS, STAGE_COSTS, as_deadline
+import time
 
 class AIBrain:
     """A base class for character decision-making AI."""
 
-    def choose_actions(self, character, combatants):
+    def choose_actions(self, character, combatants, deadline=None):
         """
         Determines the best action and bonus action for a character to take.
         Returns a dictionary with action, bonus_action, and targets.
+        With a deadline, refines the answer until the time budget runs out.
         """
+        if deadline is not None:
+            return self.refine_until_deadline(character, combatants, deadline, [self.heuristic_actions])
+        return self.heuristic_actions(character, combatants)
+
+    def heuristic_actions(self, character, combatants):
+        """Cheapest decision: attack the first living enemy with the equipped weapon."""
         action = AttackAction(character.equipped_weapon)
         bonus_action = None
-        target = next((c for c in combatants if c.is_alive and c != character), None)
+        target = next((c for c in combatants if c.is_alive and get_faction(c) != get_faction(character)), None)
 
         return {
             'action': action,
             'bonus_action': bonus_action,
             'action_target': target,
             'bonus_action_target': None
-        }
\ No newline at end of file
+        }
+
+    def refine_until_deadline(self, character, combatants, deadline, stages):
+        """
+        Budgeted decision over stages ordered cheapest to deepest: run the
+        deepest stage expected to finish before the deadline (see
+        turn_budget.StageCosts), trying shallower ones if it has no answer.
+        The first stage is the fallback, run only when nothing deeper fits
+        or answers, so there is always a decision.
+        """
+        deadline = as_deadline(deadline)
+        brain_name = type(self).__name__
+        best = None
+        depth = 1
+        for index in range(len(stages) - 1, 0, -1):
+            stage = stages[index]
+            if STAGE_COSTS.expected(brain_name, stage) > deadline.remaining():
+                continue
+            started = time.perf_counter()
+            decision = stage(character, combatants)
+            STAGE_COSTS.observe(brain_name, stage, time.perf_counter() - started)
+            if decision is not None:
+                best, depth = decision, index + 1
+                break
+        if best is None:
+            best = stages[0](character, combatants)
+
+        if TURN_BUDGET_STATS.record(brain_name, deadline, depth, len(stages)):
+            print(f"[AI BUDGET] {character.name}: decision took {deadline.elapsed() * 1000:.1f}ms "
+                  f"(budget {deadline.budget * 1000:.1f}ms)")
+        return best
\ No newline at end of file
@@ -1,5 +1,6 @@
 # File: ai/character_ai/paladin_ai.py
 from ..base_ai import AIBrain
+from ..parameters import get_ai_parameter
 from actions.base_actions import AttackAction
 from actions.spell_actions import CastSpellAction
 from actions.special_actions import LayOnHandsAction, EscapeGrappleAction  # ADD EscapeGrappleAction here
@@ -9,7 +10,14 @@ class PaladinAIBrain(AIBrain):
 
     # File: ai/character_ai/paladin_ai.py - Fixed Emergency Healing Logic
 
-    def choose_actions(self, character, combatants):
+    def choose_actions(self, character, combatants, deadline=None):
+        """Full Paladin analysis; under a deadline, a plain weapon attack is the fallback answer."""
+        if deadline is not None:
+            return self.refine_until_deadline(character, combatants, deadline,
+                                              [self.heuristic_actions, self.plan_actions])
+        return self.plan_actions(character, combatants)
+
+    def plan_actions(self, character, combatants):
         """
         Enhanced AI Logic with Critical Situation Handling:
         1. CRITICAL SURVIVAL: Life-threatening situations override all other priorities
@@ -245,8 +253,8 @@ class PaladinAIBrain(AIBrain):
                 predicted_crush_damage = 9 + str_mod  # 2d8 average (9) + STR mod
         
         # Critical survival thresholds
-        critical_hp_threshold = 0.25  # 25%
-        emergency_hp_threshold = 0.15  # 15%
+        critical_hp_threshold = get_ai_parameter('paladin.critical_hp')  # 25% by default
+        emergency_hp_threshold = get_ai_parameter('paladin.emergency_hp')  # 15% by default
         
         # Check if we'll likely die next turn
         will_likely_die = (character.hp <= predicted_crush_damage and predicted_crush_damage > 0)
@@ -307,10 +315,10 @@ class PaladinAIBrain(AIBrain):
         if total_slots <= 1 and has_cure_wounds_prepared:
             conserve_slots = True
             reason = f"Only {total_slots} slot(s) left, conserving for Cure Wounds"
-        elif our_hp_percent <= 0.40 and total_slots >= 1 and has_cure_wounds_prepared:
+        elif our_hp_percent <= get_ai_parameter('paladin.conserve_slot_hp') and total_slots >= 1 and has_cure_wounds_prepared:
             conserve_slots = True
             reason = f"Moderate HP ({our_hp_percent:.1%}), conserving slot for Cure Wounds"
-        elif our_hp_percent <= 0.60 and total_slots <= 2 and has_cure_wounds_prepared:
+        elif our_hp_percent <= get_ai_parameter('paladin.conserve_low_slots_hp') and total_slots <= 2 and has_cure_wounds_prepared:
             conserve_slots = True
             reason = f"Lower HP ({our_hp_percent:.1%}) with only {total_slots} slots, conserving for healing"
         
@@ -373,12 +381,12 @@ class PaladinAIBrain(AIBrain):
             print(f"[HEALING DEBUG] EMERGENCY mode - forcing critical healing")
         elif hasattr(character, 'is_grappled') and character.is_grappled:
             # More aggressive when grappled
-            critical_healing = hp_percent <= 0.40  # 40% when grappled (was 50%)
-            moderate_healing = hp_percent <= 0.70  # 70% when grappled
+            critical_healing = hp_percent <= get_ai_parameter('paladin.grappled_critical_heal_hp')  # 40% by default
+            moderate_healing = hp_percent <= get_ai_parameter('paladin.grappled_moderate_heal_hp')  # 70% by default
         else:
             # Normal thresholds when not grappled
-            critical_healing = hp_percent <= 0.35  # 35% or less HP
-            moderate_healing = hp_percent <= 0.65  # 65% or less HP
+            critical_healing = hp_percent <= get_ai_parameter('paladin.critical_heal_hp')  # 35% by default
+            moderate_healing = hp_percent <= get_ai_parameter('paladin.moderate_heal_hp')  # 65% by default
 
         from spells.level_1.cure_wounds import cure_wounds
         cure_wounds_prepared = cure_wounds in getattr(character, 'prepared_spells', [])
@@ -441,7 +449,7 @@ class PaladinAIBrain(AIBrain):
         has_guiding_bolt = (character.spell_slots.get(1, 0) > 0 and
                            guiding_bolt in getattr(character, 'prepared_spells', []))
         
-        if our_hp_percent <= 0.40 and has_guiding_bolt:
+        if our_hp_percent <= get_ai_parameter('paladin.retreat_hp') and has_guiding_bolt:
             if current_distance <= 10:
                 should_retreat = True
                 reason = f"Low HP ({our_hp_percent:.1%}), retreating to use ranged attacks"
@@ -0,0 +1,252 @@
+# File: ai/decision_cache.py
+"""
+Memoized AI decisions over a discretized battlefield state.
+
+The beast/humanoid intelligence tiers are deterministic functions of a few
+features: distance, HP bucket, grapple state and available actions.
+AIs whose choice also rolls dice (a goblin's panic check) set
+cacheable = False and always decide afresh, so caching never changes the
+odds or the random stream. The
+cache hashes those features into a compact key and stores the chosen action
+as a template (which weapon slot or action, which enemy by rank, which flags
+the AI set on the creature). The template is re-bound to the live creature on
+a hit, so one cache can be shared across turns, creatures of the same type and
+Monte Carlo trials.
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+
+from actions.base_actions import AttackAction
+from ai.parameters import PARAMETER_BOUNDS
+
+
+# Bucket boundaries line up with the thresholds the tier AIs branch on
+HP_BUCKET_BOUNDS = (0.25, 0.3, 0.4, 0.5, 0.7, 1.0)
+# The tier AIs test exact distances in melee and reach range (melee vs bow past
+# 5 ft, constriction within 10 ft, octopus.grapple_reach anywhere in its search
+# bounds), so those are keyed as-is; only longer distances are banded
+EXACT_DISTANCE_FEET = max(10, PARAMETER_BOUNDS['octopus.grapple_reach'][1])
+FAR_DISTANCE_BOUNDS = (60, 150)
+
+# Only attribute changes of these types are replayed from a template
+_REPLAYABLE_TYPES = (bool, int, float, str, type(None))
+
+
+def hp_bucket(creature):
+    """Discretize current HP as a fraction of maximum."""
+    return bisect_right(HP_BUCKET_BOUNDS, creature.hp / creature.max_hp)
+
+
+def distance_band(distance):
+    """Discretize a distance in feet: exact within reach range, banded beyond it."""
+    if distance <= EXACT_DISTANCE_FEET:
+        return distance
+    return EXACT_DISTANCE_FEET + 1 + bisect_right(FAR_DISTANCE_BOUNDS, distance)
+
+
+def make_state_key(tier, character, enemies):
+    """
+    Build the compact state key for a decision.
+
+    Enemies are ranked by distance (then HP) so the key and the target
+    reference in the template are independent of combatant identity.
+    """
+    grapple_target = getattr(character, 'grapple_target', None) or getattr(character, 'grappled_target', None)
+    ranked = sorted(enemies, key=lambda e: (abs(character.position - e.position), e.hp))
+
+    enemy_features = tuple(
+        (distance_band(abs(character.position - e.position)), hp_bucket(e),
+         getattr(e, 'size', 'Medium'), e is grapple_target, bool(getattr(e, 'is_grappled', False)))
+        for e in ranked
+    )
+    stat_block = getattr(character, 'stat_block', None)
+    key = (
+        type(character).__name__,
+        stat_block.key if stat_block is not None else None,
+        tier,
+        hp_bucket(character),
+        bool(getattr(character, 'is_grappling', False)),
+        bool(getattr(character, 'is_grappled', False)),
+        tuple(action.name for action in character.available_actions),
+        enemy_features,
+    )
+    return key, ranked
+
+
+class DecisionCache:
+    """Bounded LRU cache of decision templates with hit/miss counters."""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the template for a key (refreshing its LRU position), or None."""
+        template = self._entries.get(key)
+        if template is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return template
+
+    def put(self, key, template):
+        """Store a template, evicting the least recently used entry when full."""
+        self._entries[key] = template
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.uncacheable = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Counters for instrumentation and reports."""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'uncacheable': self.uncacheable,
+            'hit_rate': self.hit_rate,
+        }
+
+    # --- Template conversion ---
+
+    def lookup(self, key, character, ranked_enemies):
+        """Return a live decision for the key, or None on a miss."""
+        template = self.get(key)
+        if template is None:
+            return None
+        return bind_template(template, character, ranked_enemies)
+
+    def store(self, key, decision, character, ranked_enemies, attributes_before):
+        """Convert a fresh decision to a template and cache it if possible."""
+        template = make_template(decision, character, ranked_enemies, attributes_before)
+        if template is None:
+            self.uncacheable += 1
+            return
+        self.put(key, template)
+
+
+def make_template(decision, character, ranked_enemies, attributes_before):
+    """Describe a decision relative to the creature; None if it can't be described."""
+    if decision is None:
+        return None
+
+    template = {}
+    for slot in ('action', 'bonus_action'):
+        descriptor = _describe_action(decision.get(slot), character)
+        if descriptor is False:
+            return None
+        template[slot] = descriptor
+    for slot in ('action_target', 'bonus_action_target'):
+        descriptor = _describe_target(decision.get(slot), character, ranked_enemies)
+        if descriptor is False:
+            return None
+        template[slot] = descriptor
+
+    # Replay simple flags the AI set on the creature (e.g. critical-decision markers)
+    changed = {}
+    for name, value in vars(character).items():
+        if name in attributes_before:
+            before = attributes_before[name]
+            if before is value or (isinstance(value, _REPLAYABLE_TYPES) and before == value):
+                continue
+        if not isinstance(value, _REPLAYABLE_TYPES):
+            return None
+        changed[name] = value
+    template['attributes'] = changed
+    return template
+
+
+def bind_template(template, character, ranked_enemies):
+    """Re-create a decision dict from a template for the live creature."""
+    for name, value in template['attributes'].items():
+        setattr(character, name, value)
+    return {
+        'action': _bind_action(template['action'], character),
+        'bonus_action': _bind_action(template['bonus_action'], character),
+        'action_target': _bind_target(template['action_target'], character, ranked_enemies),
+        'bonus_action_target': _bind_target(template['bonus_action_target'], character, ranked_enemies),
+    }
+
+
+def _describe_action(action, character):
+    if action is None or isinstance(action, str):
+        return action
+    if isinstance(action, AttackAction):
+        for slot in ('equipped_weapon', 'secondary_weapon'):
+            if getattr(character, slot, None) is action.weapon:
+                return ('attack', slot)
+    for collection in ('available_actions', 'available_bonus_actions'):
+        for index, candidate in enumerate(getattr(character, collection, [])):
+            if candidate is action:
+                return (collection, index)
+    if action.name == "Multiattack":
+        return ('multiattack',)
+    return False
+
+
+def _bind_action(descriptor, character):
+    if descriptor is None or isinstance(descriptor, str):
+        return descriptor
+    kind = descriptor[0]
+    if kind == 'attack':
+        return AttackAction(getattr(character, descriptor[1]))
+    if kind == 'multiattack':
+        from actions.special_actions import MultiattackAction
+        return MultiattackAction(character)
+    return getattr(character, kind)[descriptor[1]]
+
+
+def _describe_target(target, character, ranked_enemies):
+    if target is None:
+        return None
+    if target is character:
+        return 'self'
+    for rank, enemy in enumerate(ranked_enemies):
+        if enemy is target:
+            return rank
+    return False
+
+
+def _bind_target(descriptor, character, ranked_enemies):
+    if descriptor is None:
+        return None
+    if descriptor == 'self':
+        return character
+    return ranked_enemies[descriptor]
+
+
+# Cache used by every IntelligenceBasedAI that has no cache of its own
+_default_cache = None
+
+
+def set_default_decision_cache(cache):
+    """Opt every tiered AI into a shared cache (None turns caching off)."""
+    global _default_cache
+    _default_cache = cache
+    return cache
+
+
+def get_default_decision_cache():
+    """Return the shared cache, or None when caching is off."""
+    return _default_cache
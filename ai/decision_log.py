@@ -0,0 +1,45 @@
+# File: ai/decision_log.py
+"""
+Optional log of AI decisions.
+
+While a log is open, every turn's chosen actions are appended as a compact
+tuple (round, creature, action, action target, bonus action, bonus action
+target). Replays compare these logs to find the first turn where a re-run
+fight departs from the recorded one. With no log open, record_decision
+does nothing.
+"""
+
+
+_decisions = None
+
+
+def start_decision_log():
+    """Start collecting decisions (discarding any open log)."""
+    global _decisions
+    _decisions = []
+
+
+def stop_decision_log():
+    """Stop collecting and return the decisions collected."""
+    global _decisions
+    decisions, _decisions = _decisions, None
+    return decisions or []
+
+
+def _name(item):
+    if item is None:
+        return None
+    return getattr(item, 'name', None) or type(item).__name__
+
+
+def record_decision(character, decision):
+    if _decisions is None or not decision:
+        return
+    _decisions.append((
+        getattr(character, 'current_round', 0),
+        character.name,
+        _name(decision.get('action')),
+        _name(decision.get('action_target')),
+        _name(decision.get('bonus_action')),
+        _name(decision.get('bonus_action_target')),
+    ))
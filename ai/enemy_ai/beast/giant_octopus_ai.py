@@ -1,5 +1,6 @@
 # File: ai/enemy_ai/beast/giant_octopus_ai.py
 from ...intelligence_based_ai import IntelligenceBasedAI
+from ...parameters import get_ai_parameter
 from actions.base_actions import AttackAction
 import random
 
@@ -19,7 +20,7 @@ class GiantOctopusAI(IntelligenceBasedAI):
 
         # PHB 2024: Octopus can only grapple ONE creature with its Tentacles action
         # Priority 1: If not grappling anyone, try to grapple
-        if not character.is_grappling and distance <= 10:
+        if not character.is_grappling and distance <= get_ai_parameter('octopus.grapple_reach'):
             print(f"[OCTOPUS TACTICS] Attempting to grapple target with all tentacles")
             return {
                 'action': 'tentacle_attack',  # Special action
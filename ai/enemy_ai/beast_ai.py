@@ -6,7 +6,8 @@ from actions.special_actions import MultiattackAction
 class GiantConstrictorSnakeAI(AIBrain):
     """AI for the Giant Constrictor Snake with multiattack and grappling tactics."""
 
-    def choose_actions(self, character, combatants):
+    def choose_actions(self, character, combatants, deadline=None):
+        # Single cheap heuristic - always finishes well inside any turn budget
         action = None
         target = next((c for c in combatants if c.is_alive and c != character), None)
 
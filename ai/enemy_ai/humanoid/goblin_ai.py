@@ -1,31 +1,39 @@
 # File: ai/enemy_ai/humanoid/goblin_ai.py
 from ...intelligence_based_ai import IntelligenceBasedAI
+from ...group_blackboard import get_group_blackboard, PackTacticsMixin
+from ...parameters import get_ai_parameter
 from actions.base_actions import AttackAction
 import random
 
 
-class GoblinAI(IntelligenceBasedAI):
-    """Goblin AI - INT 10, but cowardly and erratic behavior."""
+class GoblinAI(PackTacticsMixin, IntelligenceBasedAI):
+    """Goblin AI - INT 10, but cowardly and erratic behavior. Coordinates through the pack blackboard."""
 
-    def basic_strategy(self, character, enemies, all_combatants):
+    # The panic check rolls every turn, so decisions can't be cached
+    cacheable = False
+
+    def basic_strategy(self, character, combatants):
         """Goblins are smart but cowardly - prone to panic."""
-        target = self.select_tactical_target(character, enemies)
+        blackboard = get_group_blackboard(character, combatants)
+        target = blackboard.choose_target(character)
         if not target:
             return self.default_action_set(character)
 
         # Check for cowardice
-        if self._should_panic(character, enemies):
+        if self._should_panic(character, blackboard):
             return self._panic_behavior(character, target)
 
         # Otherwise use simple tactics
-        return self.tactical_behavior(character, target, enemies)
+        return self.tactical_behavior(character, target, blackboard.enemies, blackboard)
 
-    def tactical_behavior(self, character, target, enemies):
+    def tactical_behavior(self, character, target, enemies, blackboard=None):
         """Simple goblin tactics - opportunistic and sneaky."""
-        distance = abs(character.position - target.position)
+        if blackboard is None:
+            combatants = getattr(character, 'current_combatants', [character] + list(enemies))
+            blackboard = get_group_blackboard(character, combatants)
 
         # Goblins prefer to attack when they have advantage
-        if self._has_tactical_advantage(character, target, enemies):
+        if self._has_tactical_advantage(character, target, blackboard):
             print(f"[GOBLIN TACTICS] Sees opportunity, attacking aggressively")
             return {
                 'action': AttackAction(character.equipped_weapon),
@@ -42,17 +50,20 @@ class GoblinAI(IntelligenceBasedAI):
                 'bonus_action_target': None
             }
 
-    def _should_panic(self, character, enemies):
+    def _should_panic(self, character, blackboard):
         """Check if goblin should panic based on situation."""
-        our_hp_percent = character.hp / character.max_hp
+        our_hp_percent = blackboard.hp_percent(character)
 
         # Panic if badly wounded
-        if our_hp_percent < 0.25:
-            return random.random() < 0.7  # 70% chance to panic when low HP
+        if our_hp_percent < get_ai_parameter('goblin.panic_hp'):
+            return random.random() < get_ai_parameter('goblin.panic_chance_wounded')  # 70% by default
+
+        # Panic if the pack is outnumbered
+        if blackboard.outnumbered:
+            return random.random() < get_ai_parameter('goblin.panic_chance_outnumbered')  # 25% by default
 
-        # Panic if outnumbered (in future multi-enemy scenarios)
-        # For now, just occasional random panic
-        return random.random() < 0.1  # 10% chance of random panic
+        # Otherwise, just occasional random panic
+        return random.random() < get_ai_parameter('goblin.panic_chance_random')  # 10% by default
 
     def _panic_behavior(self, character, target):
         """Panicked goblin behavior - still attacks but erratically."""
@@ -66,10 +77,13 @@ class GoblinAI(IntelligenceBasedAI):
             'bonus_action_target': None
         }
 
-    def _has_tactical_advantage(self, character, target, enemies):
-        """Simple check for tactical advantage."""
-        our_hp_percent = character.hp / character.max_hp
-        target_hp_percent = target.hp / target.max_hp
+    def _has_tactical_advantage(self, character, target, blackboard):
+        """Simple check for tactical advantage, using the pack's shared view of the fight."""
+        our_hp_percent = blackboard.hp_percent(character)
 
         # Feel brave if we're healthy and target is wounded
-        return our_hp_percent > 0.7 and target_hp_percent < 0.5
\ No newline at end of file
+        if our_hp_percent > get_ai_parameter('goblin.brave_hp') and target in blackboard.wounded_enemies:
+            return True
+
+        # Feel brave if the rest of the pack is already on the target
+        return blackboard.claims_on(target) > 1 and not blackboard.outnumbered
\ No newline at end of file
@@ -1,21 +1,23 @@
 # File: ai/enemy_ai/humanoid/hobgoblin_warrior_ai.py
 from ...intelligence_based_ai import IntelligenceBasedAI
+from ...group_blackboard import get_group_blackboard, PackTacticsMixin
 from actions.base_actions import AttackAction
 
 
-class HobgoblinWarriorAI(IntelligenceBasedAI):
-    """Hobgoblin Warrior AI - INT 10, basic military tactics."""
+class HobgoblinWarriorAI(PackTacticsMixin, IntelligenceBasedAI):
+    """Hobgoblin Warrior AI - INT 10, basic military tactics. Coordinates through the squad blackboard."""
 
-    def basic_strategy(self, character, enemies, all_combatants):
+    def basic_strategy(self, character, combatants):
         """Hobgoblin uses basic military tactics - range vs melee decisions."""
-        target = self.select_tactical_target(character, enemies)
+        blackboard = get_group_blackboard(character, combatants)
+        target = blackboard.choose_target(character)
         if not target:
             return self.default_action_set(character)
 
         distance = abs(character.position - target.position)
 
         # Strategic weapon choice based on range and tactical situation
-        action = self._choose_weapon_strategically(character, target, distance)
+        action = self._choose_weapon_strategically(character, target, distance, blackboard)
 
         return {
             'action': action,
@@ -36,11 +38,11 @@ class HobgoblinWarriorAI(IntelligenceBasedAI):
             'bonus_action_target': None
         }
 
-    def _choose_weapon_strategically(self, character, target, distance):
+    def _choose_weapon_strategically(self, character, target, distance, blackboard):
         """Strategic weapon choice considering multiple factors."""
         # Consider our health
-        our_hp_percent = character.hp / character.max_hp
-        target_hp_percent = target.hp / target.max_hp
+        our_hp_percent = blackboard.hp_percent(character)
+        target_hp_percent = blackboard.hp_percent(target)
 
         # If we're badly wounded, prefer ranged combat
         if our_hp_percent < 0.3 and character.secondary_weapon and distance > 5:
@@ -52,6 +54,11 @@ class HobgoblinWarriorAI(IntelligenceBasedAI):
             print(f"[HOBGOBLIN STRATEGY] Target wounded, closing for melee")
             return AttackAction(character.equipped_weapon)
 
+        # If the target shoots back and squadmates already hold it in melee, join them
+        if target in blackboard.ranged_threats and blackboard.claims_on(target) > 1 and distance > 5:
+            print(f"[HOBGOBLIN STRATEGY] Squad engaging ranged threat, closing for melee")
+            return AttackAction(character.equipped_weapon)
+
         # Default to tactical choice
         return self._choose_weapon_tactically(character, target, distance)
 
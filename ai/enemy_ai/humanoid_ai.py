@@ -5,7 +5,8 @@ from actions.base_actions import AttackAction
 class HobgoblinWarriorAI(AIBrain):
     """AI for the Hobgoblin Warrior to choose between melee and ranged attacks."""
 
-    def choose_actions(self, character, combatants):
+    def choose_actions(self, character, combatants, deadline=None):
+        # Single cheap heuristic - always finishes well inside any turn budget
         action = None
         target = next((c for c in combatants if c.is_alive and c != character), None)
 
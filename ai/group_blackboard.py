@@ -0,0 +1,156 @@
+# File: ai/group_blackboard.py
+"""
+Shared per-round blackboard for group monster AI.
+
+Battlefield facts the member AIs read (living members and enemies, wounded
+enemies, ranged threats, the focus target) are computed once per round per
+faction, instead of each creature rescanning the battlefield.
+The blackboard also tracks target claims so a pack can focus fire without
+every member rushing the same target.
+"""
+
+import math
+
+
+# How many pack members may pile onto the focus target before the rest spread out
+FOCUS_FIRE_LIMIT = 3
+
+
+def get_faction(creature):
+    """Return the faction a creature fights for (party members vs monsters)."""
+    return getattr(creature, 'faction', 'party')
+
+
+def is_ranged_threat(creature):
+    """A creature is a ranged threat if any of its weapons has the Ranged property."""
+    for weapon in (getattr(creature, 'equipped_weapon', None), getattr(creature, 'secondary_weapon', None)):
+        if weapon is not None and 'Ranged' in getattr(weapon, 'properties', []):
+            return True
+    return False
+
+
+class GroupBlackboard:
+    """Battlefield facts for one faction, computed once per round."""
+
+    def __init__(self, faction, round_number, combatants):
+        self.faction = faction
+        self.round_number = round_number
+        self.combatants = combatants
+
+        living = [c for c in combatants if c.is_alive]
+        self.members = [c for c in living if get_faction(c) == faction]
+        self.enemies = [c for c in living if get_faction(c) != faction]
+
+        self.wounded_enemies = [e for e in self.enemies if e.hp < e.max_hp * 0.5]
+        self.ranged_threats = [e for e in self.enemies if is_ranged_threat(e)]
+
+        # Focus target: the most wounded enemy, the one the pack should finish first
+        self.focus_target = min(self.enemies, key=lambda e: e.hp / e.max_hp) if self.enemies else None
+
+        # id(target) -> number of members that have committed to it this round
+        self.target_claims = {}
+        # id(member) -> target chosen this round, so repeated lookups are stable
+        self.assignments = {}
+
+    @property
+    def outnumbered(self):
+        """True when living enemies outnumber living pack members."""
+        return len(self.enemies) > len(self.members)
+
+    def hp_percent(self, creature):
+        """Current HP as a fraction of maximum."""
+        return creature.hp / creature.max_hp
+
+    def living_enemies(self):
+        """Enemies still alive (deaths during the round are filtered lazily)."""
+        return [e for e in self.enemies if e.is_alive]
+
+    def claims_on(self, target):
+        """Number of members committed to a target this round."""
+        return self.target_claims.get(id(target), 0)
+
+    def claim_target(self, member, target):
+        """Record that a member is attacking a target this round."""
+        previous = self.assignments.get(id(member))
+        if previous is not None and previous is not target:
+            self.target_claims[id(previous)] -= 1
+        if previous is not target:
+            self.target_claims[id(target)] = self.claims_on(target) + 1
+        self.assignments[id(member)] = target
+        return target
+
+    def choose_target(self, member):
+        """
+        Pick a target for a pack member: focus fire on the most wounded enemy
+        until FOCUS_FIRE_LIMIT members are committed, then spread out to the
+        least contested, closest enemy.
+        """
+        assigned = self.assignments.get(id(member))
+        if assigned is not None and assigned.is_alive:
+            return assigned
+
+        enemies = self.living_enemies()
+        if not enemies:
+            return None
+
+        focus = self.focus_target
+        if focus is not None and focus.is_alive and self.claims_on(focus) < self._focus_limit(enemies):
+            return self.claim_target(member, focus)
+
+        target = min(enemies, key=lambda e: (self.claims_on(e), abs(member.position - e.position)))
+        return self.claim_target(member, target)
+
+    def _focus_limit(self, enemies):
+        """Spread the pack evenly when there are more members than the focus limit."""
+        if len(enemies) <= 1:
+            return len(self.members)
+        return max(1, min(FOCUS_FIRE_LIMIT, math.ceil(len(self.members) / len(enemies))))
+
+
+# Latest blackboard per faction; rebuilt when the round or the fight changes
+_BLACKBOARDS = {}
+
+
+def get_group_blackboard(character, combatants):
+    """
+    Return the blackboard for the character's faction this round, building it
+    only on the first lookup of the round.
+    """
+    faction = get_faction(character)
+    round_number = getattr(character, 'current_round', 0)
+
+    blackboard = _BLACKBOARDS.get(faction)
+    if (blackboard is None or blackboard.combatants is not combatants
+            or blackboard.round_number != round_number):
+        blackboard = GroupBlackboard(faction, round_number, combatants)
+        _BLACKBOARDS[faction] = blackboard
+    return blackboard
+
+
+def clear_group_blackboards():
+    """Drop all cached blackboards (e.g. between independent fights)."""
+    _BLACKBOARDS.clear()
+
+
+class PackTacticsMixin:
+    """
+    Decision cache hooks for AIs that pick targets through the blackboard:
+    the pack's claims are part of the cache key, and a cached decision
+    still registers its claim so the rest of the pack sees it.
+    """
+
+    def decision_key_extras(self, character, combatants, ranked_enemies):
+        blackboard = get_group_blackboard(character, combatants)
+        focus = blackboard.focus_target
+        assigned = blackboard.assignments.get(id(character))
+        return (
+            tuple(blackboard.claims_on(e) for e in ranked_enemies),
+            ranked_enemies.index(focus) if focus in ranked_enemies else -1,
+            ranked_enemies.index(assigned) if assigned in ranked_enemies else -1,
+            len(blackboard.members),
+        )
+
+    def on_cached_decision(self, character, combatants, decision):
+        target = decision.get('action_target')
+        if target is not None and target is not character:
+            get_group_blackboard(character, combatants).claim_target(character, target)
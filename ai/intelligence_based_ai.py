@@ -1,5 +1,7 @@
 # File: ai/intelligence_based_ai.py
 from .base_ai import AIBrain
+from .group_blackboard import get_faction
+from .decision_cache import make_state_key, get_default_decision_cache
 from actions.base_actions import AttackAction
 from actions.special_actions import MultiattackAction
 import random
@@ -8,22 +10,78 @@ import random
 class IntelligenceBasedAI(AIBrain):
     """Base class that adapts AI behavior based on creature intelligence."""
 
-    def __init__(self):
+    # False for AIs whose decisions roll dice: a cached decision would replay one roll's outcome
+    cacheable = True
+
+    def __init__(self, decision_cache=None):
         super().__init__()
         self.intelligence_tier = None
+        # Opt-in memoization of tier decisions (see ai/decision_cache.py)
+        self.decision_cache = decision_cache
+
+    def choose_actions(self, character, combatants, deadline=None):
+        """Route to appropriate intelligence tier; under a deadline, fall back to attacking the closest enemy."""
+        if deadline is not None:
+            return self.refine_until_deadline(character, combatants, deadline,
+                                              [self.heuristic_actions, self.tier_actions])
+        return self.tier_actions(character, combatants)
+
+    def heuristic_actions(self, character, combatants):
+        """Cheapest decision: attack the closest enemy with the equipped weapon."""
+        target = self.get_closest_enemy(character, combatants)
+        if not target:
+            return self.default_action_set(character)
+        return {
+            'action': AttackAction(character.equipped_weapon),
+            'bonus_action': None,
+            'action_target': target,
+            'bonus_action_target': None
+        }
+
+    def tier_actions(self, character, combatants):
+        """Full decision from the creature's intelligence tier, reusing a cached decision when enabled."""
+        tier = self.get_intelligence_tier(character)
+
+        cache = self.decision_cache if self.decision_cache is not None else get_default_decision_cache()
+        if cache is None or tier == 'complex_planning' or not self.cacheable:
+            return getattr(self, tier)(character, combatants)
+
+        key, ranked_enemies = make_state_key(tier, character, self.get_enemies(character, combatants))
+        key += self.decision_key_extras(character, combatants, ranked_enemies)
+
+        decision = cache.lookup(key, character, ranked_enemies)
+        if decision is not None:
+            self.on_cached_decision(character, combatants, decision)
+            return decision
 
-    def choose_actions(self, character, combatants):
-        """Route to appropriate intelligence tier."""
+        attributes_before = dict(vars(character))
+        decision = getattr(self, tier)(character, combatants)
+        cache.store(key, decision, character, ranked_enemies, attributes_before)
+        return decision
+
+    def get_intelligence_tier(self, character):
+        """Name of the tier method that handles this creature's intelligence (intelligence_tier overrides)."""
+        if self.intelligence_tier is not None:
+            return self.intelligence_tier
         intelligence = character.stats.get('int', 10)
 
         if intelligence <= 3:
-            return self.bestial_instinct(character, combatants)
+            return 'bestial_instinct'
         elif intelligence <= 7:
-            return self.simple_tactics(character, combatants)
+            return 'simple_tactics'
         elif intelligence <= 12:
-            return self.basic_strategy(character, combatants)
+            return 'basic_strategy'
         else:
-            return self.complex_planning(character, combatants)
+            return 'complex_planning'
+
+    # Decision cache hooks for AIs whose choice depends on more than the creature's own view
+    def decision_key_extras(self, character, combatants, ranked_enemies):
+        """Extra state (as a tuple) that the cached decision must match on."""
+        return ()
+
+    def on_cached_decision(self, character, combatants, decision):
+        """Replay side effects of a decision served from the cache."""
+        pass
 
     def bestial_instinct(self, character, combatants):
         """INT 1-3: Pure animal instinct - attack closest, constrict when possible."""
@@ -38,7 +96,7 @@ class IntelligenceBasedAI(AIBrain):
 
     def simple_tactics(self, character, combatants):
         """INT 4-7: Basic tactical awareness - positioning, target selection."""
-        enemies = [c for c in combatants if c.is_alive and c != character]
+        enemies = self.get_enemies(character, combatants)
         if not enemies:
             return self.default_action_set(character)
 
@@ -50,7 +108,7 @@ class IntelligenceBasedAI(AIBrain):
 
     def basic_strategy(self, character, combatants):
         """INT 8-12: Strategic thinking - considers outcomes, team coordination."""
-        enemies = [c for c in combatants if c.is_alive and c != character]
+        enemies = self.get_enemies(character, combatants)
         if not enemies:
             return self.default_action_set(character)
 
@@ -61,7 +119,7 @@ class IntelligenceBasedAI(AIBrain):
 
     def complex_planning(self, character, combatants):
         """INT 13+: Advanced planning - predicts opponent moves, complex tactics."""
-        enemies = [c for c in combatants if c.is_alive and c != character]
+        enemies = self.get_enemies(character, combatants)
         if not enemies:
             return self.default_action_set(character)
 
@@ -94,9 +152,14 @@ class IntelligenceBasedAI(AIBrain):
         return self.strategic_behavior(character, enemies, all_combatants)
 
     # Utility methods
+    def get_enemies(self, character, combatants):
+        """Living combatants fighting for a different faction."""
+        faction = get_faction(character)
+        return [c for c in combatants if c.is_alive and get_faction(c) != faction]
+
     def get_closest_enemy(self, character, combatants):
         """Find the closest living enemy."""
-        enemies = [c for c in combatants if c.is_alive and c != character]
+        enemies = self.get_enemies(character, combatants)
         if not enemies:
             return None
 
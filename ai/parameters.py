@@ -0,0 +1,128 @@
+# File: ai/parameters.py
+"""
+Tunable AI parameters.
+
+The thresholds the AIs branch on (healing and retreat HP fractions, panic
+chances, range priority weights) live here as one flat parameter vector,
+keyed by "<ai>.<name>". Defaults are the hand-picked values the AIs shipped
+with; a tuned parameter file (written by systems.simulation.tuning) is
+loaded at startup and overrides them.
+"""
+
+import json
+import os
+
+
+DEFAULT_AI_PARAMETERS = {
+    # PaladinAIBrain - survival, healing and retreat thresholds (fractions of max HP)
+    'paladin.emergency_hp': 0.15,
+    'paladin.critical_hp': 0.25,
+    'paladin.critical_heal_hp': 0.35,
+    'paladin.moderate_heal_hp': 0.65,
+    'paladin.grappled_critical_heal_hp': 0.40,
+    'paladin.grappled_moderate_heal_hp': 0.70,
+    'paladin.conserve_slot_hp': 0.40,
+    'paladin.conserve_low_slots_hp': 0.60,
+    'paladin.retreat_hp': 0.40,
+
+    # GoblinAI - cowardice
+    'goblin.panic_hp': 0.25,
+    'goblin.panic_chance_wounded': 0.7,
+    'goblin.panic_chance_outnumbered': 0.25,
+    'goblin.panic_chance_random': 0.1,
+    'goblin.brave_hp': 0.7,
+
+    # GiantOctopusAI - how close a target must be before trying to grapple
+    'octopus.grapple_reach': 10,
+
+    # RangeManager - tactical option priorities
+    'range.multiattack_base': 40.0,
+    'range.multiattack_in_range': 15.0,
+    'range.multiattack_reachable': 10.0,
+    'range.multiattack_unreachable': -20.0,
+    'range.multiattack_grappler': 10.0,
+    'range.weapon_unreachable': -50.0,
+}
+
+# Search bounds (low, high) for every tunable parameter
+PARAMETER_BOUNDS = {
+    'paladin.emergency_hp': (0.05, 0.30),
+    'paladin.critical_hp': (0.10, 0.45),
+    'paladin.critical_heal_hp': (0.15, 0.60),
+    'paladin.moderate_heal_hp': (0.40, 0.90),
+    'paladin.grappled_critical_heal_hp': (0.15, 0.65),
+    'paladin.grappled_moderate_heal_hp': (0.40, 0.95),
+    'paladin.conserve_slot_hp': (0.15, 0.65),
+    'paladin.conserve_low_slots_hp': (0.30, 0.90),
+    'paladin.retreat_hp': (0.10, 0.70),
+
+    'goblin.panic_hp': (0.05, 0.50),
+    'goblin.panic_chance_wounded': (0.0, 1.0),
+    'goblin.panic_chance_outnumbered': (0.0, 1.0),
+    'goblin.panic_chance_random': (0.0, 0.5),
+    'goblin.brave_hp': (0.3, 1.0),
+
+    'octopus.grapple_reach': (5, 30),
+
+    'range.multiattack_base': (0.0, 80.0),
+    'range.multiattack_in_range': (0.0, 40.0),
+    'range.multiattack_reachable': (0.0, 30.0),
+    'range.multiattack_unreachable': (-60.0, 0.0),
+    'range.multiattack_grappler': (0.0, 30.0),
+    'range.weapon_unreachable': (-100.0, 0.0),
+}
+
+# Where the tuner writes its winning parameters and where they are loaded from
+TUNED_PARAMETERS_FILE = os.environ.get(
+    'D_SYSTEM_AI_PARAMETERS',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tuned_parameters.json')
+)
+
+AI_PARAMETERS = dict(DEFAULT_AI_PARAMETERS)
+
+
+def get_ai_parameter(name):
+    """Current value of a tunable AI parameter."""
+    return AI_PARAMETERS[name]
+
+
+def apply_ai_parameters(parameters):
+    """Override some or all parameters; unknown names are rejected."""
+    unknown = set(parameters) - set(DEFAULT_AI_PARAMETERS)
+    if unknown:
+        raise KeyError(f"Unknown AI parameters: {sorted(unknown)}")
+    AI_PARAMETERS.update(parameters)
+
+
+def reset_ai_parameters():
+    """Restore the shipped defaults."""
+    AI_PARAMETERS.clear()
+    AI_PARAMETERS.update(DEFAULT_AI_PARAMETERS)
+
+
+def parameter_names(prefix=''):
+    """Names of the tunable parameters, optionally limited to one AI (e.g. 'goblin.')."""
+    return sorted(name for name in DEFAULT_AI_PARAMETERS if name.startswith(prefix))
+
+
+def save_ai_parameters(parameters, path=TUNED_PARAMETERS_FILE):
+    """Write a parameter file the AIs load at startup."""
+    with open(path, 'w') as f:
+        json.dump(dict(sorted(parameters.items())), f, indent=2)
+    return path
+
+
+def load_ai_parameters(path=TUNED_PARAMETERS_FILE):
+    """Apply a parameter file if it exists; returns True when one was loaded."""
+    if not os.path.exists(path):
+        return False
+    with open(path) as f:
+        parameters = json.load(f)
+    stale = sorted(set(parameters) - set(DEFAULT_AI_PARAMETERS))
+    if stale:
+        print(f"[AI PARAMETERS] Ignoring unknown parameters in {path}: {stale}")
+    apply_ai_parameters({k: v for k, v in parameters.items() if k in DEFAULT_AI_PARAMETERS})
+    return True
+
+
+load_ai_parameters()
@@ -0,0 +1,127 @@
+# File: ai/turn_budget.py
+"""
+Per-turn compute budget for AI decisions.
+
+Brains decide in stages, from a cheap heuristic to a full analysis. Each
+turn runs the deepest stage expected to finish within the time left (from a
+running average of how long each stage has taken) and falls back to the
+heuristic only when none fits, so a budget trades depth for time instead of
+adding the heuristic's cost to every turn. A global budget applies to every
+turn when set; overruns and truncated decisions are counted in
+TURN_BUDGET_STATS.
+"""
+
+import time
+
+
+class Deadline:
+    """A point in time by which a decision should be ready."""
+
+    def __init__(self, budget_seconds):
+        self.budget = budget_seconds
+        self.started_at = time.perf_counter()
+        self.expires_at = self.started_at + budget_seconds
+
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+
+    def remaining(self):
+        return self.expires_at - time.perf_counter()
+
+    def expired(self):
+        return time.perf_counter() >= self.expires_at
+
+
+class TurnBudgetStats:
+    """Instrumentation counters for deadline-aware decisions."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.decisions = 0
+        self.overruns = 0
+        self.truncated = 0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self.worst_overrun = 0.0
+        self.overruns_by_brain = {}
+
+    def record(self, brain_name, deadline, stages_completed, stages_total):
+        """Record one decision; returns True if it overran its budget."""
+        latency = deadline.elapsed()
+        self.decisions += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if stages_completed < stages_total:
+            self.truncated += 1
+
+        overrun = latency - deadline.budget
+        if overrun <= 0:
+            return False
+        self.overruns += 1
+        self.worst_overrun = max(self.worst_overrun, overrun)
+        self.overruns_by_brain[brain_name] = self.overruns_by_brain.get(brain_name, 0) + 1
+        return True
+
+    def as_dict(self):
+        return {
+            'decisions': self.decisions,
+            'overruns': self.overruns,
+            'truncated': self.truncated,
+            'max_latency': self.max_latency,
+            'mean_latency': self.total_latency / self.decisions if self.decisions else 0.0,
+            'worst_overrun': self.worst_overrun,
+            'overruns_by_brain': dict(self.overruns_by_brain),
+        }
+
+
+TURN_BUDGET_STATS = TurnBudgetStats()
+
+
+class StageCosts:
+    """Running average of how long each brain's decision stages take."""
+
+    SMOOTHING = 0.2
+
+    def __init__(self):
+        self.seconds = {}
+
+    def expected(self, brain_name, stage):
+        """Expected duration of stage; 0 until it has been timed, so every stage gets tried."""
+        return self.seconds.get((brain_name, stage.__name__), 0.0)
+
+    def observe(self, brain_name, stage, seconds):
+        key = (brain_name, stage.__name__)
+        previous = self.seconds.get(key)
+        self.seconds[key] = seconds if previous is None else previous + self.SMOOTHING * (seconds - previous)
+
+
+STAGE_COSTS = StageCosts()
+
+# Global per-turn budget in seconds (None = unbounded, decide fully every turn)
+_turn_budget = None
+
+
+def set_turn_budget(seconds):
+    """Set the global per-turn compute budget (None disables it)."""
+    global _turn_budget
+    _turn_budget = seconds
+
+
+def get_turn_budget():
+    return _turn_budget
+
+
+def start_turn_deadline():
+    """Deadline for the turn that is starting now, or None without a global budget."""
+    if _turn_budget is None:
+        return None
+    return Deadline(_turn_budget)
+
+
+def as_deadline(deadline):
+    """Accept a Deadline or a budget in seconds counted from now."""
+    if deadline is None or isinstance(deadline, Deadline):
+        return deadline
+    return Deadline(deadline)
@@ -2,12 +2,25 @@ from core import roll_d20, roll, get_ability_modifier, XP_FOR_NEXT_LEVEL, XP_FRO
 from actions import AttackAction, DodgeAction, OpportunityAttack, CastSpellAction
 from actions.unarmed_strike_actions import create_unarmed_damage_action, create_unarmed_grapple_action
 from ai.base_ai import AIBrain
+from systems.combat.event_log import log_event, attack_outcome, damage_type_of
+import copy
 import math
+import weakref
+
+
+# Per-prototype cache of what Character.spawn copies
+_spawn_plans = weakref.WeakKeyDictionary()
 
 
 class Character:
     """Represents a generic character or monster in the D&D simulation."""
 
+    # Fixed when the creature is built and never changed in a fight, so spawn() shares them with clones
+    SHARED_ATTRIBUTES = frozenset({
+        'stats', 'equipped_weapon', 'secondary_weapon', 'equipped_armor', 'equipped_shield',
+        'skill_proficiencies', 'save_proficiencies', 'weapon_proficiencies', 'traits', 'grapple_profile'
+    })
+
     def __init__(self, name, level, hp, stats, weapon, armor=None, shield=None,
                  skill_proficiencies=None, save_proficiencies=None,
                  weapon_proficiencies=None, position=0, speed=30,
@@ -38,6 +51,7 @@ class Character:
         self.xp_for_next_level = XP_FOR_NEXT_LEVEL.get(level, float('inf'))
 
         self.ai_brain = AIBrain()
+        self.faction = "party"
 
         self.initiative_bonus = initiative_bonus
         self.has_advantage = False
@@ -61,6 +75,7 @@ class Character:
         self.spellcasting_ability_name = "None"
         self.active_smites = []
         self.is_grappled = False
+        self.damage_dealt = {}  # Damage dealt this fight, by source (weapon, smite, constrict...)
 
     def calculate_ac(self):
         ac = 10 + get_ability_modifier(self.stats['dex'])
@@ -76,11 +91,67 @@ class Character:
             ac += self.equipped_shield.ac_bonus
         return ac
 
+    def spawn(self, name=None, position=None):
+        """
+        A fresh copy of this creature, using it as a prototype: much cheaper
+        than running __init__ again. SHARED_ATTRIBUTES and other objects
+        (weapons, spells, oaths) are shared with the prototype; lists, dicts
+        and sets (HP bookkeeping, spell slots, effects, action lists) are
+        copied, and actions bound to the prototype are rebound to the clone.
+        Spawn from a creature that hasn't fought yet, and don't change it
+        after its first spawn.
+        """
+        plan = _spawn_plans.get(self)
+        if plan is None:
+            plan = _spawn_plans[self] = self._spawn_plan()
+        lists, containers = plan
+
+        clone = object.__new__(type(self))
+        state = self.__dict__.copy()
+        for attribute, bound in lists:
+            items = state[attribute] = state[attribute][:]
+            for index in bound:
+                items[index] = self._rebind(items[index], clone)
+        for attribute in containers:
+            state[attribute] = state[attribute].copy()
+        brain = state['ai_brain'] = object.__new__(type(self.ai_brain))
+        brain.__dict__.update(self.ai_brain.__dict__)
+        if name is not None:
+            state['name'] = name
+        if position is not None:
+            state['position'] = position
+        clone.__dict__ = state
+        return clone
+
+    def _spawn_plan(self):
+        """What spawn() must copy: (list attribute, indices of items bound to self) pairs and other containers."""
+        lists, containers = [], []
+        for attribute, value in self.__dict__.items():
+            if attribute in self.SHARED_ATTRIBUTES:
+                continue
+            if isinstance(value, list):
+                lists.append((attribute, [index for index, item in enumerate(value)
+                                          if any(v is self for v in getattr(item, '__dict__', {}).values())]))
+            elif isinstance(value, (dict, set)):
+                containers.append(attribute)
+        return lists, containers
+
+    def _rebind(self, item, clone):
+        """A copy of item pointing at clone instead of this creature."""
+        rebound = copy.copy(item)
+        for attribute, value in vars(item).items():
+            if value is self:
+                setattr(rebound, attribute, clone)
+            elif value is item:
+                setattr(rebound, attribute, rebound)
+        return rebound
+
     def roll_initiative(self):
-        roll_val, _ = roll_d20()
+        roll_val, _ = roll_d20(purpose='initiative')
         dex_modifier = get_ability_modifier(self.stats['dex'])
         total_initiative = roll_val + dex_modifier + self.initiative_bonus
         self.initiative = total_initiative
+        log_event('initiative', self.name, roll_val, total_initiative)
         log_message = f"{self.name} rolls for initiative: {roll_val} (1d20) +{dex_modifier} (DEX)"
         if self.initiative_bonus > 0:
             log_message += f" +{self.initiative_bonus} (Bonus)"
@@ -116,7 +187,10 @@ class Character:
         # FIXED: Store combatants reference for grapple system
         self.current_combatants = combatants
         
-        chosen_actions = self.ai_brain.choose_actions(self, combatants)
+        from ai.turn_budget import start_turn_deadline
+        from ai.decision_log import record_decision
+        chosen_actions = self.ai_brain.choose_actions(self, combatants, deadline=start_turn_deadline())
+        record_decision(self, chosen_actions)
 
         defender = chosen_actions.get('action_target') or next((c for c in combatants if c.is_alive and c != self), None)
 
@@ -265,6 +339,8 @@ class Character:
         total_attack = attack_roll + attack_modifier + prof_bonus
         print(
             f"ATTACK ROLL: {attack_roll} (1d20{advantage_text}) +{attack_modifier} ({attack_modifier_ability.upper()}) +{prof_bonus} (Prof) = {total_attack}")
+        log_event('attack', self.name, target.name, attack_roll, total_attack, target.ac,
+                  attack_outcome(total_attack >= target.ac or attack_roll == 20, attack_roll == 20))
 
         if total_attack >= target.ac or attack_roll == 20:
             is_crit = (attack_roll == 20)
@@ -343,7 +419,7 @@ class Character:
             damage_log += f" +{get_ability_modifier(self.stats[attack_modifier_ability])} ({attack_modifier_ability.upper()})"
 
             print(f"{self.name} deals a total of {total_damage} damage. ({damage_log})")
-            target.take_damage(total_damage, attacker=self)
+            target.take_damage(total_damage, attacker=self, source='Weapon')
         else:
             print("The attack misses.")
 
@@ -386,9 +462,22 @@ class Character:
         if self.xp >= self.xp_for_next_level:
             print(f"** {self.name} has enough experience to level up! **")
 
-    def take_damage(self, damage, attacker=None):
+    def record_damage_dealt(self, source, amount):
+        """Add to this creature's damage ledger; source may be a name or a {name: amount} breakdown."""
+        if isinstance(source, dict):
+            for name, part in source.items():
+                self.record_damage_dealt(name, part)
+            return
+        source = source or 'Other'
+        self.damage_dealt[source] = self.damage_dealt.get(source, 0) + amount
+
+    def take_damage(self, damage, attacker=None, source=None):
+        if attacker is not None and hasattr(attacker, 'record_damage_dealt'):
+            attacker.record_damage_dealt(source, damage)
         self.hp -= damage
         print(f"{self.name} takes {damage} damage and has {self.hp}/{self.max_hp} HP remaining.")
+        log_event('damage', self.name, getattr(attacker, 'name', None), source, damage_type_of(attacker, source),
+                  damage, max(self.hp, 0))
 
         if self.concentrating_on:
             save_dc = max(10, damage // 2)
@@ -402,6 +491,7 @@ class Character:
             self.hp = 0
             self.is_alive = False
             print(f"{self.name} has been defeated!")
+            log_event('death', self.name, getattr(attacker, 'name', None))
             if attacker:
                 attacker.gain_xp(self.xp_value)
 
@@ -420,7 +510,7 @@ class Character:
 
     def make_saving_throw(self, ability, dc):
         print(f"--- {self.name} must make a DC {dc} {ability.upper()} saving throw! ---")
-        roll_val, _ = roll_d20()
+        roll_val, _ = roll_d20(purpose='save')
         modifier = get_ability_modifier(self.stats[ability])
         total = roll_val + modifier
         log = f"Save: {roll_val} (1d20) +{modifier} ({ability.upper()})"
@@ -430,6 +520,7 @@ class Character:
             log += f" +{prof_bonus} (Proficiency)"
         log += f" = {total}"
         print(log)
+        log_event('save', self.name, ability, roll_val, total, dc, total >= dc)
         if total >= dc:
             print("Save successful!")
             return True
@@ -477,7 +568,7 @@ class Character:
             prof_text = ""
 
         # Make the escape attempt (NO disadvantage in PHB 2024)
-        escape_roll, _ = roll_d20()
+        escape_roll, _ = roll_d20(purpose='check')
         my_total = escape_roll + my_modifier
 
         # PHB 2024: Escape DC = 8 + grappler's STR mod + grappler's prof bonus
@@ -1,5 +1,6 @@
 # File: characters/paladin.py
 from core import roll_d20, roll, get_ability_modifier
+from systems.combat.event_log import log_event, attack_outcome
 from .base_character import Character
 from spells.level_1.searing_smite import searing_smite
 from spells.level_1.cure_wounds import cure_wounds
@@ -14,6 +15,8 @@ from systems.paladin.channel_divinity import PaladinChannelDivinityMixin
 class Paladin(Character, PaladinChannelDivinityMixin):
     """A Paladin class with spellcasting, advanced healing abilities, and Channel Divinity."""
 
+    SHARED_ATTRIBUTES = Character.SHARED_ATTRIBUTES | {'prepared_spells', 'oath_spells', 'channel_divinity_options'}
+
     def __init__(self, name, level, hp, stats, weapon, armor=None, shield=None, oath=None, position=0, xp=0):
         save_proficiencies = ['Wisdom', 'Charisma']
         skill_proficiencies = ['Athletics', 'Persuasion']
@@ -145,6 +148,8 @@ class Paladin(Character, PaladinChannelDivinityMixin):
 
         # Cast Divine Smite normally
         success = divine_smite.cast(self, target, spell_level, is_crit)
+        if success:
+            log_event('spell', self.name, divine_smite.name, target.name, spell_level)
 
         if success and self.channel_divinity_uses > 0:
             # Check if we have Inspiring Smite available
@@ -257,7 +262,7 @@ class Paladin(Character, PaladinChannelDivinityMixin):
             prof_text = ""
 
         # Make the escape attempt
-        escape_roll, _ = roll_d20()
+        escape_roll, _ = roll_d20(purpose='check')
         my_total = escape_roll + my_modifier
 
         # PHB 2024: Escape DC = 8 + grappler's STR mod + grappler's prof bonus
@@ -319,6 +324,7 @@ class Paladin(Character, PaladinChannelDivinityMixin):
     def cast_spell(self, spell, target=None, action_type="ACTION"):
         if spell not in self.prepared_spells:
             return False
+        log_event('spell', self.name, spell.name, getattr(target, 'name', None), spell.level)
         return spell.cast(self, target)
 
     def attack(self, target, action_type="ACTION", weapon=None, extra_damage_dice=None, allow_divine_smite=None):
@@ -378,6 +384,8 @@ class Paladin(Character, PaladinChannelDivinityMixin):
         total_attack = attack_roll + attack_modifier + prof_bonus
         print(
             f"ATTACK ROLL: {attack_roll} (1d20{advantage_text}) +{attack_modifier} (STR) +{prof_bonus} (Prof) = {total_attack}")
+        log_event('attack', self.name, target.name, attack_roll, total_attack, target.ac,
+                  attack_outcome(total_attack >= target.ac or attack_roll == 20, attack_roll == 20))
 
         # Check if attack hits
         if total_attack >= target.ac or attack_roll == 20:
@@ -390,6 +398,7 @@ class Paladin(Character, PaladinChannelDivinityMixin):
             # Calculate base weapon damage
             damage_breakdown_parts = []
             total_damage = 0
+            spell_damage = {}  # Smite damage by spell, for the damage ledger
 
             from core import roll
             weapon_damage = roll(weapon_to_use.damage_dice)
@@ -428,6 +437,7 @@ class Paladin(Character, PaladinChannelDivinityMixin):
                     # Use Searing Smite immediately after the hit
                     self.spell_slots[1] -= 1
                     print(f"** {self.name} casts Searing Smite immediately after the hit! ({self.spell_slots[1]} level 1 slots remaining) **")
+                    log_event('spell', self.name, 'Searing Smite', target.name, 1)
                     
                     # Apply Searing Smite damage
                     searing_damage = roll('1d6')
@@ -439,6 +449,7 @@ class Paladin(Character, PaladinChannelDivinityMixin):
                         damage_breakdown_parts.append(f"{searing_damage} [1d6 Searing Smite]")
 
                     total_damage += searing_damage
+                    spell_damage['Searing Smite'] = searing_damage
                     searing_smite_used = True
                     
                     # Set up ongoing effect
@@ -479,6 +490,7 @@ class Paladin(Character, PaladinChannelDivinityMixin):
                     self.spell_slots[smite_level] -= 1
                     print(
                         f"** {self.name} casts Divine Smite using a level {smite_level} spell slot! ({self.spell_slots[smite_level]} remaining) **")
+                    log_event('spell', self.name, 'Divine Smite', target.name, smite_level)
 
                     base_dice = 2
                     bonus_dice = smite_level - 1
@@ -499,6 +511,7 @@ class Paladin(Character, PaladinChannelDivinityMixin):
                         damage_breakdown_parts.append(f"{smite_damage} [{total_smite_dice}d8 Divine Smite]")
 
                     total_damage += smite_damage
+                    spell_damage['Divine Smite'] = smite_damage
 
             # Ability modifier (not doubled on crit)
             ability_modifier = self.get_damage_modifier()
@@ -508,7 +521,8 @@ class Paladin(Character, PaladinChannelDivinityMixin):
             # Apply all damage
             damage_log = " + ".join(damage_breakdown_parts)
             print(f"{self.name} deals a total of {total_damage} damage. ({damage_log})")
-            target.take_damage(total_damage, attacker=self)
+            damage_sources = dict(spell_damage, Weapon=total_damage - sum(spell_damage.values()))
+            target.take_damage(total_damage, attacker=self, source=damage_sources)
             
         else:
             print("The attack misses.")
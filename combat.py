@@ -1,8 +1,114 @@
-from range_manager import initialize_combat_with_ranges
-
+import asyncio
 
-def combat_simulation(combatants):
-    """Simulates combat between a list of characters until one side is defeated."""
+from range_manager import initialize_combat_with_ranges
+from ai.group_blackboard import get_faction
+from core import set_acting_faction
+from systems.combat.event_log import (event_log_active, set_event_round, creature_state, log_state_changes,
+                                     EventSink, use_event_sink)
+
+
+def count_active_sides(combatants):
+    """Number of factions that still have a living combatant."""
+    return len({get_faction(c) for c in combatants if c.is_alive})
+
+
+def hp_by_faction(combatants):
+    """Total HP left on each side."""
+    totals = {}
+    for c in combatants:
+        totals[get_faction(c)] = totals.get(get_faction(c), 0) + c.hp
+    return totals
+
+
+def fallen_by_faction(combatants):
+    """Number of combatants each side has lost."""
+    totals = {}
+    for c in combatants:
+        totals[get_faction(c)] = totals.get(get_faction(c), 0) + (0 if c.is_alive else 1)
+    return totals
+
+
+def resource_snapshot(combatants):
+    """Spell slots and Lay on Hands points each side has left."""
+    totals = {}
+    for c in combatants:
+        side = totals.setdefault(get_faction(c), {'spell_slots': 0, 'lay_on_hands': 0})
+        side['spell_slots'] += sum(getattr(c, 'spell_slots', {}).values())
+        side['lay_on_hands'] += getattr(c, 'lay_on_hands_pool', 0)
+    return totals
+
+
+def damage_by_source(combatants):
+    """Damage each side dealt this fight, broken down by source."""
+    totals = {}
+    for c in combatants:
+        side = totals.setdefault(get_faction(c), {})
+        for source, amount in getattr(c, 'damage_dealt', {}).items():
+            side[source] = side.get(source, 0) + amount
+    return totals
+
+
+class CombatControl:
+    """
+    Lets a client stop a streamed fight early, or (in async_iter_combat)
+    pause it between turns. The fight checks it before every turn.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self.paused = False
+        self._resumed = None
+
+    def cancel(self):
+        self.cancelled = True
+        self.resume()
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+        if self._resumed is not None:
+            self._resumed.set()
+
+    async def wait_while_paused(self):
+        while self.paused and not self.cancelled:
+            self._resumed = asyncio.Event()
+            await self._resumed.wait()
+
+
+def iter_combat(combatants, max_rounds=None, control=None):
+    """
+    Run a fight step by step, yielding a structured event dict as it goes:
+    'start' (initiative order), 'round', 'turn' (the turn's attack, damage,
+    save, move, condition, grapple, spell and death events - see
+    systems.combat.event_log - and everyone's HP afterwards) and finally
+    'end' with the summary combat_simulation returns. The fight only
+    advances while the caller asks for the next event; closing the
+    generator or cancelling control stops it before the next turn.
+    """
+    # The fight's sink is installed only while the fight itself runs, never across a yield
+    sink = EventSink()
+    steps = _run_combat(combatants, max_rounds, control, sink)
+    try:
+        while True:
+            with use_event_sink(sink):
+                try:
+                    event = next(steps)
+                except StopIteration:
+                    return
+            yield event
+    finally:
+        with use_event_sink(sink):
+            steps.close()
+        set_acting_faction(None)
+
+
+def _take_events(sink):
+    return sink.take() if sink is not None else []
+
+
+def _run_combat(combatants, max_rounds, control, sink):
     print()
     print("===== COMBAT BEGINS =====")
     print()
@@ -10,55 +116,134 @@ def combat_simulation(combatants):
     # NEW: Initialize range system
     range_manager = initialize_combat_with_ranges(combatants)
 
+    # Per-fight ledgers for the outcome summary
+    for char in combatants:
+        char.damage_dealt = {}
+    resources_at_start = resource_snapshot(combatants)
+
     for i, char in enumerate(combatants):
         print(char)
         if i < len(combatants) - 1:
             print()
 
     print("\n--- Rolling for Initiative ---")
+    set_event_round(0)
     for char in combatants:
         char.roll_initiative()
 
     combatants.sort(key=lambda c: c.initiative, reverse=True)
 
     print(f"\n--- INITIATIVE ORDER: {[c.name for c in combatants]} ---")
+    yield {'type': 'start', 'order': [c.name for c in combatants],
+           'initiative': {c.name: c.initiative for c in combatants}, 'events': _take_events(sink)}
 
+    # Positions, conditions and grapples are diffed after every turn when an event log is open
+    states = [creature_state(c) for c in combatants] if event_log_active() else None
+
+    cancelled = False
     turn = 1
-    while len([c for c in combatants if c.is_alive]) > 1:
+    while count_active_sides(combatants) > 1:
+        if max_rounds is not None and turn > max_rounds:
+            print(f"\n--- Round limit ({max_rounds}) reached ---")
+            break
         print(f"\n--- Round {turn} ---")
 
         # Set current round for all combatants (for advantage tracking)
         for combatant in combatants:
             combatant.current_round = turn
+        set_event_round(turn)
+        yield {'type': 'round', 'round': turn}
 
         for attacker in combatants:
             if not attacker.is_alive:
                 continue
+            if control is not None and control.cancelled:
+                cancelled = True
+                break
 
             # --- FIXED: Centralized turn announcement ---
             print(f"\n--- {attacker.name}'s Turn ---")
 
             attacker.has_used_reaction = False
+            set_acting_faction(get_faction(attacker))
             attacker.process_effects_on_turn_start()
             if not attacker.is_alive:
                 break
 
             attacker.take_turn(combatants)
+            if states is not None:
+                states = log_state_changes(combatants, states)
 
             # NEW: Update positions in range manager after movement
             range_manager.update_positions(combatants)
 
-            if len([c for c in combatants if c.is_alive]) <= 1:
+            yield {'type': 'turn', 'round': turn, 'creature': attacker.name, 'events': _take_events(sink),
+                   'hp': {c.name: c.hp for c in combatants}}
+
+            if count_active_sides(combatants) <= 1:
                 break
 
+        if cancelled:
+            print("\n--- Combat stopped ---")
+            break
         turn += 1
 
+    set_acting_faction(None)
     print("\n\n===== COMBAT ENDS =====")
-    victor = next((c for c in combatants if c.is_alive), None)
-    if victor:
-        print(f"{victor.name} is the victor!")
+    survivors = [c for c in combatants if c.is_alive]
+    if len(survivors) == 1:
+        print(f"{survivors[0].name} is the victor!")
+    elif survivors:
+        print(f"{', '.join(c.name for c in survivors)} are victorious!")
     else:
         print("All combatants have been defeated!")
 
     for char in combatants:
-        print(char)
\ No newline at end of file
+        print(char)
+
+    sides = {get_faction(c) for c in survivors}
+    resources_left = resource_snapshot(combatants)
+    summary = {
+        'victor': sides.pop() if len(sides) == 1 and not cancelled else None,
+        'rounds': turn - 1 if not cancelled else turn,
+        'survivors': [c.name for c in survivors],
+        'hp_remaining': {c.name: c.hp for c in combatants},
+        'hp_by_faction': hp_by_faction(combatants),
+        'fallen': fallen_by_faction(combatants),
+        'damage_by_source': damage_by_source(combatants),
+        'resources_spent': {
+            side: {name: left - resources_left[side][name] for name, left in start.items()}
+            for side, start in resources_at_start.items()
+        },
+    }
+    if cancelled:
+        summary['cancelled'] = True
+    yield {'type': 'end', 'summary': summary}
+
+
+async def async_iter_combat(combatants, max_rounds=None, control=None):
+    """
+    iter_combat for asyncio clients: the event loop gets control back after
+    every event, and a paused control holds the fight between turns.
+    """
+    events = iter_combat(combatants, max_rounds, control)
+    try:
+        for event in events:
+            yield event
+            if control is not None:
+                await control.wait_while_paused()
+            else:
+                await asyncio.sleep(0)
+    finally:
+        events.close()
+
+
+def combat_simulation(combatants, max_rounds=None):
+    """
+    Simulates combat between a list of characters until one side is defeated
+    (or max_rounds have been fought). Returns a summary of the outcome.
+    """
+    # Without a listener the fight skips building event records
+    for event in _run_combat(combatants, max_rounds, None, None):
+        if event['type'] == 'end':
+            return event['summary']
\ No newline at end of file
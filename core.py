@@ -1,22 +1,113 @@
+import math
 import random
 
-def roll_d20(advantage=False, disadvantage=False):
+# --- Dice streams ---
+# Unseeded, every roll comes from the global `random` module. After
+# seed_dice(seed), each purpose ('initiative', 'attack', 'damage', 'save',
+# 'check', 'healing') draws from its own generator derived from the seed, so two
+# variants of the same fight see identical rolls per purpose even when one
+# of them rolls extra dice of another kind (common random numbers).
+_dice_seed = None
+_dice_streams = {}
+_forced_d20s = {}
+
+def seed_dice(seed, forced_d20s=None):
+    """
+    Switch to per-purpose dice streams derived from seed (None = back to global random).
+    forced_d20s maps a purpose to the values its first d20s will show, for
+    stratified and quasi-random sampling of the opening rolls.
+    """
+    global _dice_seed
+    _dice_seed = seed
+    _dice_streams.clear()
+    _forced_d20s.clear()
+    for purpose, values in (forced_d20s or {}).items():
+        _forced_d20s[purpose] = list(values)
+
+def dice_stream(purpose):
+    """The generator rolls of this purpose are drawn from."""
+    if _dice_seed is None:
+        return random
+    stream = _dice_streams.get(purpose)
+    if stream is None:
+        stream = _dice_streams[purpose] = random.Random(f"{_dice_seed}:{purpose}")
+    return stream
+
+# --- Importance sampling ---
+# tilt_dice biases the rolls of some purposes while a given faction is acting
+# (combat_simulation reports who acts through set_acting_faction): a positive
+# tilt favours high faces, a negative one low faces. Every biased roll
+# multiplies the fight's likelihood ratio by P(face) / P_biased(face), so
+# weighting outcomes by likelihood_ratio() keeps estimates unbiased.
+_tilt = {}
+_tilt_purposes = ()
+_tilt_weights = {}
+_acting_faction = None
+_log_likelihood_ratio = 0.0
+
+def tilt_dice(tilt=None, purposes=('attack', 'damage')):
+    """Bias rolls of purposes while each faction in tilt (faction -> strength) acts; None turns it off."""
+    global _tilt_purposes, _log_likelihood_ratio
+    _tilt.clear()
+    _tilt.update(tilt or {})
+    _tilt_purposes = tuple(purposes)
+    _log_likelihood_ratio = 0.0
+
+def set_acting_faction(faction):
+    global _acting_faction
+    _acting_faction = faction
+
+def likelihood_ratio():
+    """Product of P(face) / P_biased(face) over every biased roll since tilt_dice."""
+    return math.exp(_log_likelihood_ratio)
+
+def _tilted_cumulative(sides, strength):
+    key = (sides, strength)
+    if key not in _tilt_weights:
+        weights = [math.exp(strength * face / sides) for face in range(1, sides + 1)]
+        total = sum(weights)
+        cumulative, running = [], 0.0
+        for weight in weights:
+            running += weight / total
+            cumulative.append(running)
+        _tilt_weights[key] = ([weight / total for weight in weights], cumulative)
+    return _tilt_weights[key]
+
+def _die(purpose, sides):
+    stream = dice_stream(purpose)
+    strength = _tilt.get(_acting_faction) if _tilt and purpose in _tilt_purposes else None
+    if not strength:
+        return stream.randint(1, sides)
+    global _log_likelihood_ratio
+    probabilities, cumulative = _tilted_cumulative(sides, strength)
+    u = stream.random()
+    face = next((i for i, edge in enumerate(cumulative) if u < edge), sides - 1) + 1
+    _log_likelihood_ratio += math.log(1 / (sides * probabilities[face - 1]))
+    return face
+
+def _next_d20(purpose):
+    forced = _forced_d20s.get(purpose)
+    if forced:
+        return forced.pop(0)
+    return _die(purpose, 20)
+
+def roll_d20(advantage=False, disadvantage=False, purpose='attack'):
     """
     Rolls a d20, applying advantage or disadvantage.
     Returns the chosen roll and a list of all rolls.
     """
-    roll1 = random.randint(1, 20)
+    roll1 = _next_d20(purpose)
     if not (advantage ^ disadvantage):
         return roll1, [roll1]
-    roll2 = random.randint(1, 20)
+    roll2 = _next_d20(purpose)
     rolls = sorted([roll1, roll2])
     return (rolls[1], rolls) if advantage else (rolls[0], rolls)
 
-def roll(dice_string):
+def roll(dice_string, purpose='damage'):
     """Rolls dice based on a string like '1d8' or '2d6'."""
     try:
         num_dice, die_type = map(int, dice_string.split('d'))
-        return sum(random.randint(1, die_type) for _ in range(num_dice))
+        return sum(_die(purpose, die_type) for _ in range(num_dice))
     except ValueError:
         print(f"Error: Invalid dice string format '{dice_string}'")
         return 0
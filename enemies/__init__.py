@@ -5,5 +5,8 @@ from .cr_0_quarter.goblin import Goblin
 from .cr_half_1.hobgoblin_warrior import HobgoblinWarrior
 from .cr_half_1.giant_octopus import GiantOctopus
 from .cr_2_5.giant_constrictor_snake import GiantConstrictorSnake
+from .mob import Mob, mobify
+from .bestiary import spawn_monster
 
-__all__ = ['Goblin', 'HobgoblinWarrior', 'GiantOctopus', 'GiantConstrictorSnake']
\ No newline at end of file
+__all__ = ['Goblin', 'HobgoblinWarrior', 'GiantOctopus', 'GiantConstrictorSnake', 'Mob', 'mobify',
+           'spawn_monster']
\ No newline at end of file
@@ -12,4 +12,5 @@ class Enemy(Character):
                          weapon=weapon, armor=armor, shield=shield,
                          cr=cr, position=position, speed=speed, xp=0,
                          initiative_bonus=initiative_bonus)
-        self.ai_brain = AIBrain()
\ No newline at end of file
+        self.ai_brain = AIBrain()
+        self.faction = "monsters"
\ No newline at end of file
@@ -0,0 +1,310 @@
+# File: enemies/bestiary.py
+"""
+Data-driven bestiary.
+
+Monsters that need no special code are stat blocks in TOML files under
+enemies/stat_blocks/ rather than hand-written classes. A stat block gives
+the numbers (stats, HP, AC, speed, CR, initiative bonus), its attacks
+(weapons from equipment/ by name, or inline natural weapons), an optional
+multiattack sequence, a grapple profile from GRAPPLE_PROFILES, traits, and
+the AI that runs it (an AI class by name, optionally pinned to an
+intelligence tier):
+
+    [wolf]
+    name = "Wolf"
+    cr = "1/4"
+    hp = 11
+    ac = 12
+    stats = { str = 14, dex = 15, con = 12, int = 3, wis = 12, cha = 6 }
+    speed = 40
+    attacks = [{ name = "Bite", damage_dice = "1d6", damage_type = "Piercing" }]
+    ai_tier = "bestial_instinct"
+
+Parsing and checking every file on each start would grow with the
+bestiary, so the files are compiled once into StatBlock prototypes (with
+their weapons built) and pickled to stat_blocks/__pycache__; the cache is
+rebuilt when any data file is added, removed or modified, or when the code
+the blocks are built from (this module and equipment/) changes. Loading is lazy,
+and each stat block's first monster becomes the prototype the rest are
+cloned from (see Character.spawn), sharing its weapons and stats.
+
+    goblin = spawn_monster('goblin_warrior', position=30)
+"""
+
+import importlib
+import os
+import pickle
+import tomllib
+
+from equipment.catalog import equipment_catalog, equipment_sources
+from equipment.weapons.base_weapon import Weapon
+from actions.base_actions import AttackAction
+from actions.special_actions import MultiattackAction
+from ai.intelligence_based_ai import IntelligenceBasedAI
+from .base_enemy import Enemy
+
+
+STAT_BLOCK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stat_blocks')
+CACHE_FORMAT = 2
+
+# AI classes a stat block can name
+AI_CLASSES = {
+    'IntelligenceBasedAI': 'enemies.bestiary:StatBlockAI',
+    'GoblinAI': 'ai.enemy_ai.humanoid.goblin_ai:GoblinAI',
+    'HobgoblinWarriorAI': 'ai.enemy_ai.humanoid.hobgoblin_warrior_ai:HobgoblinWarriorAI',
+    'GiantOctopusAI': 'ai.enemy_ai.beast.giant_octopus_ai:GiantOctopusAI',
+    'GiantConstrictorSnakeAI': 'ai.enemy_ai.beast.giant_constrictor_snake_ai:GiantConstrictorSnakeAI',
+}
+AI_TIERS = ('bestial_instinct', 'simple_tactics', 'basic_strategy', 'complex_planning')
+ABILITIES = ('str', 'dex', 'con', 'int', 'wis', 'cha')
+STAT_BLOCK_KEYS = {'name', 'cr', 'level', 'hp', 'ac', 'stats', 'speed', 'initiative_bonus', 'size', 'creature_type',
+                   'weapon', 'armor', 'shield', 'attacks', 'multiattack', 'grapple', 'traits', 'ai', 'ai_tier'}
+
+
+class BestiaryError(ValueError):
+    pass
+
+
+class StatBlockAI(IntelligenceBasedAI):
+    """Intelligence-tier AI for stat block monsters: uses Multiattack whenever the creature has one."""
+
+    def instinctive_behavior(self, character, target):
+        multiattack = next((a for a in character.available_actions if isinstance(a, MultiattackAction)), None)
+        return {
+            'action': multiattack or AttackAction(character.equipped_weapon),
+            'bonus_action': None,
+            'action_target': target,
+            'bonus_action_target': None
+        }
+
+
+class StatBlock:
+    """A compiled monster prototype: validated numbers, built weapons, resolved references."""
+
+    def __init__(self, key, data, source):
+        self.key = key
+        self.source = source
+        self.name = data.get('name', key.replace('_', ' ').title())
+        self.cr = str(data.get('cr', '0'))
+        self.level = data.get('level', 1)
+        self.hp = data['hp']
+        self.ac = data.get('ac')
+        self.stats = dict(data['stats'])
+        self.speed = data.get('speed', 30)
+        self.initiative_bonus = data.get('initiative_bonus', 0)
+        self.size = data.get('size', 'Medium')
+        self.creature_type = data.get('creature_type')
+        self.armor = data.get('armor')
+        self.shield = data.get('shield')
+        self.weapons = [_weapon(attack) for attack in ([data['weapon']] if 'weapon' in data else [])
+                        + data.get('attacks', [])]
+        self.multiattack = list(data.get('multiattack', []))
+        self.grapple = data.get('grapple')
+        self.traits = [dict(trait) for trait in data.get('traits', [])]
+        self.ai = data.get('ai', 'IntelligenceBasedAI')
+        self.ai_tier = data.get('ai_tier')
+
+    def weapon(self, name):
+        for weapon in self.weapons:
+            if weapon.name == name:
+                return weapon
+        raise KeyError(name)
+
+
+def _weapon(attack):
+    """A Weapon from an equipment name or an inline attack table."""
+    if isinstance(attack, str):
+        return _equipment('weapons', attack)
+    return Weapon(name=attack['name'], damage_dice=attack['damage_dice'], damage_type=attack['damage_type'],
+                  properties=list(attack.get('properties', [])), reach=attack.get('reach', 5))
+
+
+def _equipment(kind, name):
+    weapons, armor = equipment_catalog()
+    catalog = weapons if kind == 'weapons' else armor
+    if name not in catalog:
+        raise BestiaryError(f"unknown {kind[:-1]} {name!r}")
+    return catalog[name]
+
+
+def _check(key, data, source):
+    """Everything wrong with one stat block, as a list of messages."""
+    where = f"{os.path.basename(source)} [{key}]"
+    problems = []
+    unknown = set(data) - STAT_BLOCK_KEYS
+    if unknown:
+        problems.append(f"{where}: unknown keys {', '.join(sorted(unknown))}")
+    if not isinstance(data.get('hp'), int) or data.get('hp', 0) < 1:
+        problems.append(f"{where}: hp must be a positive integer")
+    if not isinstance(data.get('stats'), dict) or set(data['stats']) != set(ABILITIES):
+        problems.append(f"{where}: stats must give exactly {', '.join(ABILITIES)}")
+    if 'weapon' not in data and not data.get('attacks'):
+        problems.append(f"{where}: needs a weapon or at least one attack")
+    for attack in data.get('attacks', []):
+        if isinstance(attack, dict) and not {'name', 'damage_dice', 'damage_type'} <= set(attack):
+            problems.append(f"{where}: attacks need name, damage_dice and damage_type")
+    if data.get('ai', 'IntelligenceBasedAI') not in AI_CLASSES:
+        problems.append(f"{where}: unknown ai {data['ai']!r} (choose from {', '.join(AI_CLASSES)})")
+    if data.get('ai_tier') not in (None,) + AI_TIERS:
+        problems.append(f"{where}: unknown ai_tier {data['ai_tier']!r}")
+    if data.get('grapple') is not None:
+        from systems.grappling.grapple_manager import GRAPPLE_PROFILES
+        if data['grapple'] not in GRAPPLE_PROFILES:
+            problems.append(f"{where}: unknown grapple profile {data['grapple']!r}")
+    if not problems:
+        try:
+            block = StatBlock(key, data, source)
+            for kind in ('armor', 'shield'):
+                if getattr(block, kind) is not None:
+                    _equipment('armor', getattr(block, kind))
+            for name in block.multiattack:
+                block.weapon(name)
+        except BestiaryError as error:
+            problems.append(f"{where}: {error}")
+        except KeyError as error:
+            problems.append(f"{where}: multiattack names unknown attack {error}")
+    return problems
+
+
+def _sources(directory):
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.toml'))
+
+
+def _code_sources():
+    return [os.path.abspath(__file__)] + equipment_sources()
+
+
+def _fingerprint(sources):
+    return ([(os.path.basename(path), os.stat(path).st_mtime_ns) for path in sources]
+            + [(path, os.stat(path).st_mtime_ns) for path in _code_sources()])
+
+
+def compile_stat_blocks(directory=STAT_BLOCK_DIR):
+    """Parse and check every data file; returns {key: StatBlock} or raises BestiaryError listing all problems."""
+    blocks, problems = {}, []
+    for path in _sources(directory):
+        with open(path, 'rb') as f:
+            try:
+                data = tomllib.load(f)
+            except tomllib.TOMLDecodeError as error:
+                problems.append(f"{os.path.basename(path)}: invalid TOML: {error}")
+                continue
+        for key, block in data.items():
+            if key in blocks:
+                problems.append(f"{os.path.basename(path)} [{key}]: already defined in "
+                                f"{os.path.basename(blocks[key].source)}")
+                continue
+            found = _check(key, block, path)
+            if found:
+                problems.extend(found)
+            else:
+                blocks[key] = StatBlock(key, block, path)
+    if problems:
+        raise BestiaryError("Invalid stat blocks:\n  " + "\n  ".join(problems))
+    return blocks
+
+
+def _cache_path(directory):
+    return os.path.join(directory, '__pycache__', 'bestiary.pickle')
+
+
+def load_bestiary(directory=STAT_BLOCK_DIR):
+    """The compiled stat blocks, from the cache unless a data file or their code changed since it was written."""
+    sources = _sources(directory)
+    fingerprint = _fingerprint(sources)
+    cache_path = _cache_path(directory)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['format'] == CACHE_FORMAT and cached['sources'] == fingerprint:
+            return cached['blocks']
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError, AttributeError):
+        pass
+
+    blocks = compile_stat_blocks(directory)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temporary = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as f:
+            pickle.dump({'format': CACHE_FORMAT, 'sources': fingerprint, 'blocks': blocks}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
+    except OSError as error:  # A read-only install still works, just without the cache
+        print(f"[BESTIARY] Could not write the stat block cache: {error}")
+    return blocks
+
+
+class BestiaryMonster(Enemy):
+    """A monster built from a StatBlock prototype."""
+
+    SHARED_ATTRIBUTES = Enemy.SHARED_ATTRIBUTES | {'stat_block'}
+
+    def __init__(self, block, name=None, position=0):
+        super().__init__(
+            name=name or block.name,
+            level=block.level,
+            hp=block.hp,
+            stats=dict(block.stats),
+            weapon=block.weapons[0],
+            armor=_equipment('armor', block.armor) if block.armor else None,
+            shield=_equipment('armor', block.shield) if block.shield else None,
+            cr=block.cr,
+            speed=block.speed,
+            position=position,
+            initiative_bonus=block.initiative_bonus
+        )
+        self.stat_block = block
+        if block.ac is not None:
+            self.ac = block.ac
+        if len(block.weapons) > 1:
+            self.secondary_weapon = block.weapons[1]
+        self.size = block.size
+        if block.creature_type:
+            self.creature_type = block.creature_type
+        self.traits = [dict(trait) for trait in block.traits]
+        if block.multiattack:
+            self.available_actions.append(MultiattackAction(self))
+        if block.grapple:
+            from systems.grappling.grapple_manager import setup_creature_grappling
+            setup_creature_grappling(self, block.grapple)
+
+        module, class_name = AI_CLASSES[block.ai].split(':')
+        self.ai_brain = getattr(importlib.import_module(module), class_name)()
+        if block.ai_tier:
+            self.ai_brain.intelligence_tier = block.ai_tier
+
+    def calculate_ac(self):
+        block = getattr(self, 'stat_block', None)
+        if block is not None and block.ac is not None:
+            return block.ac
+        return super().calculate_ac()
+
+    def multiattack(self, target, action_type="ACTION"):
+        print(f"{action_type}: {self.name} uses Multiattack!")
+        for name in self.stat_block.multiattack:
+            if not target.is_alive or not self.is_alive:
+                break
+            self.attack(target, action_type, weapon=self.stat_block.weapon(name))
+
+
+_bestiary = None
+_prototypes = {}
+
+
+def get_bestiary():
+    """The compiled stat blocks, loaded on first use."""
+    global _bestiary
+    if _bestiary is None:
+        _bestiary = load_bestiary()
+    return _bestiary
+
+
+def spawn_monster(key, name=None, position=0):
+    """A new monster from the stat block key (e.g. 'wolf'), cloned from one built on first use."""
+    prototype = _prototypes.get(key)
+    if prototype is None:
+        bestiary = get_bestiary()
+        if key not in bestiary:
+            raise KeyError(f"No stat block {key!r} (known: {', '.join(sorted(bestiary))})")
+        prototype = _prototypes[key] = BestiaryMonster(bestiary[key])
+    return prototype.spawn(name or prototype.name, position)
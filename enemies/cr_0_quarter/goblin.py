@@ -3,6 +3,7 @@ from ..base_enemy import Enemy
 from equipment.weapons.martial_melee import scimitar
 from equipment.armor.light import leather
 from equipment.armor.shields import shield
+from ai.enemy_ai.humanoid.goblin_ai import GoblinAI
 
 
 class Goblin(Enemy):
@@ -19,4 +20,5 @@ class Goblin(Enemy):
             shield=shield,
             cr='1/4',
             position=position
-        )
\ No newline at end of file
+        )
+        self.ai_brain = GoblinAI()
\ No newline at end of file
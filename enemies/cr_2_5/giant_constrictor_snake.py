@@ -5,6 +5,7 @@ from ai.enemy_ai.beast.giant_constrictor_snake_ai import GiantConstrictorSnakeAI
 from actions.special_actions import MultiattackAction
 from actions.base_actions import AttackAction
 from core import roll_d20, get_ability_modifier, roll
+from systems.combat.event_log import log_event, attack_outcome
 
 
 class GiantConstrictorSnake(Enemy):
@@ -96,6 +97,8 @@ class GiantConstrictorSnake(Enemy):
         total_attack = attack_roll + attack_modifier + prof_bonus
 
         print(f"ATTACK ROLL: {attack_roll} (1d20) +{attack_modifier} (STR) +{prof_bonus} (Prof) = {total_attack}")
+        log_event('attack', self.name, target.name, attack_roll, total_attack, target.ac,
+                  attack_outcome(total_attack >= target.ac or attack_roll == 20, attack_roll == 20))
 
         if total_attack >= target.ac or attack_roll == 20:
             is_crit = (attack_roll == 20)
@@ -114,7 +117,7 @@ class GiantConstrictorSnake(Enemy):
             total_damage = damage + attack_modifier
             print(
                 f"{self.name} deals {total_damage} piercing damage ({damage} [{self.equipped_weapon.damage_dice}{'+ crit' if is_crit else ''}] +{attack_modifier} [STR])")
-            target.take_damage(total_damage, attacker=self)
+            target.take_damage(total_damage, attacker=self, source='Bite')
         else:
             print("The bite attack misses.")
 
@@ -146,7 +149,7 @@ class GiantConstrictorSnake(Enemy):
         total_damage = damage + get_ability_modifier(self.stats['str'])
         
         print(f"{self.name} deals {total_damage} bludgeoning damage ({damage} [{self.secondary_weapon.damage_dice}] +{get_ability_modifier(self.stats['str'])} [STR])")
-        target.take_damage(total_damage, attacker=self)
+        target.take_damage(total_damage, attacker=self, source='Constrict')
 
         # Apply grapple effect properly (PHB 2024)
         if target.is_alive:
@@ -178,7 +181,7 @@ class GiantConstrictorSnake(Enemy):
         total_damage = damage + get_ability_modifier(self.stats['str'])
         
         print(f"{self.name} deals {total_damage} bludgeoning damage ({damage} [{self.secondary_weapon.damage_dice}] +{get_ability_modifier(self.stats['str'])} [STR]) - GUARANTEED")
-        target.take_damage(total_damage, attacker=self)
+        target.take_damage(total_damage, attacker=self, source='Constrict')
         
         print(f"** {target.name} remains grappled and can attempt to escape on their turn! **")
         return True
@@ -191,7 +194,10 @@ class GiantConstrictorSnake(Enemy):
         # Store combatants reference for grapple system
         self.current_combatants = combatants
         
-        chosen_actions = self.ai_brain.choose_actions(self, combatants)
+        from ai.turn_budget import start_turn_deadline
+        from ai.decision_log import record_decision
+        chosen_actions = self.ai_brain.choose_actions(self, combatants, deadline=start_turn_deadline())
+        record_decision(self, chosen_actions)
 
         defender = chosen_actions.get('action_target') or next((c for c in combatants if c.is_alive and c != self), None)
 
@@ -303,7 +309,7 @@ class GiantConstrictorSnake(Enemy):
                 ongoing_damage += roll('1d6')
             
             print(f"** {self.name} takes {ongoing_damage} fire damage ({dice_count}d6) from Searing Smite! **")
-            self.take_damage(ongoing_damage, attacker=caster)
+            self.take_damage(ongoing_damage, attacker=caster, source='Searing Smite')
             
             # Constitution saving throw to end the effect
             if self.is_alive:
@@ -321,9 +327,9 @@ class GiantConstrictorSnake(Enemy):
             self.is_grappling = False
             self.grapple_target = None
 
-    def take_damage(self, damage, attacker=None):
+    def take_damage(self, damage, attacker=None, source=None):
         """Override to handle grapple breaking on death"""
-        super().take_damage(damage, attacker)
+        super().take_damage(damage, attacker, source)
 
         # If the snake dies, release any grappled targets
         if not self.is_alive and self.is_grappling and self.grapple_target:
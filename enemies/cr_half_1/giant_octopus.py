@@ -233,13 +233,13 @@ class GiantOctopus(Enemy):
         from systems.spells.ongoing_effects import process_ongoing_spell_effects
         process_ongoing_spell_effects(self)
 
-    def take_damage(self, damage, attacker=None):
+    def take_damage(self, damage, attacker=None, source=None):
         """Handle damage using global systems."""
         # Check for ink cloud trigger BEFORE taking damage
         should_trigger_ink = (self.is_alive and damage > 0 and attacker)
         
         # Take damage via global damage system
-        super().take_damage(damage, attacker)
+        super().take_damage(damage, attacker, source)
 
         # Trigger ink cloud via global reaction system
         if should_trigger_ink and self.is_alive:
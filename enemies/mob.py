@@ -0,0 +1,189 @@
+# File: enemies/mob.py
+"""
+Mob - a homogeneous group of monsters resolved in bulk.
+
+A mob is one combatant standing in for N identical stat blocks (e.g. 40
+goblins). It keeps per-member HP in an array, rolls initiative once for the
+group, and on its turn resolves every member's attack with one vectorized
+roll and one aggregated take_damage call per target. Damage dealt to the
+mob lands on the front-rank member; overflow does not carry to the next
+one, so members still die and drop out one at a time (each death is an
+event of its own, named "<member> #<n>").
+
+A mob is built from a class or from a creature to copy, so stat block
+monsters (spawn_monster) can form mobs too; mobify groups them by block.
+
+Mobs support weapon attacks only (the same stat blocks the lockstep engine
+supports). NumPy is required.
+"""
+
+import random
+
+from .base_enemy import Enemy
+from systems.combat.attack_profiles import require_numpy, attack_profile_from_weapon
+from systems.combat.event_log import damage_type_of, log_event
+
+# Weapons carry no range of their own, so a volley reaches a longbow's normal
+# range unless the weapon gives a longer reach
+VOLLEY_RANGE = 150
+
+
+class Mob(Enemy):
+    """N identical monsters acting as one combatant."""
+
+    def __init__(self, member, count, name=None, position=0):
+        """member is a creature class, or a creature whose stat block every member copies."""
+        np = require_numpy()
+        template = member(position=position) if isinstance(member, type) else member
+        if any(action.name == "Multiattack" for action in template.available_actions):
+            raise ValueError(f"{template.name}: multiattack creatures can't form a mob")
+
+        super().__init__(
+            name=name or f"{template.name} Mob",
+            level=template.level,
+            hp=template.max_hp * count,
+            stats=template.stats,
+            weapon=template.equipped_weapon,
+            armor=template.equipped_armor,
+            shield=template.equipped_shield,
+            cr=template.cr,
+            speed=template.speed,
+            position=position,
+            initiative_bonus=template.initiative_bonus
+        )
+        self.secondary_weapon = template.secondary_weapon
+        self.faction = template.faction
+        self.size = getattr(template, 'size', 'Medium')
+        self.member_name = template.name
+        self.member_max_hp = template.max_hp
+        self.member_hp = np.full(count, template.max_hp, dtype=np.int64)
+        self.xp_value = template.xp_value  # Awarded per member killed
+
+        self.melee_profile = attack_profile_from_weapon(template, template.equipped_weapon)
+        self.ranged_profile = None
+        if self.secondary_weapon is not None and 'Ranged' in self.secondary_weapon.properties:
+            self.ranged_profile = attack_profile_from_weapon(template, self.secondary_weapon)
+            self.volley_range = max(self.ranged_profile.reach, VOLLEY_RANGE)
+
+        # Own generator, seeded from the global one so random.seed() still reproduces fights
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self._np = np
+
+    def spawn(self, name=None, position=None):
+        """Clone with its own member HP and a generator seeded like a freshly built mob's."""
+        clone = super().spawn(name, position)
+        clone.member_hp = self.member_hp.copy()
+        clone.rng = self._np.random.default_rng(random.getrandbits(64))
+        return clone
+
+    @property
+    def alive_count(self):
+        return int((self.member_hp > 0).sum())
+
+    def __str__(self):
+        return (f"--- {self.name} ({self.alive_count}/{len(self.member_hp)} {self.member_name}s) ---\n"
+                f"HP: {self.hp}/{self.max_hp} (each {self.member_max_hp}) | AC: {self.ac} | Speed: {self.speed}ft.\n"
+                f"Equipment: {self.equipped_weapon.name}"
+                + (f", {self.secondary_weapon.name}" if self.secondary_weapon else ""))
+
+    def take_damage(self, damage, attacker=None, source=None):
+        """Damage hits the front-rank member; excess is lost, as for a single creature."""
+        alive = self._np.flatnonzero(self.member_hp > 0)
+        if len(alive) == 0:
+            return
+        if attacker is not None and hasattr(attacker, 'record_damage_dealt'):
+            attacker.record_damage_dealt(source, damage)
+        front = alive[0]
+        self.member_hp[front] = max(0, self.member_hp[front] - damage)
+        self.hp = int(self.member_hp.sum())
+        print(f"{self.member_name} #{front + 1} of {self.name} takes {damage} damage "
+              f"({self.member_hp[front]}/{self.member_max_hp} HP).")
+        log_event('damage', self.name, getattr(attacker, 'name', None), source, damage_type_of(attacker, source),
+                  damage, self.hp)
+
+        if self.member_hp[front] == 0:
+            print(f"{self.member_name} #{front + 1} has been defeated! ({len(alive) - 1} remain)")
+            log_event('death', f"{self.member_name} #{front + 1}", getattr(attacker, 'name', None))
+            if attacker:
+                attacker.gain_xp(self.xp_value)
+        if self.hp <= 0:
+            self.is_alive = False
+            print(f"{self.name} has been defeated!")
+            log_event('death', self.name, getattr(attacker, 'name', None))
+
+    def take_turn(self, combatants):
+        """Every living member attacks; members are spread evenly over the closest enemies."""
+        self.has_used_action = False
+        self.has_used_bonus_action = False
+        self.current_combatants = combatants
+
+        enemies = [c for c in combatants if c.is_alive and c.faction != self.faction]
+        if not enemies:
+            return
+        enemies.sort(key=lambda e: abs(self.position - e.position))
+        closest = enemies[0]
+        distance = abs(self.position - closest.position)
+
+        # One ranged volley, at the enemies in range, if the group has bows and the enemy is out of reach
+        if self.ranged_profile is not None and self.melee_profile.reach < distance <= self.volley_range:
+            attack = self.ranged_profile
+            targets = [e for e in enemies if abs(self.position - e.position) <= self.volley_range]
+            print("MOVEMENT: (None)")
+        else:
+            attack = self.melee_profile
+            movement = min(self.speed, max(0, distance - attack.reach))
+            if movement > 0:
+                self.position += movement if closest.position > self.position else -movement
+                print(f"MOVEMENT: {self.name} moves {movement} feet towards {closest.name}.")
+            targets = [e for e in enemies if abs(self.position - e.position) <= attack.reach]
+            if not targets:
+                print("ACTION: (None - no enemy in reach)")
+                return
+
+        attackers = self.alive_count
+        for index, target in enumerate(targets):
+            # Round-robin split of the members over the targets
+            count = attackers // len(targets) + (1 if index < attackers % len(targets) else 0)
+            if count and target.is_alive:
+                self._volley(attack, target, count)
+        self.has_used_action = True
+
+    def _volley(self, attack, target, count):
+        np = self._np
+        d20 = self.rng.integers(1, 21, size=count)
+        crit = d20 == 20
+        hit = (d20 + attack.attack_bonus >= target.ac) | crit
+
+        damage = np.full(count, attack.flat_damage, dtype=np.int64)
+        for dice, sides in attack.dice:
+            damage += self.rng.integers(1, sides + 1, size=(count, dice)).sum(axis=1)
+            damage += np.where(crit, self.rng.integers(1, sides + 1, size=(count, dice)).sum(axis=1), 0)
+        total = int(damage[hit].sum())
+
+        print(f"ACTION: {count} {self.member_name}s attack {target.name} (AC: {target.ac}): "
+              f"{int(hit.sum())} hit ({int(crit.sum())} critical) for {total} damage")
+        if total > 0:
+            target.take_damage(total, attacker=self, source='Weapon')
+
+
+def _kind(creature):
+    """Monsters of one kind: the same class and, for stat block monsters, the same block."""
+    block = getattr(creature, 'stat_block', None)
+    return type(creature), block.key if block is not None else None
+
+
+def mobify(combatants):
+    """Replace every group of two or more same-kind monsters with one Mob."""
+    groups = {}
+    for creature in combatants:
+        if isinstance(creature, Enemy) and not isinstance(creature, Mob):
+            groups.setdefault(_kind(creature), []).append(creature)
+
+    result = []
+    for creature in combatants:
+        group = groups.get(_kind(creature))
+        if group is None or len(group) < 2:
+            result.append(creature)
+        elif creature is group[0]:
+            result.append(Mob(creature, len(group), position=min(c.position for c in group)))
+    return result
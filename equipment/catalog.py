@@ -0,0 +1,48 @@
+# File: equipment/catalog.py
+"""
+Equipment by name.
+
+Scenario files and stat blocks name weapons and armor by the variable they
+are defined as in equipment/ (e.g. "scimitar", "chain_mail"); the catalog
+maps those names to the objects.
+"""
+
+import importlib
+import os
+import pkgutil
+
+EQUIPMENT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _module_objects(package, kind):
+    """name -> object for every module-level instance of kind in a package's modules."""
+    found = {}
+    package = importlib.import_module(package)
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+        for name, value in vars(module).items():
+            if isinstance(value, kind):
+                found.setdefault(name, value)
+    return found
+
+
+_catalog = None
+
+
+def equipment_catalog():
+    """Weapons and armor (shields included) by their variable names in equipment/."""
+    global _catalog
+    if _catalog is None:
+        from equipment.weapons.base_weapon import Weapon
+        from equipment.armor.base_armor import Armor
+        _catalog = _module_objects('equipment.weapons', Weapon), _module_objects('equipment.armor', Armor)
+    return _catalog
+
+
+def equipment_sources():
+    """Every module file under equipment/, sorted: what anything built from the catalog depends on."""
+    sources = []
+    for root, dirs, files in os.walk(EQUIPMENT_DIR):
+        dirs[:] = [name for name in dirs if name != '__pycache__']
+        sources.extend(os.path.join(root, name) for name in files if name.endswith('.py'))
+    return sorted(sources)
@@ -1,4 +1,11 @@
 # main.py
+import sys
+
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Non-interactive, before the game imports: python main.py run scenarios/ --runs 1000 (see scenario_files.py)
+    from systems.simulation.scenario_files import main as run_scenario_files
+    sys.exit(run_scenario_files(sys.argv[1:]))
+
 from characters.paladin import Paladin
 from characters.subclasses.paladin_oaths import OathOfGlory
 from enemies import Goblin, HobgoblinWarrior, GiantConstrictorSnake, GiantOctopus
@@ -7,6 +14,7 @@ from equipment.armor.heavy import chain_mail
 from equipment.armor.shields import shield
 from equipment.weapons.longswords import plus_one_longsword
 from combat import combat_simulation
+from systems.combat.log_writer import buffered_output
 from spells.level_1.cure_wounds import cure_wounds
 from spells.level_1.searing_smite import searing_smite
 from spells.level_1.guiding_bolt import guiding_bolt
@@ -67,4 +75,6 @@ if __name__ == "__main__":
 
     paladin.prepare_spells([cure_wounds, searing_smite])
 
-    combat_simulation([paladin, enemy])
\ No newline at end of file
+    # The combat log is written from a background thread so the fight isn't held up by the console
+    with buffered_output():
+        combat_simulation([paladin, enemy])
\ No newline at end of file
@@ -3,6 +3,7 @@
 from typing import Dict, List, Tuple, Optional
 import math
 from actions.base_actions import AttackAction  # ADD THIS LINE
+from ai.parameters import get_ai_parameter
 
 
 class WeaponRanges:
@@ -259,21 +260,21 @@ class CombatRangeManager:
             can_reach_this_turn = movement_needed <= attacker_speed
         
         # Calculate priority - multiattack should be VERY high priority
-        priority = 40.0  # Base high priority for multiattack
+        priority = get_ai_parameter('range.multiattack_base')  # Base high priority for multiattack (40)
         
         if is_in_range:
-            priority += 15  # Big bonus for being in range
+            priority += get_ai_parameter('range.multiattack_in_range')  # Big bonus for being in range (+15)
             action_description = "Use Multiattack"
         elif can_reach_this_turn:
-            priority += 10  # Good bonus for reachable multiattack
+            priority += get_ai_parameter('range.multiattack_reachable')  # Good bonus for reachable multiattack (+10)
             action_description = f"Move {movement_needed}ft and use Multiattack"
         else:
-            priority -= 20  # Penalty for unreachable
+            priority += get_ai_parameter('range.multiattack_unreachable')  # Penalty for unreachable (-20)
             action_description = f"Move toward target for future Multiattack"
         
         # Special bonus for creatures designed around multiattack (like snakes)
         if hasattr(attacker, 'is_grappling') or 'Snake' in attacker.name:
-            priority += 10  # Extra priority for grappling creatures
+            priority += get_ai_parameter('range.multiattack_grappler')  # Extra priority for grappling creatures (+10)
         
         return {
             'type': 'multiattack',
@@ -321,7 +322,7 @@ class CombatRangeManager:
         
         # Heavily penalize options that can't reach target this turn
         if not can_reach_this_turn:
-            priority -= 50  # Major penalty for unreachable targets
+            priority += get_ai_parameter('range.weapon_unreachable')  # Major penalty for unreachable targets (-50)
 
         return {
             'type': 'weapon',
@@ -454,9 +455,12 @@ def enhance_ai_brain_with_range_analysis(ai_brain, range_manager):
     
     original_choose_actions = ai_brain.choose_actions
 
-    def enhanced_choose_actions(character, combatants):
+    def enhanced_choose_actions(character, combatants, deadline=None):
+        from ai.turn_budget import as_deadline
+        deadline = as_deadline(deadline)
+
         # Get the original decision
-        original_decision = original_choose_actions(character, combatants)
+        original_decision = original_choose_actions(character, combatants, deadline=deadline)
 
         # CRITICAL: Check if snake AI made a critical decision that should NOT be overridden
         if hasattr(character, '_snake_ai_critical_decision') and character._snake_ai_critical_decision:
@@ -493,6 +497,11 @@ def enhance_ai_brain_with_range_analysis(ai_brain, range_manager):
         if not target:
             return original_decision
 
+        # Out of compute budget: keep the AI's answer and skip the range analysis
+        if deadline is not None and deadline.expired():
+            character.ai_brain.last_tactical_recommendation = None
+            return original_decision
+
         # Get tactical recommendations
         recommendations = range_manager.get_tactical_recommendations(character, target)
 
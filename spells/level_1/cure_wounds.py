@@ -30,7 +30,7 @@ class CureWounds(Spell):
         # Roll the healing dice
         healing_roll = 0
         for _ in range(total_dice):
-            healing_roll += roll('1d8')
+            healing_roll += roll('1d8', purpose='healing')
 
         # Add spellcasting modifier
         spell_mod = caster.get_spellcasting_modifier()
@@ -58,7 +58,7 @@ class DivineSmite(Spell):
                 damage_description += f" +{extra_damage} [vs {target.creature_type}{crit_text}]"
 
         print(f"** DIVINE SMITE: {damage} radiant damage ({damage_description}) **")
-        target.take_damage(damage, attacker=caster)
+        target.take_damage(damage, attacker=caster, source='Divine Smite')
         return True
 
 # Create the instance
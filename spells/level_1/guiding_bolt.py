@@ -40,7 +40,7 @@ class GuidingBolt(Spell):
 
             print(
                 f"** The {self.name} strikes {target.name} for {damage} {self.damage_type} damage! ({damage_text}) **")
-            target.take_damage(damage, attacker=caster)
+            target.take_damage(damage, attacker=caster, source='Guiding Bolt')
 
             if target.is_alive:
                 # PHB 2024: Next attack has advantage until end of your next turn
@@ -37,7 +37,7 @@ class SearingSmite(Spell):
         print(f"** SEARING SMITE: {immediate_damage} extra fire damage ({dice_count}d6) added to the attack! **")
         
         # Apply immediate damage (this is added to the weapon attack damage)
-        target.take_damage(immediate_damage, attacker=caster)
+        target.take_damage(immediate_damage, attacker=caster, source='Searing Smite')
         
         # Set up ongoing fire damage effect for subsequent turns
         target.searing_smite_effect = {
@@ -69,7 +69,7 @@ class SearingSmite(Spell):
             ongoing_damage += roll('1d6')
 
         print(f"** {target.name} takes {ongoing_damage} fire damage ({dice_count}d6) from Searing Smite! **")
-        target.take_damage(ongoing_damage, attacker=caster)
+        target.take_damage(ongoing_damage, attacker=caster, source='Searing Smite')
 
         # Constitution saving throw to end the effect
         if target.is_alive:
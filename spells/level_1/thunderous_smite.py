@@ -36,7 +36,7 @@ class ThunderousSmite(Spell):
             damage_text += f" (2d6 base +{bonus_dice}d6 upcast)"
 
         print(f"** THUNDEROUS SMITE: {damage} thunder damage ({damage_text}) **")
-        target.take_damage(damage, attacker=caster)
+        target.take_damage(damage, attacker=caster, source='Thunderous Smite')
 
         # Thunderclap effect - audible at 300 feet
         print(f"** A thunderous boom echoes from the strike, audible within 300 feet! **")
@@ -2,6 +2,7 @@
 """Spell Manager - Central hub for all spell operations."""
 
 from core import roll_d20, get_ability_modifier
+from systems.combat.event_log import log_event
 
 
 class SpellManager:
@@ -23,6 +24,7 @@ class SpellManager:
                 return False
         
         print(f"{action_type}: {caster.name} casts {spell.name}!")
+        log_event('spell', caster.name, spell.name, getattr(targets, 'name', None), spell_level)
         return spell.cast(caster, targets, spell_level, action_type)
     
     @staticmethod
@@ -73,4 +75,4 @@ class SpellManager:
             print(f"CRITICAL SPELL DAMAGE: {damage} {damage_type} damage!")
         else:
             print(f"SPELL DAMAGE: {damage} {damage_type} damage")
-        target.take_damage(damage, attacker=caster)
\ No newline at end of file
+        target.take_damage(damage, attacker=caster, source='Spell')
\ No newline at end of file
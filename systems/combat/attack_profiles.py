@@ -0,0 +1,55 @@
+# File: systems/combat/attack_profiles.py
+"""
+Weapon attacks reduced to numbers.
+
+The bulk engines (the lockstep engine, mobs, the surrogate's features)
+resolve attacks from an AttackProfile - attack bonus, damage dice and flat
+damage - instead of calling Character.attack. These helpers live here,
+beside the attack rules they mirror, so that enemies and simulation code
+can share them without one importing the other.
+"""
+
+from core import get_ability_modifier
+
+
+def require_numpy():
+    """Import NumPy, with a clear error when it isn't installed."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("The vectorized engines need NumPy (pip install numpy)") from exc
+    return numpy
+
+
+def _parse_dice(dice):
+    num_dice, die_type = dice.split('d')
+    return int(num_dice), int(die_type)
+
+
+class AttackProfile:
+    """One weapon attack reduced to numbers."""
+
+    def __init__(self, attack_bonus, dice, flat_damage, reach=5, ranged=False):
+        self.attack_bonus = attack_bonus
+        self.dice = dice  # list of (count, sides)
+        self.flat_damage = flat_damage
+        self.reach = reach
+        self.ranged = ranged
+
+
+def attack_profile_from_weapon(creature, weapon):
+    """Reduce a weapon in a creature's hands to an AttackProfile (as Character.attack rolls it)."""
+    is_ranged = 'Ranged' in weapon.properties
+    ability = 'dex' if is_ranged or 'Finesse' in weapon.properties else 'str'
+    modifier = get_ability_modifier(creature.stats[ability])
+
+    dice = [_parse_dice(weapon.damage_dice)]
+    for prop in weapon.properties:
+        if "Extra Damage" in prop:
+            _, dice_and_type = prop.split(':')
+            dice.append(_parse_dice(dice_and_type.split(' ')[0]))
+
+    magic_bonus = next((bonus for bonus in (3, 2, 1) if f'+{bonus}' in weapon.name), 0)
+    return AttackProfile(attack_bonus=modifier + creature.get_proficiency_bonus(), dice=dice,
+                         flat_damage=modifier + magic_bonus, reach=getattr(weapon, 'reach', 5),
+                         ranged=is_ranged)
@@ -2,6 +2,7 @@
 """Global attack system."""
 
 from core import roll_d20, roll, get_ability_modifier
+from .event_log import log_event, attack_outcome
 
 def make_creature_attack(attacker, target, weapon, attack_bonus, action_type="ACTION"):
     """Make a creature attack using global system."""
@@ -27,6 +28,7 @@ def make_creature_attack(attacker, target, weapon, attack_bonus, action_type="AC
     
     hit = total_attack >= target.ac or attack_roll == 20
     is_crit = attack_roll == 20
+    log_event('attack', attacker.name, target.name, attack_roll, total_attack, target.ac, attack_outcome(hit, is_crit))
     
     if hit:
         if is_crit:
@@ -43,7 +45,7 @@ def make_creature_attack(attacker, target, weapon, attack_bonus, action_type="AC
         total_damage = damage + str_mod
         
         print(f"{attacker.name} deals {total_damage} {weapon.damage_type.lower()} damage")
-        target.take_damage(total_damage, attacker=attacker)
+        target.take_damage(total_damage, attacker=attacker, source='Weapon')
     else:
         print("The attack misses.")
     
@@ -0,0 +1,286 @@
+# File: systems/combat/event_log.py
+"""
+Structured binary combat event log.
+
+While a log is open, the combat code reports typed events (initiative,
+movement, attack rolls, damage, saves, conditions, grapples, spells,
+deaths) through log_event. Each event is packed into a fixed-layout binary
+record - a one-byte type code, the round number and the event's fields -
+and creature, spell and source names are written once to a string table
+and referred to by a 16-bit id afterwards. Records are buffered and
+streamed through gzip, so a typical fight costs a few hundred bytes on disk.
+
+read_events iterates a log lazily and yields one namedtuple per event. A
+streamed fight (combat.iter_combat) collects the same namedtuples live in
+its own EventSink, installed only while that fight is running, so fights
+interleaved on one thread or event loop never see each other's events.
+
+    open_event_log("fight.dsev")
+    combat_simulation(combatants)
+    close_event_log()
+    for event in read_events("fight.dsev"):
+        print(event)
+"""
+
+import contextvars
+import gzip
+import struct
+from collections import namedtuple
+from contextlib import contextmanager
+
+
+MAGIC = b'DSEV1\n'
+
+# name: (type code, field layout, field names); layouts follow the shared '<BH' (code, round) header
+EVENT_SCHEMAS = {
+    'fight_start': (1, 'q', ('seed',)),
+    'fight_end': (2, 'HH', ('victor', 'rounds')),
+    'initiative': (3, 'Hhh', ('creature', 'roll', 'total')),
+    'move': (4, 'Hhh', ('creature', 'start', 'end')),
+    'attack': (5, 'HHhhhB', ('attacker', 'target', 'roll', 'total', 'target_ac', 'outcome')),
+    'damage': (6, 'HHHHhh', ('target', 'attacker', 'source', 'damage_type', 'amount', 'hp_left')),
+    'save': (7, 'HHhhhB', ('creature', 'ability', 'roll', 'total', 'dc', 'success')),
+    'condition': (8, 'HHB', ('creature', 'condition', 'applied')),
+    'grapple': (9, 'HHB', ('grappler', 'target', 'started')),
+    'spell': (10, 'HHHB', ('caster', 'spell', 'target', 'level')),
+    'death': (11, 'HH', ('creature', 'killer')),
+}
+
+# Fields holding names (stored as string table ids)
+STRING_FIELDS = {'victor', 'creature', 'attacker', 'target', 'source', 'damage_type', 'ability', 'condition',
+                 'grappler', 'spell', 'caster', 'killer'}
+
+# Fields read back as booleans
+FLAG_FIELDS = {'success', 'applied', 'started'}
+
+ATTACK_OUTCOMES = ('miss', 'hit', 'crit')
+
+SPELL_DAMAGE_TYPES = {
+    'Searing Smite': 'Fire',
+    'Divine Smite': 'Radiant',
+    'Thunderous Smite': 'Thunder',
+    'Guiding Bolt': 'Radiant',
+}
+
+_STRING_CODE = 0
+_HEADER = struct.Struct('<BH')
+_STRING_HEADER = struct.Struct('<BHH')   # code, id, byte length
+
+_PACKERS = {name: (code, struct.Struct('<BH' + layout), tuple(f in STRING_FIELDS for f in fields))
+            for name, (code, layout, fields) in EVENT_SCHEMAS.items()}
+_EVENT_TYPES = {code: (namedtuple(f'{name.title().replace("_", "")}Event', ('kind', 'round') + fields),
+                       struct.Struct('<' + layout), tuple(f in STRING_FIELDS for f in fields),
+                       [i for i, f in enumerate(fields) if f in FLAG_FIELDS])
+                for name, (code, layout, fields) in EVENT_SCHEMAS.items()}
+_KINDS = {code: name for name, (code, _, _) in EVENT_SCHEMAS.items()}
+
+
+class EventLogWriter:
+    """Packs events into a (gzip-compressed) binary stream."""
+
+    def __init__(self, path, compress=True, compresslevel=6, buffer_size=1 << 16):
+        self.path = path
+        self._file = gzip.open(path, 'wb', compresslevel=compresslevel) if compress else open(path, 'wb')
+        self._file.write(MAGIC)
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+        self._strings = {None: 0}
+        self.round = 0
+        self.events = 0
+
+    def _string_id(self, value):
+        key = value if value is None else str(value)
+        string_id = self._strings.get(key)
+        if string_id is None:
+            string_id = self._strings[key] = len(self._strings)
+            encoded = key.encode('utf-8')
+            self._buffer += _STRING_HEADER.pack(_STRING_CODE, string_id, len(encoded))
+            self._buffer += encoded
+        return string_id
+
+    def write(self, kind, *values):
+        code, packer, is_string = _PACKERS[kind]
+        fields = [self._string_id(v) if s else int(v) for v, s in zip(values, is_string)]
+        self._buffer += packer.pack(code, self.round, *fields)
+        self.events += 1
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _open(path):
+    with open(path, 'rb') as f:
+        compressed = f.read(2) == b'\x1f\x8b'
+    return gzip.open(path, 'rb') if compressed else open(path, 'rb')
+
+
+def read_events(path, kinds=None):
+    """Lazily yield events from a log, optionally only those whose kind is in kinds."""
+    strings = {0: None}
+    with _open(path) as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a combat event log")
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            code, number = _HEADER.unpack(header)
+            if code == _STRING_CODE:
+                (length,) = struct.unpack('<H', f.read(2))
+                strings[number] = f.read(length).decode('utf-8')
+                continue
+            event_type, body, is_string, flags = _EVENT_TYPES[code]
+            kind = _KINDS[code]
+            values = body.unpack(f.read(body.size))
+            if kinds is not None and kind not in kinds:
+                continue
+            values = [strings[v] if s else v for v, s in zip(values, is_string)]
+            for index in flags:
+                values[index] = bool(values[index])
+            if kind == 'attack':
+                values[-1] = ATTACK_OUTCOMES[values[-1]]
+            yield event_type(kind, number, *values)
+
+
+def attack_outcome(hit, critical):
+    """Outcome code for an 'attack' event."""
+    return (2 if critical else 1) if hit else 0
+
+
+def damage_type_of(attacker, source):
+    """Best-known damage type for a damage ledger source (weapon or spell name)."""
+    if source in SPELL_DAMAGE_TYPES:
+        return SPELL_DAMAGE_TYPES[source]
+    primary = getattr(attacker, 'equipped_weapon', None)
+    if source == 'Weapon' and primary is not None:
+        return primary.damage_type
+    for weapon in (primary, getattr(attacker, 'secondary_weapon', None)):
+        if weapon is not None and weapon.name == source:
+            return weapon.damage_type
+    return None
+
+
+# Boolean flags the combat code sets for conditions, and the name each is logged under
+CONDITION_FLAGS = (('is_grappled', 'Grappled'), ('is_restrained', 'Restrained'), ('is_prone', 'Prone'))
+
+
+def creature_state(creature):
+    """(position, conditions, grappler name) - what log_state_changes compares between turns."""
+    conditions = {name for flag, name in CONDITION_FLAGS if getattr(creature, flag, False)}
+    conditions.update(effect.name for effect in getattr(creature, 'active_effects', []))
+    grappler = getattr(creature, 'grappler', None) if getattr(creature, 'is_grappled', False) else None
+    return getattr(creature, 'position', 0), conditions, getattr(grappler, 'name', None)
+
+
+def log_state_changes(combatants, before):
+    """
+    Log the moves, conditions and grapples that changed since before (a list
+    of creature_state snapshots taken in the same order); returns the new
+    snapshots. Combat calls this after every turn, so state changed on
+    another creature's turn (a grapple broken by a death) is caught too.
+    """
+    after = [creature_state(c) for c in combatants]
+    for creature, (old_position, old_conditions, old_grappler), (position, conditions, grappler) in zip(
+            combatants, before, after):
+        if position != old_position:
+            log_event('move', creature.name, old_position, position)
+        for condition in sorted(conditions - old_conditions):
+            log_event('condition', creature.name, condition, True)
+        for condition in sorted(old_conditions - conditions):
+            log_event('condition', creature.name, condition, False)
+        if grappler != old_grappler:
+            if old_grappler is not None:
+                log_event('grapple', old_grappler, creature.name, False)
+            if grappler is not None:
+                log_event('grapple', grappler, creature.name, True)
+    return after
+
+
+def make_event(kind, number, values):
+    """The namedtuple read_events would yield for an event logged with these values."""
+    event_type = _EVENT_TYPES[EVENT_SCHEMAS[kind][0]][0]
+    values = list(values)
+    if kind == 'attack':
+        values[-1] = ATTACK_OUTCOMES[values[-1]]
+    return event_type(kind, number, *values)
+
+
+# --- The active log the combat code writes to ---
+
+_writer = None
+
+
+class EventSink:
+    """One fight's live events (make_event namedtuples) and the round it is in."""
+
+    def __init__(self):
+        self.events = []
+        self.round = 0
+
+    def take(self):
+        """The events collected since the last take."""
+        events, self.events = self.events, []
+        return events
+
+
+_sink = contextvars.ContextVar('event_sink', default=None)
+
+
+@contextmanager
+def use_event_sink(sink):
+    """Send events logged inside the block to sink (as well as to any open log)."""
+    token = _sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _sink.reset(token)
+
+
+def open_event_log(path, compress=True):
+    """Start logging combat events to path (closing any open log)."""
+    global _writer
+    close_event_log()
+    _writer = EventLogWriter(path, compress)
+    return _writer
+
+
+def close_event_log():
+    global _writer
+    if _writer is not None:
+        _writer.close()
+        _writer = None
+
+
+def event_log_active():
+    return _writer is not None or _sink.get() is not None
+
+
+def set_event_round(number):
+    sink = _sink.get()
+    if sink is not None:
+        sink.round = number
+    if _writer is not None:
+        _writer.round = number
+
+
+def log_event(kind, *values):
+    """Record one event (fields in EVENT_SCHEMAS order); does nothing when no log is open."""
+    if _writer is not None:
+        _writer.write(kind, *values)
+    sink = _sink.get()
+    if sink is not None:
+        sink.events.append(make_event(kind, sink.round, values))
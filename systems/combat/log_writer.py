@@ -0,0 +1,112 @@
+# File: systems/combat/log_writer.py
+"""
+Asynchronous buffered writer for the combat log.
+
+The fight narrates itself with print, and every print is a synchronous
+write to stdout - at terminal speed, a verbose fight spends most of its
+time waiting on the console. AsyncLogWriter is a file-like object that
+queues the text instead and lets a background thread join it into large
+writes. The queue is bounded: when the thread falls behind, print blocks
+until there is room again, so memory stays flat however fast the fight
+runs.
+
+    with buffered_output():
+        combat_simulation(combatants)      # prints go through the writer
+
+Everything is written, in order, by the time the block exits.
+"""
+
+import io
+import queue
+import sys
+import threading
+from contextlib import contextmanager, redirect_stdout
+
+
+_STOP = object()
+
+
+class AsyncLogWriter(io.TextIOBase):
+    """Queues writes for a background thread that passes them on to stream in batches."""
+
+    def __init__(self, stream=None, max_pending=4096, batch_size=1024):
+        self.stream = stream if stream is not None else sys.stdout
+        self.batch_size = batch_size
+        self.batches = 0
+        self._queue = queue.Queue(max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._drain, name="combat-log-writer", daemon=True)
+        self._thread.start()
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if self.closed:
+            raise ValueError("write to a closed log writer")
+        if text:
+            self._queue.put(text)  # Blocks while the queue is full (backpressure)
+        return len(text)
+
+    def _drain(self):
+        while True:
+            item = self._queue.get()
+            chunks, waiting, stop = [], [], False
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiting.append(item)
+                else:
+                    chunks.append(item)
+                if stop or len(chunks) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if chunks and self._error is None:
+                    self.stream.write(''.join(chunks))
+                    self.batches += 1
+                if waiting or stop:
+                    self.stream.flush()
+            except Exception as error:  # Reported to the simulation on the next flush
+                self._error = error
+            for event in waiting:
+                event.set()
+            if stop:
+                return
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self):
+        """Block until everything written so far has reached the stream."""
+        if self.closed or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        self._raise_error()
+
+    def close(self):
+        if self.closed:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        super().close()  # Its flush is a no-op once the thread has stopped
+        self._raise_error()
+
+
+@contextmanager
+def buffered_output(stream=None, max_pending=4096, batch_size=1024):
+    """Send stdout through an AsyncLogWriter for the duration of the block."""
+    writer = AsyncLogWriter(stream if stream is not None else sys.stdout, max_pending, batch_size)
+    try:
+        with redirect_stdout(writer):
+            yield writer
+    finally:
+        writer.close()
@@ -2,12 +2,13 @@
 """Global saving throw system."""
 
 from core import roll_d20, get_ability_modifier
+from .event_log import log_event
 
 def make_creature_save(creature, ability, dc, proficiency_bonus=None):
     """Make a saving throw using global system."""
     print(f"--- {creature.name} makes a DC {dc} {ability.upper()} saving throw! ---")
     
-    roll_val, _ = roll_d20()
+    roll_val, _ = roll_d20(purpose='save')
     modifier = get_ability_modifier(creature.stats[ability])
     
     # Add proficiency if specified
@@ -28,5 +29,6 @@ def make_creature_save(creature, ability, dc, proficiency_bonus=None):
     print(log)
     
     success = total >= dc
+    log_event('save', creature.name, ability, roll_val, total, dc, success)
     print("Save successful!" if success else "Save failed.")
     return success
\ No newline at end of file
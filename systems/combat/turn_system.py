@@ -1,6 +1,9 @@
 # File: systems/combat/turn_system.py
 """Global turn management system."""
 
+from ai.turn_budget import start_turn_deadline
+from ai.decision_log import record_decision
+
 def execute_creature_turn(creature, combatants):
     """Execute a creature's turn using global turn system."""
     # Reset turn state
@@ -14,7 +17,8 @@ def execute_creature_turn(creature, combatants):
         return
     
     # Get AI decision
-    chosen_actions = creature.ai_brain.choose_actions(creature, combatants)
+    chosen_actions = creature.ai_brain.choose_actions(creature, combatants, deadline=start_turn_deadline())
+    record_decision(creature, chosen_actions)
     
     # Execute movement
     execute_movement_phase(creature, chosen_actions, combatants)
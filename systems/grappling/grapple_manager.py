@@ -199,6 +199,13 @@ GRAPPLE_PROFILES = {
         special_rules={'single_target_all_limbs': True}
     ),
     
+    'giant_crab': CreatureGrappleProfile(
+        creature_name="Giant Crab",
+        grapple_method="attack",
+        damage_dice="1d6",
+        range_ft=5
+    ),
+    
     'roper': CreatureGrappleProfile(
         creature_name="Roper",
         grapple_method="save",
@@ -74,7 +74,7 @@ class UniversalGrappling:
         
         print(f"{attacker.name} deals {total_damage} {damage_type.lower()} damage "
               f"({damage} [{damage_dice}] +{str_mod} [STR])")
-        target.take_damage(total_damage, attacker=attacker)
+        target.take_damage(total_damage, attacker=attacker, source=attack_name)
 
         # Apply grapple if target survives
         if target.is_alive:
@@ -172,7 +172,7 @@ class UniversalGrappling:
 
         # Make the escape attempt
         from core import roll_d20
-        escape_roll, _ = roll_d20()
+        escape_roll, _ = roll_d20(purpose='check')
         my_total = escape_roll + my_modifier
 
         # Get escape DC
@@ -249,7 +249,7 @@ class UniversalGrappling:
         
         print(f"{crusher.name} deals {total_damage} {damage_type.lower()} damage "
               f"({damage} [{damage_dice}] +{str_mod} [STR]) - GUARANTEED")
-        target.take_damage(total_damage, attacker=crusher)
+        target.take_damage(total_damage, attacker=crusher, source='Constrict')
         
         print(f"** {target.name} remains grappled and can attempt to escape on their turn! **")
         return True
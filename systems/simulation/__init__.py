@@ -0,0 +1,39 @@
+# File: systems/simulation/__init__.py
+"""
+Batch simulation tools - silent parallel fights, scenario files, replay,
+paired comparisons, variance reduction, result caching, checkpointed
+batches, early stopping, sampled tracing, a surrogate win model, AI
+parameter tuning and a local simulation service
+(python -m systems.simulation.service).
+"""
+
+from .batch import (SCENARIOS, run_silent_fight, run_fight, run_batch, run_batch_statistics, win_rate,
+                    summarize_results)
+from .statistics import BatchStatistics, RunningStats, QuantileSketch, wilson_interval
+from .comparison import compare_variants, equip_weapon, prepare_spells, Comparison
+from .replay import record_batch, replay_fight, find_trials, BatchManifest
+from .result_cache import cached_batch_statistics, ResultCache, engine_version
+from .checkpoint import run_checkpointed, Checkpoint
+from .scenario_files import load_scenario, load_scenarios, ScenarioError
+from .rare_events import importance_sample, RareEventEstimate, EVENTS
+from .sampling import estimate_metric, SampledEstimate
+from .surrogate import train_surrogate, load_surrogate, save_surrogate, encounter_features
+from .stopping import WinRateThreshold, WinRatePrecision, VariantDifference, SequentialResult, run_until
+from .tracing import run_traced_batch, EveryNth, FirstK, Outliers
+# The lockstep engine needs NumPy; import it from systems.simulation.lockstep
+from .tuning import tune_ai_parameters, TuningResult
+
+__all__ = ['SCENARIOS', 'run_silent_fight', 'run_fight', 'run_batch', 'run_batch_statistics', 'win_rate',
+           'summarize_results',
+           'BatchStatistics', 'RunningStats', 'QuantileSketch', 'wilson_interval',
+           'compare_variants', 'equip_weapon', 'prepare_spells', 'Comparison',
+           'record_batch', 'replay_fight', 'find_trials', 'BatchManifest',
+           'cached_batch_statistics', 'ResultCache', 'engine_version',
+           'run_checkpointed', 'Checkpoint',
+           'load_scenario', 'load_scenarios', 'ScenarioError',
+           'importance_sample', 'RareEventEstimate', 'EVENTS',
+           'estimate_metric', 'SampledEstimate',
+           'train_surrogate', 'load_surrogate', 'save_surrogate', 'encounter_features',
+           'WinRateThreshold', 'WinRatePrecision', 'VariantDifference', 'SequentialResult', 'run_until',
+           'run_traced_batch', 'EveryNth', 'FirstK', 'Outliers',
+           'tune_ai_parameters', 'TuningResult']
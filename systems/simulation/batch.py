@@ -0,0 +1,250 @@
+# File: systems/simulation/batch.py
+"""
+Silent batched fights.
+
+Runs many independent combats with logging suppressed, one seed per fight,
+optionally spread over worker processes. Scenarios are module-level
+factories so they can be sent to worker processes by name.
+
+Each process calls a scenario's factory once and clones every fight's
+combatants from the result (see Character.spawn), so factories must not
+roll dice or otherwise differ from call to call.
+"""
+
+import io
+import multiprocessing
+import random
+from contextlib import redirect_stdout
+
+from combat import combat_simulation
+from core import seed_dice, tilt_dice, likelihood_ratio
+from ai.decision_log import start_decision_log, stop_decision_log
+from systems.combat.event_log import open_event_log, close_event_log, log_event
+from systems.combat.log_writer import buffered_output
+from ai.group_blackboard import clear_group_blackboards
+from ai.decision_cache import get_default_decision_cache
+from ai.parameters import AI_PARAMETERS, apply_ai_parameters
+from .statistics import BatchStatistics
+
+
+# Fights that outlast this are scored as draws
+DEFAULT_MAX_ROUNDS = 50
+
+
+def _make_fighter(position=0):
+    from characters.base_character import Character
+    from equipment.weapons.martial_melee import longsword
+    return Character("Fighter", 3, 28, {'str': 16, 'dex': 10, 'con': 14, 'int': 8, 'wis': 12, 'cha': 15},
+                     longsword, position=position)
+
+
+def fighter_vs_goblin():
+    from enemies import Goblin
+    return [_make_fighter(), Goblin(position=40)]
+
+
+def fighter_vs_goblin_pack():
+    from enemies import Goblin
+    return [_make_fighter()] + [Goblin(f"Goblin {i + 1}", position=30 + 5 * i) for i in range(3)]
+
+
+def fighter_vs_hobgoblin():
+    from enemies import HobgoblinWarrior
+    return [_make_fighter(), HobgoblinWarrior(position=40)]
+
+
+def fighter_vs_snake():
+    from enemies import GiantConstrictorSnake
+    return [_make_fighter(), GiantConstrictorSnake(position=40)]
+
+
+def paladin_vs_snake():
+    from characters.paladin import Paladin
+    from characters.subclasses.paladin_oaths import OathOfGlory
+    from enemies import GiantConstrictorSnake
+    from equipment.armor.heavy import chain_mail
+    from equipment.armor.shields import shield
+    from equipment.weapons.longswords import plus_one_longsword
+    from spells.level_1.cure_wounds import cure_wounds
+    from spells.level_1.searing_smite import searing_smite
+
+    paladin = Paladin(name="Artus", level=3, hp=28,
+                      stats={'str': 16, 'dex': 10, 'con': 14, 'int': 8, 'wis': 12, 'cha': 15},
+                      weapon=plus_one_longsword, armor=chain_mail, shield=shield,
+                      oath=OathOfGlory(), position=0, xp=0)
+    paladin.prepare_spells([cure_wounds, searing_smite])
+    return [paladin, GiantConstrictorSnake(position=40)]
+
+
+SCENARIOS = {
+    'fighter_vs_goblin': fighter_vs_goblin,
+    'fighter_vs_goblin_pack': fighter_vs_goblin_pack,
+    'fighter_vs_hobgoblin': fighter_vs_hobgoblin,
+    'fighter_vs_snake': fighter_vs_snake,
+}
+
+
+def _paladin_available():
+    try:
+        import characters.paladin
+        import characters.subclasses.paladin_oaths
+    except ImportError:
+        return False
+    return True
+
+
+# Only offered when the Paladin (and its spells) can be imported
+if _paladin_available():
+    SCENARIOS['paladin_vs_snake'] = paladin_vs_snake
+
+
+# Prototype combatants by scenario, built on first use in each process
+_prototypes = {}
+MAX_PROTOTYPE_SCENARIOS = 64
+
+
+def spawn_combatants(scenario):
+    """Fresh combatants for one fight of scenario (a SCENARIOS name or a factory), cloned from its prototypes."""
+    prototypes = _prototypes.get(scenario)
+    if prototypes is None:
+        if len(_prototypes) >= MAX_PROTOTYPE_SCENARIOS:
+            _prototypes.clear()
+        prototypes = _prototypes[scenario] = (SCENARIOS[scenario] if isinstance(scenario, str) else scenario)()
+    return [combatant.spawn() for combatant in prototypes]
+
+
+def run_silent_fight(scenario, seed, parameters=None, max_rounds=DEFAULT_MAX_ROUNDS, transform=None,
+                     forced_d20s=None, tilt=None):
+    """
+    Run one fight with all output suppressed; returns combat_simulation's summary.
+    scenario is a name from SCENARIOS or a picklable factory returning the
+    combatants; transform, if given, rewrites the combatant list before the
+    fight; forced_d20s fixes the opening d20s per purpose (see core.seed_dice) and
+    tilt biases each faction's attack and damage rolls (see core.tilt_dice),
+    adding the fight's 'likelihood_ratio' to the summary.
+    """
+    return run_fight(scenario, seed, parameters, max_rounds, transform, forced_d20s, tilt)
+
+
+def run_fight(scenario, seed, parameters=None, max_rounds=DEFAULT_MAX_ROUNDS, transform=None,
+              forced_d20s=None, tilt=None, verbose=False, decisions=False, event_log=None):
+    """
+    run_silent_fight with the options a replay needs: verbose keeps the
+    fight's log on stdout, decisions adds the AI decision log (see
+    ai.decision_log) to the summary as 'decisions', and event_log is a path
+    to write the fight's binary event log to (see
+    systems.combat.event_log). The dice don't depend on any of these, so a
+    verbose re-run plays out exactly like the silent one.
+    """
+    saved = dict(AI_PARAMETERS)
+    if parameters:
+        apply_ai_parameters(parameters)
+        # Cached decisions were made under other thresholds
+        cache = get_default_decision_cache()
+        if cache is not None:
+            cache.clear()
+    try:
+        random.seed(seed)
+        # Per-purpose dice streams, so variants of a scenario share their rolls (see comparison.py)
+        seed_dice(seed, forced_d20s)
+        tilt_dice(tilt)
+        clear_group_blackboards()
+        if decisions:
+            start_decision_log()
+        if event_log is not None:
+            open_event_log(event_log)
+            log_event('fight_start', seed)
+        with buffered_output() if verbose else redirect_stdout(io.StringIO()):
+            combatants = spawn_combatants(scenario)
+            if transform is not None:
+                combatants = transform(combatants)
+            result = combat_simulation(combatants, max_rounds=max_rounds)
+        log_event('fight_end', result['victor'], result['rounds'])
+        if tilt:
+            result['likelihood_ratio'] = likelihood_ratio()
+    finally:
+        decision_log = stop_decision_log()
+        close_event_log()
+        tilt_dice(None)
+        seed_dice(None)
+        apply_ai_parameters(saved)
+        if parameters:
+            # Nor were the candidate's decisions made under the restored ones
+            cache = get_default_decision_cache()
+            if cache is not None:
+                cache.clear()
+    result['seed'] = seed
+    if decisions:
+        result['decisions'] = decision_log
+    return result
+
+
+def _run_task(task):
+    return run_fight(*task)
+
+
+def run_tasks(tasks, processes=1):
+    """Run tasks (run_fight's positional arguments, from scenario and seed on), in parallel when processes > 1."""
+    if processes <= 1:
+        return [_run_task(task) for task in tasks]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_run_task, tasks, chunksize=max(1, len(tasks) // (processes * 4)))
+
+
+def run_batch(scenario, seeds, parameters=None, processes=1, max_rounds=DEFAULT_MAX_ROUNDS, transform=None):
+    """Run one silent fight per seed."""
+    return run_tasks([(scenario, seed, parameters, max_rounds, transform) for seed in seeds], processes)
+
+
+def _run_chunk(task):
+    scenario, seeds, parameters, max_rounds, transform = task
+    statistics = BatchStatistics()
+    for seed in seeds:
+        statistics.add(run_silent_fight(scenario, seed, parameters, max_rounds, transform))
+    return statistics
+
+
+def run_batch_statistics(scenario, seeds, parameters=None, processes=1, max_rounds=DEFAULT_MAX_ROUNDS,
+                         transform=None, chunk_size=256):
+    """
+    Run one silent fight per seed and return merged BatchStatistics instead
+    of a list of fights. Each worker summarizes a chunk of seeds; pass a
+    range for seeds so memory stays constant however many fights are run.
+    """
+    tasks = ((scenario, seeds[start:start + chunk_size], parameters, max_rounds, transform)
+             for start in range(0, len(seeds), chunk_size))
+    statistics = BatchStatistics()
+    if processes <= 1:
+        for task in tasks:
+            statistics.merge(_run_chunk(task))
+        return statistics
+    with multiprocessing.Pool(processes) as pool:
+        for partial in pool.imap_unordered(_run_chunk, tasks):
+            statistics.merge(partial)
+    return statistics
+
+
+def win_rate(results, side):
+    """Fraction of fights won by a faction ('party' or 'monsters')."""
+    if not results:
+        return 0.0
+    return sum(1 for r in results if r['victor'] == side) / len(results)
+
+
+def summarize_results(results):
+    """Win counts/rates per faction (None = draw), mean rounds and mean HP left per combatant."""
+    fights = len(results)
+    wins = {}
+    for result in results:
+        wins[result['victor']] = wins.get(result['victor'], 0) + 1
+    hp_totals = {}
+    for result in results:
+        for name, hp in result['hp_remaining'].items():
+            hp_totals[name] = hp_totals.get(name, 0) + hp
+    return {
+        'fights': fights,
+        'wins': wins,
+        'win_rate': {side: count / fights for side, count in wins.items()},
+        'mean_rounds': sum(r['rounds'] for r in results) / fights if fights else 0.0,
+        'mean_hp_remaining': {name: total / fights for name, total in hp_totals.items()},
+    }
@@ -0,0 +1,176 @@
+# File: systems/simulation/comparison.py
+"""
+A/B comparisons of builds and tactics with common random numbers.
+
+compare_variants runs two variants of a scenario (each a transform of its
+combatant list, e.g. a different weapon or spell preparation) on the same
+seeds. Every fight seeds per-purpose dice streams (see core.seed_dice), so
+with paired=True both variants of a trial get the same initiative, attack,
+damage and save rolls and only the change itself separates them. The
+difference is estimated from per-seed paired differences, whose variance
+is much smaller than that of two independent runs. Given a rule (e.g.
+stopping.VariantDifference), the seeds are run in chunks and the comparison
+stops as soon as the rule decides which variant is better.
+
+Usage:
+    python -m systems.simulation.comparison fighter_vs_hobgoblin --weapon-a "+1 Longsword" --weapon-b Longsword
+    python -m systems.simulation.comparison fighter_vs_hobgoblin --weapon-a "+1 Longsword" --weapon-b Longsword \
+        --fights 20000 --stop-early
+"""
+
+import argparse
+import math
+from functools import partial
+
+from .batch import DEFAULT_MAX_ROUNDS, run_batch
+from .statistics import RunningStats
+from .stopping import VariantDifference
+
+
+# --- Variants: combatants -> combatants, picklable so they run in worker processes ---
+
+def _equip_weapon(weapon, name, combatants):
+    for creature in combatants:
+        if name is None or creature.name == name:
+            creature.equipped_weapon = weapon
+            break
+    return combatants
+
+
+def equip_weapon(weapon, name=None):
+    """Variant giving `weapon` to the combatant called name (default: the first one)."""
+    return partial(_equip_weapon, weapon, name)
+
+
+def _prepare_spells(spells, name, combatants):
+    for creature in combatants:
+        if hasattr(creature, 'prepare_spells') and (name is None or creature.name == name):
+            creature.prepare_spells(list(spells))
+            break
+    return combatants
+
+
+def prepare_spells(spells, name=None):
+    """Variant changing a caster's prepared spells (e.g. Searing Smite vs Thunderous Smite)."""
+    return partial(_prepare_spells, tuple(spells), name)
+
+
+# --- Metrics: fight summary -> number ---
+
+def metric_value(result, metric, side):
+    if metric == 'win':
+        return 1.0 if result['victor'] == side else 0.0
+    if metric == 'rounds':
+        return float(result['rounds'])
+    if metric == 'hp':
+        return float(result['hp_by_faction'].get(side, 0))
+    raise ValueError(f"Unknown metric '{metric}' (use 'win', 'rounds' or 'hp')")
+
+
+class Comparison:
+    """Estimated difference (variant A - variant B) in a metric, with a normal-approximation interval."""
+
+    def __init__(self, metric, side, paired, stats_a, stats_b, differences, z=1.96, decision=None):
+        self.metric = metric
+        self.side = side
+        self.paired = paired
+        self.decision = decision  # The stopping rule's answer ('A' or 'B'), if one was given and decided
+        self.fights = stats_a.count
+        self.mean_a = stats_a.mean
+        self.mean_b = stats_b.mean
+        self.difference = stats_a.mean - stats_b.mean
+        # What the standard error would be with independent streams
+        self.independent_error = math.sqrt((stats_a.variance + stats_b.variance) / max(1, self.fights))
+        if paired:
+            self.standard_error = math.sqrt(differences.variance / max(1, self.fights))
+        else:
+            self.standard_error = self.independent_error
+        self.interval = (self.difference - z * self.standard_error, self.difference + z * self.standard_error)
+
+    @property
+    def significant(self):
+        low, high = self.interval
+        return low > 0 or high < 0
+
+    @property
+    def variance_reduction(self):
+        """How many times fewer fights the paired estimate needs for the same precision."""
+        if self.standard_error == 0:
+            return float('inf') if self.independent_error > 0 else 1.0
+        return (self.independent_error / self.standard_error) ** 2
+
+    def __str__(self):
+        low, high = self.interval
+        mode = "paired (CRN)" if self.paired else "independent"
+        return (f"{self.metric}[{self.side}] over {self.fights} fights, {mode}: "
+                f"A={self.mean_a:.4f} B={self.mean_b:.4f} A-B={self.difference:+.4f} "
+                f"[{low:+.4f}, {high:+.4f}] "
+                f"{'significant' if self.significant else 'not significant'}"
+                + (f" (variance reduced {self.variance_reduction:.1f}x)" if self.paired else "")
+                + (f", stopped: {self.decision} is better" if self.decision else ""))
+
+
+def compare_variants(scenario, variant_a, variant_b, seeds, metric='win', side='party', paired=True,
+                     processes=1, max_rounds=DEFAULT_MAX_ROUNDS, z=1.96, rule=None, chunk_size=256):
+    """
+    Run two variants of a scenario and estimate the difference in metric.
+    paired=True runs both on the same seeds (common random numbers);
+    paired=False gives variant B its own seeds, for reference. With a rule
+    (e.g. VariantDifference), seeds run chunk_size at a time and the
+    comparison stops at the first chunk after which rule.check() decides.
+    """
+    seeds = list(seeds)
+    seeds_b = seeds if paired else [seed + len(seeds) for seed in seeds]
+    step = chunk_size if rule is not None else max(1, len(seeds))
+
+    stats_a, stats_b, differences = RunningStats(), RunningStats(), RunningStats()
+    decision = None
+    for start in range(0, len(seeds), step):
+        results_a = run_batch(scenario, seeds[start:start + step], processes=processes, max_rounds=max_rounds,
+                              transform=variant_a)
+        results_b = run_batch(scenario, seeds_b[start:start + step], processes=processes, max_rounds=max_rounds,
+                              transform=variant_b)
+        for result_a, result_b in zip(results_a, results_b):
+            value_a = metric_value(result_a, metric, side)
+            value_b = metric_value(result_b, metric, side)
+            stats_a.add(value_a)
+            stats_b.add(value_b)
+            differences.add(value_a - value_b)
+        if rule is not None:
+            decision = rule.check(differences)
+            if decision is not None:
+                break
+    return Comparison(metric, side, paired, stats_a, stats_b, differences, z, decision)
+
+
+def main(argv=None):
+    from equipment.weapons import longswords, martial_melee
+
+    weapons = {w.name: w for module in (martial_melee, longswords) for w in vars(module).values()
+               if hasattr(w, 'damage_dice')}
+    parser = argparse.ArgumentParser(description="Compare two weapons on a scenario with common random numbers.")
+    parser.add_argument('scenario')
+    parser.add_argument('--weapon-a', required=True, choices=sorted(weapons))
+    parser.add_argument('--weapon-b', required=True, choices=sorted(weapons))
+    parser.add_argument('--fights', type=int, default=1000)
+    parser.add_argument('--metric', default='win', choices=['win', 'rounds', 'hp'])
+    parser.add_argument('--side', default='party')
+    parser.add_argument('--independent', action='store_true', help="Don't pair the random streams")
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--stop-early', action='store_true',
+                        help="Stop once a sequential test decides which weapon is better (--fights is the cap)")
+    parser.add_argument('--indifference', type=float, default=0.02,
+                        help="Smallest difference in the metric worth telling apart (with --stop-early)")
+    args = parser.parse_args(argv)
+
+    comparison = compare_variants(args.scenario, equip_weapon(weapons[args.weapon_a]),
+                                  equip_weapon(weapons[args.weapon_b]), range(args.fights),
+                                  metric=args.metric, side=args.side, paired=not args.independent,
+                                  processes=args.processes,
+                                  rule=VariantDifference(args.indifference) if args.stop_early else None)
+    print(comparison)
+    return comparison
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# File: systems/simulation/compiler.py
+"""
+Encounter compiler and scalar fight kernel.
+
+The object engine re-derives the same numbers every turn (ability and
+proficiency modifiers, Finesse/Ranged checks, the magic bonus from the
+weapon name, range lookups). compile_encounter does that once, flattening a
+list of combatants into per-combatant tables - attack bonus, damage dice,
+AC, saves, reach, speed and a simple AI policy code - and run_compiled runs
+a whole fight from those tables in one tight pure-Python loop.
+
+Only feature-free encounters compile (weapon attacks, no spells, grapples
+or multiattack); compile_encounter raises ValueError for anything else, so
+callers can fall back to combat_simulation.
+"""
+
+import random
+
+from core import get_ability_modifier
+from .batch import SCENARIOS, DEFAULT_MAX_ROUNDS
+from .lockstep import profile_from_creature, FINISH_HP_FRACTION
+
+
+# AI policy codes
+POLICY_MELEE = 0            # Close with the nearest enemy and attack in melee
+POLICY_SKIRMISH = 1         # Shoot while out of reach, close in to finish a wounded target
+
+ABILITIES = ('str', 'dex', 'con', 'int', 'wis', 'cha')
+
+
+class CompiledEncounter:
+    """Flat per-combatant tables; index i describes combatants[i]."""
+
+    def __init__(self, combatants):
+        self.size = len(combatants)
+        self.names = []
+        self.factions = []
+        self.max_hp = []
+        self.ac = []
+        self.initiative_mod = []
+        self.speed = []
+        self.position = []
+        self.saves = []
+        self.policy = []
+        # Attack tables: (attack bonus, damage dice sides, flat damage, reach)
+        self.melee = []
+        self.ranged = []
+
+        faction_codes = {}
+        for creature in combatants:
+            profile = profile_from_creature(creature)
+            self.names.append(creature.name)
+            self.factions.append(faction_codes.setdefault(creature.faction, len(faction_codes)))
+            self.max_hp.append(creature.max_hp)
+            self.ac.append(creature.ac)
+            self.initiative_mod.append(profile.initiative_mod)
+            self.speed.append(creature.speed)
+            self.position.append(creature.position)
+            self.saves.append(tuple(
+                get_ability_modifier(creature.stats[ability])
+                + (creature.get_proficiency_bonus() if ability in creature.save_proficiencies else 0)
+                for ability in ABILITIES
+            ))
+            self.melee.append(_attack_table(profile.melee))
+            self.ranged.append(_attack_table(profile.ranged) if profile.ranged else None)
+            self.policy.append(POLICY_SKIRMISH if profile.ranged else POLICY_MELEE)
+
+        self.faction_names = {code: name for name, code in faction_codes.items()}
+
+
+def _attack_table(attack):
+    # 2d10 + 3d4 becomes (10, 10, 4, 4, 4): one entry per die to roll
+    sides = tuple(side for count, side in attack.dice for _ in range(count))
+    return attack.attack_bonus, sides, attack.flat_damage, attack.reach
+
+
+def compile_encounter(combatants):
+    """Compile combatants into flat tables; raises ValueError for unsupported features."""
+    return CompiledEncounter(combatants)
+
+
+def run_compiled(encounter, seed, max_rounds=DEFAULT_MAX_ROUNDS):
+    """Run one fight from compiled tables; returns the same summary as combat_simulation."""
+    rnd = random.Random(seed).random
+    size = encounter.size
+    factions = encounter.factions
+    max_hp = encounter.max_hp
+    ac = encounter.ac
+    speed = encounter.speed
+    policy = encounter.policy
+    melee = encounter.melee
+    ranged = encounter.ranged
+    hp = list(max_hp)
+    position = list(encounter.position)
+
+    alive_per_faction = {}
+    for faction in factions:
+        alive_per_faction[faction] = alive_per_faction.get(faction, 0) + 1
+
+    # Stable sort on initiative, like the object engine
+    initiative = [int(rnd() * 20) + 1 + encounter.initiative_mod[i] for i in range(size)]
+    order = sorted(range(size), key=lambda i: -initiative[i])
+
+    rounds = 0
+    sides_left = len(alive_per_faction)
+    while sides_left > 1 and rounds < max_rounds:
+        rounds += 1
+        for i in order:
+            if hp[i] <= 0:
+                continue
+            faction = factions[i]
+            here = position[i]
+
+            # Nearest living enemy
+            target = -1
+            best = None
+            for j in range(size):
+                if hp[j] > 0 and factions[j] != faction:
+                    gap = here - position[j] if here > position[j] else position[j] - here
+                    if best is None or gap < best:
+                        best, target = gap, j
+            if target < 0:
+                break
+
+            bonus, dice, flat, reach = melee[i]
+            if policy[i] == POLICY_SKIRMISH and best > reach and hp[target] >= max_hp[target] * FINISH_HP_FRACTION:
+                bonus, dice, flat, _ = ranged[i]
+            elif best > reach:
+                step = min(speed[i], best - reach)
+                position[i] = here + step if position[target] > here else here - step
+                if best - step > reach:
+                    continue
+
+            d20 = int(rnd() * 20) + 1
+            if d20 + bonus < ac[target] and d20 != 20:
+                continue
+            damage = flat
+            for sides in dice:
+                damage += int(rnd() * sides) + 1
+            if d20 == 20:
+                for sides in dice:
+                    damage += int(rnd() * sides) + 1
+
+            hp[target] -= damage
+            if hp[target] <= 0:
+                hp[target] = 0
+                alive_per_faction[factions[target]] -= 1
+                if alive_per_faction[factions[target]] == 0:
+                    sides_left -= 1
+                    if sides_left <= 1:
+                        break
+
+    names = encounter.names
+    survivors = [names[i] for i in range(size) if hp[i] > 0]
+    winning = {factions[i] for i in range(size) if hp[i] > 0}
+    return {
+        'victor': encounter.faction_names[winning.pop()] if len(winning) == 1 else None,
+        'rounds': rounds,
+        'survivors': survivors,
+        'hp_remaining': {names[i]: hp[i] for i in range(size)},
+        'hp_by_faction': {name: sum(hp[i] for i in range(size) if factions[i] == code)
+                          for code, name in encounter.faction_names.items()},
+        'seed': seed,
+    }
+
+
+def run_compiled_batch(scenario, seeds, max_rounds=DEFAULT_MAX_ROUNDS):
+    """Compile a batch scenario once and run one fight per seed."""
+    encounter = compile_encounter(SCENARIOS[scenario]())
+    return [run_compiled(encounter, seed, max_rounds) for seed in seeds]
@@ -0,0 +1,264 @@
+# File: systems/simulation/equivalence.py
+"""
+Statistical equivalence between fast engines and the reference object engine.
+
+Runs combat_simulation (the reference) and an alternative engine on the same
+scenario and compares outcome distributions: the victor with a chi-square
+test, fight length and HP left per side with two-sample Kolmogorov-Smirnov
+tests. A metric diverges when the test rejects at `alpha` AND the effect
+(largest difference in victor proportions, or difference in means) exceeds
+a fixed tolerance - large batches make tiny, harmless differences
+significant, small batches make real ones noisy, so both must agree.
+
+Usage:
+    python -m systems.simulation.equivalence fighter_vs_hobgoblin compiled --fights 2000
+"""
+
+import argparse
+import math
+
+from .batch import run_batch
+
+
+# Largest tolerated effect per metric kind
+DEFAULT_TOLERANCES = {
+    'victor': 0.03,      # Difference in outcome proportions
+    'rounds': 0.25,      # Difference in mean rounds
+    'hp': 1.5,           # Difference in mean HP left per side
+}
+
+
+# --- Engines: (scenario, fights, seed) -> list of combat_simulation-style summaries ---
+
+def object_engine(scenario, fights, seed):
+    return run_batch(scenario, range(seed, seed + fights))
+
+
+def compiled_engine(scenario, fights, seed):
+    from .compiler import run_compiled_batch
+    return run_compiled_batch(scenario, range(seed, seed + fights))
+
+
+def lockstep_engine(scenario, fights, seed):
+    from .lockstep import run_lockstep_results
+    return run_lockstep_results(scenario, fights, seed)
+
+
+def mob_engine(scenario, fights, seed):
+    from enemies.mob import mobify
+    return run_batch(scenario, range(seed, seed + fights), transform=mobify)
+
+
+ENGINES = {
+    'object': object_engine,
+    'compiled': compiled_engine,
+    'lockstep': lockstep_engine,
+    'mob': mob_engine,
+}
+
+
+# --- Tests ---
+
+def _regularized_gamma_q(a, x):
+    """Upper regularized incomplete gamma Q(a, x)."""
+    if x <= 0:
+        return 1.0
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        # Series for P(a, x)
+        term = total = 1.0 / a
+        n = a
+        for _ in range(500):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * 1e-12:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Continued fraction for Q(a, x) (modified Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 500):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-12:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
+
+
+def chi_square_test(counts_a, counts_b):
+    """
+    Chi-square test of homogeneity for two category -> count dicts.
+    Returns (statistic, p_value, largest difference in proportions).
+    """
+    categories = [c for c in set(counts_a) | set(counts_b) if counts_a.get(c, 0) + counts_b.get(c, 0) > 0]
+    n_a = sum(counts_a.get(c, 0) for c in categories)
+    n_b = sum(counts_b.get(c, 0) for c in categories)
+    if n_a == 0 or n_b == 0:
+        return 0.0, 1.0, 0.0
+    total = n_a + n_b
+
+    statistic = 0.0
+    for category in categories:
+        column = counts_a.get(category, 0) + counts_b.get(category, 0)
+        for observed, row in ((counts_a.get(category, 0), n_a), (counts_b.get(category, 0), n_b)):
+            expected = row * column / total
+            statistic += (observed - expected) ** 2 / expected
+
+    effect = max(abs(counts_a.get(c, 0) / n_a - counts_b.get(c, 0) / n_b) for c in categories)
+    df = len(categories) - 1
+    if df == 0:
+        return 0.0, 1.0, effect
+    return statistic, _regularized_gamma_q(df / 2, statistic / 2), effect
+
+
+def _kolmogorov_q(lam):
+    if lam < 1e-3:
+        return 1.0
+    total = 0.0
+    for j in range(1, 101):
+        term = 2 * (-1) ** (j - 1) * math.exp(-2 * j * j * lam * lam)
+        total += term
+        if abs(term) < 1e-12:
+            break
+    return min(1.0, max(0.0, total))
+
+
+def ks_test(sample_a, sample_b):
+    """
+    Two-sample Kolmogorov-Smirnov test (asymptotic p-value; conservative for
+    discrete data such as round counts). Returns (statistic, p_value).
+    """
+    a, b = sorted(sample_a), sorted(sample_b)
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return 0.0, 1.0
+
+    d = 0.0
+    i = j = 0
+    while i < n and j < m:
+        value = min(a[i], b[j])
+        while i < n and a[i] == value:
+            i += 1
+        while j < m and b[j] == value:
+            j += 1
+        d = max(d, abs(i / n - j / m))
+
+    en = math.sqrt(n * m / (n + m))
+    return d, _kolmogorov_q((en + 0.12 + 0.11 / en) * d)
+
+
+# --- Report ---
+
+class MetricCheck:
+    """Outcome of comparing one metric."""
+
+    def __init__(self, metric, test, statistic, p_value, effect, tolerance, alpha):
+        self.metric = metric
+        self.test = test
+        self.statistic = statistic
+        self.p_value = p_value
+        self.effect = effect
+        self.tolerance = tolerance
+        self.diverges = p_value < alpha and abs(effect) > tolerance
+
+    def __repr__(self):
+        status = "DIVERGES" if self.diverges else "ok"
+        return (f"{self.metric:<22} {self.test:<10} stat={self.statistic:8.4f} p={self.p_value:6.4f} "
+                f"effect={self.effect:+8.4f} (tol {self.tolerance}) {status}")
+
+
+class EquivalenceReport:
+    """All metric checks for one scenario and engine pair."""
+
+    def __init__(self, scenario, reference, candidate, fights, checks):
+        self.scenario = scenario
+        self.reference = reference
+        self.candidate = candidate
+        self.fights = fights
+        self.checks = checks
+
+    @property
+    def diverging(self):
+        return [check.metric for check in self.checks if check.diverges]
+
+    @property
+    def passed(self):
+        return not self.diverging
+
+    def __str__(self):
+        lines = [f"=== {self.candidate} vs {self.reference} on {self.scenario} ({self.fights} fights each) ==="]
+        lines += [repr(check) for check in self.checks]
+        lines.append("EQUIVALENT" if self.passed else f"DIVERGING: {', '.join(self.diverging)}")
+        return "\n".join(lines)
+
+
+def _mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+def compare_results(reference, candidate, alpha=0.01, tolerances=None):
+    """Compare two lists of fight summaries metric by metric."""
+    tolerances = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+    checks = []
+
+    def count_victors(results):
+        counts = {}
+        for r in results:
+            counts[r['victor']] = counts.get(r['victor'], 0) + 1
+        return counts
+
+    statistic, p_value, effect = chi_square_test(count_victors(reference), count_victors(candidate))
+    checks.append(MetricCheck('victor', 'chi-square', statistic, p_value, effect, tolerances['victor'], alpha))
+
+    rounds_a = [r['rounds'] for r in reference]
+    rounds_b = [r['rounds'] for r in candidate]
+    statistic, p_value = ks_test(rounds_a, rounds_b)
+    checks.append(MetricCheck('rounds', 'KS', statistic, p_value, _mean(rounds_b) - _mean(rounds_a),
+                              tolerances['rounds'], alpha))
+
+    sides = sorted(set().union(*(r['hp_by_faction'] for r in reference + candidate)))
+    for side in sides:
+        hp_a = [r['hp_by_faction'].get(side, 0) for r in reference]
+        hp_b = [r['hp_by_faction'].get(side, 0) for r in candidate]
+        statistic, p_value = ks_test(hp_a, hp_b)
+        checks.append(MetricCheck(f'hp_left[{side}]', 'KS', statistic, p_value, _mean(hp_b) - _mean(hp_a),
+                                  tolerances['hp'], alpha))
+    return checks
+
+
+def compare_engines(scenario, candidate, fights=1000, seed=0, reference='object', alpha=0.01, tolerances=None):
+    """Run both engines on a scenario and report which metrics diverge."""
+    reference_results = ENGINES[reference](scenario, fights, seed)
+    # Independent seeds for the candidate: the engines don't share dice anyway
+    candidate_results = ENGINES[candidate](scenario, fights, seed + fights)
+    checks = compare_results(reference_results, candidate_results, alpha, tolerances)
+    return EquivalenceReport(scenario, reference, candidate, fights, checks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check a fast engine against the object engine.")
+    parser.add_argument('scenario')
+    parser.add_argument('engine', choices=sorted(ENGINES))
+    parser.add_argument('--fights', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--alpha', type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    report = compare_engines(args.scenario, args.engine, args.fights, args.seed, alpha=args.alpha)
+    print(report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# File: systems/simulation/lockstep.py
+"""
+Lockstep vectorized 1v1 fights.
+
+For simple stat-block creatures (weapon attacks only - Goblin, Hobgoblin
+Warrior, a fighter with a longsword) per-object Python execution dominates
+the cost of a batch. This engine represents B independent fights as arrays
+(HP, AC, attack bonus, damage dice, initiative, distance) and resolves each
+turn for every fight at once, with a mask for fights that are over.
+
+Rules mirror Character.attack and take_turn: natural 20 always hits and
+doubles the dice, melee attackers close at their speed before attacking,
+and a creature with a ranged weapon shoots while its target is out of reach
+unless the target is nearly dead (the Hobgoblin Warrior's close-for-the-kill
+rule). Grappling, spells, multiattack and reactions are not supported;
+profile_from_creature refuses creatures that rely on them.
+
+NumPy is only needed for this module: import it where you use it.
+"""
+
+from core import get_ability_modifier
+from systems.combat.attack_profiles import require_numpy, attack_profile_from_weapon
+from .batch import DEFAULT_MAX_ROUNDS
+
+
+# Close for melee when the target drops below this fraction of max HP
+FINISH_HP_FRACTION = 0.3
+
+
+class CombatantProfile:
+    """A simple stat-block creature for the lockstep engine."""
+
+    def __init__(self, name, faction, hp, ac, initiative_mod, melee, ranged=None, speed=30):
+        self.name = name
+        self.faction = faction
+        self.hp = hp
+        self.ac = ac
+        self.initiative_mod = initiative_mod
+        self.melee = melee
+        self.ranged = ranged
+        self.speed = speed
+
+
+def profile_from_creature(creature):
+    """Build a profile from a live creature; raises ValueError for unsupported creatures."""
+    if any(action.name == "Multiattack" for action in creature.available_actions):
+        raise ValueError(f"{creature.name}: multiattack is not supported by the lockstep engine")
+    if getattr(creature, 'spell_slots', None) or creature.available_bonus_actions:
+        raise ValueError(f"{creature.name}: spells and bonus actions are not supported by the lockstep engine")
+    if 'Ranged' in creature.equipped_weapon.properties:
+        raise ValueError(f"{creature.name}: a ranged primary weapon is not supported by the lockstep engine")
+
+    secondary = creature.secondary_weapon
+    ranged = None
+    if secondary is not None and 'Ranged' in secondary.properties:
+        ranged = attack_profile_from_weapon(creature, secondary)
+
+    return CombatantProfile(
+        name=creature.name,
+        faction=creature.faction,
+        hp=creature.max_hp,
+        ac=creature.ac,
+        initiative_mod=get_ability_modifier(creature.stats['dex']) + creature.initiative_bonus,
+        melee=attack_profile_from_weapon(creature, creature.equipped_weapon),
+        ranged=ranged,
+        speed=creature.speed,
+    )
+
+
+class _Side:
+    """Per-fight arrays for one side of the batch."""
+
+    def __init__(self, np, profile, size):
+        self.profile = profile
+        self.max_hp = profile.hp
+        self.hp = np.full(size, profile.hp, dtype=np.int64)
+
+
+def _roll_damage(np, rng, attack, crit, size):
+    damage = np.full(size, attack.flat_damage, dtype=np.int64)
+    for count, sides in attack.dice:
+        damage += rng.integers(1, sides + 1, size=(size, count)).sum(axis=1)
+        damage += np.where(crit, rng.integers(1, sides + 1, size=(size, count)).sum(axis=1), 0)
+    return damage
+
+
+def _take_turns(np, rng, attacker, defender, acting, distance):
+    """Resolve one turn for every fight where `attacker` acts (mask `acting`)."""
+    size = acting.shape[0]
+    target_nearly_dead = defender.hp < defender.max_hp * FINISH_HP_FRACTION
+
+    melee = attacker.profile.melee
+    ranged = attacker.profile.ranged
+    if ranged is not None:
+        shooting = acting & (distance > melee.reach) & ~target_nearly_dead
+    else:
+        shooting = np.zeros(size, dtype=bool)
+    closing = acting & ~shooting
+
+    # Melee attackers move up to their speed toward the target, then swing if in reach
+    movement = np.minimum(attacker.profile.speed, np.maximum(distance - melee.reach, 0))
+    distance -= np.where(closing, movement, 0)
+    swinging = closing & (distance <= melee.reach)
+
+    d20 = rng.integers(1, 21, size=size)
+    crit = d20 == 20
+    attack_bonus = np.where(shooting, ranged.attack_bonus if ranged else 0, melee.attack_bonus)
+    hit = (shooting | swinging) & ((d20 + attack_bonus >= defender.profile.ac) | crit)
+
+    damage = _roll_damage(np, rng, melee, crit, size)
+    if ranged is not None:
+        damage = np.where(shooting, _roll_damage(np, rng, ranged, crit, size), damage)
+    defender.hp -= np.where(hit, damage, 0)
+    np.maximum(defender.hp, 0, out=defender.hp)
+
+
+def run_lockstep(profile_a, profile_b, fights, seed=0, distance=40, max_rounds=DEFAULT_MAX_ROUNDS):
+    """
+    Run `fights` independent 1v1 fights between two profiles at once.
+
+    Returns per-fight arrays: 'victor' (0 = a, 1 = b, -1 = draw), 'rounds',
+    'hp_a', 'hp_b'.
+    """
+    np = require_numpy()
+    rng = np.random.default_rng(seed)
+
+    a = _Side(np, profile_a, fights)
+    b = _Side(np, profile_b, fights)
+    gap = np.full(fights, distance, dtype=np.int64)
+
+    # Ties go to the first combatant, as the object engine's stable sort does
+    a_first = (rng.integers(1, 21, fights) + profile_a.initiative_mod
+               >= rng.integers(1, 21, fights) + profile_b.initiative_mod)
+
+    rounds = np.zeros(fights, dtype=np.int64)
+    running = np.ones(fights, dtype=bool)
+    for round_number in range(1, max_rounds + 1):
+        if not running.any():
+            break
+        rounds[running] = round_number
+        for first_slot in (True, False):
+            a_acts = running & (a_first == first_slot)
+            b_acts = running & (a_first != first_slot)
+            _take_turns(np, rng, a, b, a_acts, gap)
+            _take_turns(np, rng, b, a, b_acts, gap)
+            running &= (a.hp > 0) & (b.hp > 0)
+
+    victor = np.where(b.hp <= 0, 0, np.where(a.hp <= 0, 1, -1))
+    return {'victor': victor, 'rounds': rounds, 'hp_a': a.hp, 'hp_b': b.hp}
+
+
+def summarize_lockstep(result, profile_a, profile_b):
+    """The same summary summarize_results gives for object-engine fights."""
+    victor = result['victor']
+    fights = int(victor.shape[0])
+    wins = {
+        profile_a.faction: int((victor == 0).sum()),
+        profile_b.faction: int((victor == 1).sum()),
+        None: int((victor == -1).sum()),
+    }
+    return {
+        'fights': fights,
+        'wins': wins,
+        'win_rate': {side: count / fights for side, count in wins.items()} if fights else {},
+        'mean_rounds': float(result['rounds'].mean()) if fights else 0.0,
+        'mean_hp_remaining': {
+            profile_a.name: float(result['hp_a'].mean()) if fights else 0.0,
+            profile_b.name: float(result['hp_b'].mean()) if fights else 0.0,
+        },
+    }
+
+
+def _run_scenario(scenario, fights, seed, max_rounds):
+    from .batch import SCENARIOS
+    combatants = SCENARIOS[scenario]()
+    if len(combatants) != 2:
+        raise ValueError(f"Scenario '{scenario}' is not a 1v1 fight")
+    a, b = combatants
+    profile_a, profile_b = profile_from_creature(a), profile_from_creature(b)
+    result = run_lockstep(profile_a, profile_b, fights, seed=seed,
+                          distance=abs(a.position - b.position), max_rounds=max_rounds)
+    return result, profile_a, profile_b
+
+
+def run_lockstep_scenario(scenario, fights, seed=0, max_rounds=DEFAULT_MAX_ROUNDS):
+    """Run a 1v1 batch scenario (see batch.SCENARIOS) on the lockstep engine."""
+    return summarize_lockstep(*_run_scenario(scenario, fights, seed, max_rounds))
+
+
+def run_lockstep_results(scenario, fights, seed=0, max_rounds=DEFAULT_MAX_ROUNDS):
+    """Like run_lockstep_scenario, but one combat_simulation-style summary per fight."""
+    result, profile_a, profile_b = _run_scenario(scenario, fights, seed, max_rounds)
+    victors = {0: profile_a.faction, 1: profile_b.faction, -1: None}
+    fights_out = []
+    for victor, rounds, hp_a, hp_b in zip(result['victor'].tolist(), result['rounds'].tolist(),
+                                          result['hp_a'].tolist(), result['hp_b'].tolist()):
+        fights_out.append({
+            'victor': victors[victor],
+            'rounds': rounds,
+            'survivors': [p.name for p, hp in ((profile_a, hp_a), (profile_b, hp_b)) if hp > 0],
+            'hp_remaining': {profile_a.name: hp_a, profile_b.name: hp_b},
+            'hp_by_faction': {profile_a.faction: hp_a, profile_b.faction: hp_b},
+        })
+    return fights_out
@@ -0,0 +1,196 @@
+# File: systems/simulation/replay.py
+"""
+Deterministic replay of batch fights.
+
+Every fight in a batch is fully determined by its seed: the master seed
+plus the trial's index (its offset), which seeds the global `random`
+generator and every per-purpose dice stream (core.seed_dice). A recording is
+a JSON-lines file whose first line is the batch manifest (scenario, master
+seed, AI parameters, round limit, transform, turn budget) and whose other
+lines are one compact outcome per trial, optionally with the AI decision
+log. replay_fight re-runs one trial with full logging and checks it against
+what was recorded, down to the first decision that differs.
+
+Usage:
+    python -m systems.simulation.replay record fighter_vs_snake nightly.jsonl --fights 1000 --decisions
+    python -m systems.simulation.replay replay nightly.jsonl 417
+"""
+
+import argparse
+import importlib
+import json
+
+from ai.turn_budget import get_turn_budget
+from .batch import DEFAULT_MAX_ROUNDS, run_fight, run_tasks
+
+
+def _transform_path(transform):
+    if transform is None:
+        return None
+    module, name = getattr(transform, '__module__', None), getattr(transform, '__qualname__', '')
+    if not module or '<' in name or '.' in name:
+        raise ValueError("Only module-level transform functions can be recorded")
+    return f"{module}:{name}"
+
+
+def _resolve_transform(path):
+    if path is None:
+        return None
+    module, name = path.split(':')
+    return getattr(importlib.import_module(module), name)
+
+
+class BatchManifest:
+    """Everything needed to re-run any trial of a batch."""
+
+    def __init__(self, scenario, master_seed, fights, parameters=None, max_rounds=DEFAULT_MAX_ROUNDS,
+                 transform=None, turn_budget=None):
+        self.scenario = scenario
+        self.master_seed = master_seed
+        self.fights = fights
+        self.parameters = parameters
+        self.max_rounds = max_rounds
+        self.transform = transform            # "module:function" or None
+        self.turn_budget = turn_budget
+
+    def trial_seed(self, trial):
+        """The seed (master seed plus stream offset) trial number `trial` ran with."""
+        if not 0 <= trial < self.fights:
+            raise IndexError(f"Trial {trial} is not in this batch of {self.fights}")
+        return self.master_seed + trial
+
+    def to_dict(self):
+        return {'scenario': self.scenario, 'master_seed': self.master_seed, 'fights': self.fights,
+                'parameters': self.parameters, 'max_rounds': self.max_rounds, 'transform': self.transform,
+                'turn_budget': self.turn_budget}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+def _outcome(result):
+    """The compact per-trial line of a recording."""
+    outcome = {'victor': result['victor'], 'rounds': result['rounds'], 'hp': result['hp_by_faction']}
+    if 'decisions' in result:
+        outcome['decisions'] = result['decisions']
+    return outcome
+
+
+def record_batch(scenario, fights, path, master_seed=0, parameters=None, processes=1,
+                 max_rounds=DEFAULT_MAX_ROUNDS, transform=None, decisions=False):
+    """Run a batch and write its manifest and per-trial outcomes to path; returns the results."""
+    if not isinstance(scenario, str):
+        raise ValueError("Only named scenarios can be recorded")
+    manifest = BatchManifest(scenario, master_seed, fights, parameters, max_rounds, _transform_path(transform),
+                             get_turn_budget())
+    tasks = [(scenario, master_seed + trial, parameters, max_rounds, transform, None, None, False, decisions)
+             for trial in range(fights)]
+    results = run_tasks(tasks, processes)
+    with open(path, 'w') as f:
+        f.write(json.dumps(manifest.to_dict()) + "\n")
+        for result in results:
+            f.write(json.dumps(_outcome(result), separators=(',', ':')) + "\n")
+    return results
+
+
+def load_recording(path):
+    """(manifest, list of per-trial outcomes) from a recording file."""
+    with open(path) as f:
+        manifest = BatchManifest.from_dict(json.loads(f.readline()))
+        outcomes = [json.loads(line) for line in f if line.strip()]
+    return manifest, outcomes
+
+
+class ReplayResult:
+    """A re-run trial and how it compares to the recording."""
+
+    def __init__(self, trial, result, recorded):
+        self.trial = trial
+        self.result = result
+        self.recorded = recorded
+        self.first_divergence = None          # Index of the first decision that differs
+        if recorded is not None and 'decisions' in recorded:
+            replayed = [list(d) for d in result['decisions']]
+            for index, (old, new) in enumerate(zip(recorded['decisions'], replayed)):
+                if old != new:
+                    self.first_divergence = index
+                    break
+            else:
+                if len(recorded['decisions']) != len(replayed):
+                    self.first_divergence = min(len(recorded['decisions']), len(replayed))
+
+    @property
+    def matches(self):
+        """True when the re-run reproduces the recorded outcome (and decisions, if logged)."""
+        if self.recorded is None:
+            return None
+        outcome = _outcome(self.result)
+        same = all(json.loads(json.dumps(outcome[key])) == self.recorded[key] for key in ('victor', 'rounds', 'hp'))
+        return same and self.first_divergence is None
+
+    def __repr__(self):
+        return (f"ReplayResult(trial={self.trial}, victor={self.result['victor']!r}, "
+                f"rounds={self.result['rounds']}, matches={self.matches})")
+
+
+def replay_fight(recording, trial, verbose=True):
+    """
+    Re-run one trial of a recorded batch (a path or a BatchManifest) with the
+    fight log on stdout; returns a ReplayResult.
+    """
+    if isinstance(recording, BatchManifest):
+        manifest, outcomes = recording, None
+    else:
+        manifest, outcomes = load_recording(recording)
+    if manifest.turn_budget is not None:
+        print(f"[REPLAY] Recorded with a {manifest.turn_budget}s turn budget: "
+              f"AI decisions depended on timing and may not reproduce")
+
+    seed = manifest.trial_seed(trial)
+    if verbose:
+        print(f"[REPLAY] {manifest.scenario} trial {trial} (seed {seed})")
+    result = run_fight(manifest.scenario, seed, manifest.parameters, manifest.max_rounds,
+                       _resolve_transform(manifest.transform), verbose=verbose, decisions=True)
+    replay = ReplayResult(trial, result, outcomes[trial] if outcomes else None)
+    if verbose and replay.matches is False:
+        where = ""
+        if replay.first_divergence is not None:
+            where = f" (first different decision: #{replay.first_divergence})"
+        print(f"[REPLAY] Trial {trial} did NOT reproduce the recorded outcome{where}")
+    return replay
+
+
+def find_trials(path, predicate):
+    """Indices of recorded trials whose outcome satisfies predicate - e.g. lambda o: o['victor'] == 'monsters'."""
+    _, outcomes = load_recording(path)
+    return [trial for trial, outcome in enumerate(outcomes) if predicate(outcome)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record batches and replay single fights from them.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    record = commands.add_parser('record')
+    record.add_argument('scenario')
+    record.add_argument('path')
+    record.add_argument('--fights', type=int, default=1000)
+    record.add_argument('--seed', type=int, default=0)
+    record.add_argument('--processes', type=int, default=1)
+    record.add_argument('--decisions', action='store_true', help="Also log every AI decision")
+    replay = commands.add_parser('replay')
+    replay.add_argument('path')
+    replay.add_argument('trial', type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        results = record_batch(args.scenario, args.fights, args.path, args.seed, processes=args.processes,
+                               decisions=args.decisions)
+        print(f"Recorded {len(results)} fights to {args.path}")
+        return results
+    replay_result = replay_fight(args.path, args.trial)
+    print(replay_result)
+    return replay_result
+
+
+if __name__ == "__main__":
+    main()
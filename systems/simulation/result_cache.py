@@ -0,0 +1,206 @@
+# File: systems/simulation/result_cache.py
+"""
+Content-addressed on-disk cache of batch results.
+
+Dashboards and tools keep asking the same question - the same scenario,
+seeds and fight count - and every answer costs a full batch. The cache
+keys a batch's merged BatchStatistics by a hash of everything that decides
+it:
+
+- the scenario as built: every combatant's stat block, equipment, prepared
+  spells and spell slots (so two names for the same encounter share an
+  entry, and editing a factory misses);
+- the AI parameters in force, the seeds, the fight count and the round
+  limit;
+- the engine version: ENGINE_VERSION plus a hash of the game's source and
+  data files (the simulation package included), so any change to code or
+  rules invalidates every entry.
+
+Entries are JSON files - never pickles, so a planted entry can at worst
+hold wrong numbers, not run code - in a per-user directory created
+private (mode 0700). The total size is bounded and the least recently used
+entries are evicted first.
+
+    cache = ResultCache()
+    statistics = cached_batch_statistics('fighter_vs_snake', 20000, seed=0, cache=cache)
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from ai.parameters import AI_PARAMETERS
+from .batch import SCENARIOS, DEFAULT_MAX_ROUNDS, run_batch_statistics
+from .statistics import BatchStatistics
+
+
+# Bump when results change in a way the source hash can't see
+ENGINE_VERSION = 2
+
+RESULT_CACHE_DIR = os.environ.get('D_SYSTEM_RESULT_CACHE', os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'd-system', 'results'))
+
+# Everything the fights depend on: the game, its data files and the batch code that seeds and scores them.
+# Scenario files are hashed into each key by content instead.
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ENGINE_SKIP = {'examples', 'grapple_test', '__pycache__', 'scenarios'}
+_ENGINE_FILES = ('.py', '.toml')
+
+_engine_hash = None
+
+
+def engine_files():
+    """Paths (relative to the repository root) of every file the engine hash covers, in hashing order."""
+    for directory, subdirectories, files in os.walk(_ROOT):
+        relative = os.path.relpath(directory, _ROOT)
+        subdirectories[:] = sorted(d for d in subdirectories if not d.startswith('.') and d not in _ENGINE_SKIP)
+        for name in sorted(files):
+            if name.endswith(_ENGINE_FILES) and not name.startswith('test_'):
+                yield os.path.normpath(os.path.join(relative, name))
+
+
+def engine_version():
+    """ENGINE_VERSION plus a hash of the engine's source and data files (computed once per process)."""
+    global _engine_hash
+    if _engine_hash is None:
+        digest = hashlib.sha256()
+        for path in engine_files():
+            digest.update(path.encode())
+            with open(os.path.join(_ROOT, path), 'rb') as f:
+                digest.update(f.read())
+        _engine_hash = digest.hexdigest()[:16]
+    return f"{ENGINE_VERSION}:{_engine_hash}"
+
+
+def _canonical(value, depth=0):
+    """A JSON-ready, deterministic description of value (objects expanded two levels deep)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v, depth) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v, depth) for v in value), key=json.dumps)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v, depth) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    kind = f"{type(value).__module__}.{type(value).__qualname__}"
+    if callable(value) and not hasattr(value, '__dict__'):
+        return getattr(value, '__qualname__', kind)
+    if depth >= 2 or not hasattr(value, '__dict__'):
+        return kind
+    return {'class': kind, **{k: _canonical(v, depth + 1) for k, v in sorted(vars(value).items())}}
+
+
+def scenario_fingerprint(scenario):
+    """Canonical description of the combatants a scenario (name or factory) builds."""
+    with redirect_stdout(io.StringIO()):
+        combatants = (SCENARIOS[scenario] if isinstance(scenario, str) else scenario)()
+    return [_canonical(combatant) for combatant in combatants]
+
+
+def cache_key(scenario, fights, seed=0, parameters=None, max_rounds=DEFAULT_MAX_ROUNDS):
+    """Hex digest identifying one batch's result."""
+    effective = dict(AI_PARAMETERS)
+    effective.update(parameters or {})
+    description = {
+        'engine': engine_version(),
+        'scenario': scenario_fingerprint(scenario),
+        'parameters': effective,
+        'seed': seed,
+        'fights': fights,
+        'max_rounds': max_rounds,
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    """A private directory of JSON results, kept under max_bytes by evicting the least recently used."""
+
+    def __init__(self, directory=RESULT_CACHE_DIR, max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """The cached JSON value, or None; a hit counts as a use for eviction."""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def get_statistics(self, key):
+        """A cached BatchStatistics, or None."""
+        state = self.get(key)
+        return BatchStatistics.from_state(state) if state is not None else None
+
+    def put_statistics(self, key, statistics):
+        self.put(key, statistics.state())
+
+    def put(self, key, value):
+        data = json.dumps(value).encode('utf-8')
+        # Write then rename, so readers never see half an entry
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(handle, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, self._path(key))
+        self.evict()
+
+    def entries(self):
+        """(path, size, last use) of every entry, least recently used first."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                path = os.path.join(self.directory, name)
+                try:
+                    status = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((path, status.st_size, status.st_mtime_ns))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            os.remove(path)
+
+
+def cached_batch_statistics(scenario, fights, seed=0, parameters=None, processes=1,
+                            max_rounds=DEFAULT_MAX_ROUNDS, cache=None):
+    """
+    run_batch_statistics over seeds seed .. seed + fights - 1, answered from
+    the cache when this exact batch has been run before under the same engine.
+    """
+    cache = cache if cache is not None else ResultCache()
+    key = cache_key(scenario, fights, seed, parameters, max_rounds)
+    statistics = cache.get_statistics(key)
+    if statistics is None:
+        statistics = run_batch_statistics(scenario, range(seed, seed + fights), parameters, processes, max_rounds)
+        cache.put_statistics(key, statistics)
+    return statistics
@@ -0,0 +1,322 @@
+# File: systems/simulation/scenario_files.py
+"""
+Scenario definition files and a batch CLI.
+
+A scenario file (TOML or JSON) describes an encounter instead of a Python
+factory: the party, the enemies, positions, equipment by its name in
+equipment/, prepared spells by their name in spells/, AI parameter
+overrides and engine options. Every reference is checked when the file is
+loaded, so a typo fails before any fight runs, with all problems listed.
+
+    name = "paladin_vs_snake"
+    max_rounds = 50                  # engine options: max_rounds, mob
+    [parameters]                     # AI parameter overrides (ai/parameters.py)
+    "paladin.retreat_hp" = 0.3
+    [[party]]
+    class = "Paladin"                # Paladin or Character
+    name = "Artus"
+    level = 3
+    hp = 28
+    stats = { str = 16, dex = 10, con = 14, int = 8, wis = 12, cha = 15 }
+    weapon = "plus_one_longsword"
+    armor = "chain_mail"
+    shield = "shield"
+    oath = "OathOfGlory"
+    spells = ["cure_wounds", "searing_smite"]
+    position = 0
+    [[enemies]]
+    type = "GiantConstrictorSnake"   # any creature exported by enemies/, or a bestiary key
+    position = 40
+    count = 1                        # several get numbered names and 5 ft spacing
+
+A directory stands for every scenario file directly inside it.
+
+Usage:
+    python -m systems.simulation.scenario_files run scenarios/ --runs 10000 --jobs 8 --seed 0 --format csv
+    python -m systems.simulation.scenario_files validate scenarios/*.toml
+"""
+
+import argparse
+import csv
+import functools
+import importlib
+import json
+import os
+import sys
+import tomllib
+
+from ai.parameters import DEFAULT_AI_PARAMETERS
+from equipment.catalog import equipment_catalog
+from .batch import DEFAULT_MAX_ROUNDS, run_batch_statistics
+
+
+CHARACTER_CLASSES = {
+    'Character': ('characters.base_character', 'Character'),
+    'Paladin': ('characters.paladin', 'Paladin'),
+}
+ABILITIES = ('str', 'dex', 'con', 'int', 'wis', 'cha')
+ENGINE_OPTIONS = {'max_rounds', 'mob', 'seed'}
+
+
+class ScenarioError(ValueError):
+    """A scenario file that can't be run; problems lists everything wrong with it."""
+
+    def __init__(self, path, problems):
+        super().__init__(f"{path}:\n  " + "\n  ".join(problems))
+        self.path = path
+        self.problems = problems
+
+
+def _spell(name):
+    for level in ('cantrips', 'level_1'):
+        try:
+            module = importlib.import_module(f"spells.{level}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name == f"spells.{level}.{name}":
+                continue
+            raise
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise LookupError(f"unknown spell {name!r}")
+
+
+def _enemy_class(name):
+    """An enemy class by name, or a bestiary stat block by key (e.g. 'wolf')."""
+    import enemies
+    if name in getattr(enemies, '__all__', ()) and name not in ('Mob', 'mobify', 'spawn_monster'):
+        return getattr(enemies, name)
+    from enemies.bestiary import get_bestiary, spawn_monster
+    if isinstance(name, str) and name in get_bestiary():
+        return functools.partial(spawn_monster, name)
+    raise LookupError(f"unknown enemy type {name!r}")
+
+
+def _oath(name):
+    from characters.subclasses import paladin_oaths
+    oath = getattr(paladin_oaths, name, None)
+    if not isinstance(oath, type):
+        raise LookupError(f"unknown oath {name!r}")
+    return oath
+
+
+def validate_scenario(definition, path='<scenario>'):
+    """Raise ScenarioError listing every problem with a scenario definition."""
+    problems = []
+    unknown = set(definition) - {'name', 'description', 'party', 'enemies', 'parameters'} - ENGINE_OPTIONS
+    if unknown:
+        problems.append(f"unknown keys: {', '.join(sorted(unknown))}")
+    for key in ('party', 'enemies'):
+        if not isinstance(definition.get(key), list) or not definition.get(key):
+            problems.append(f"'{key}' must be a non-empty list")
+    for name, value in (definition.get('parameters') or {}).items():
+        if name not in DEFAULT_AI_PARAMETERS:
+            problems.append(f"unknown AI parameter {name!r}")
+        elif not isinstance(value, (int, float)):
+            problems.append(f"AI parameter {name!r} must be a number")
+    if not isinstance(definition.get('max_rounds', DEFAULT_MAX_ROUNDS), int):
+        problems.append("max_rounds must be an integer")
+
+    weapons, armor = equipment_catalog()
+    for index, member in enumerate(definition.get('party') or []):
+        where = f"party[{index}] ({member.get('name', '?')})"
+        kind = member.get('class', 'Character')
+        if kind not in CHARACTER_CLASSES:
+            problems.append(f"{where}: unknown class {kind!r} (choose from {', '.join(CHARACTER_CLASSES)})")
+        else:
+            try:
+                importlib.import_module(CHARACTER_CLASSES[kind][0])
+            except ImportError as error:
+                problems.append(f"{where}: class {kind!r} failed to import ({error})")
+        for key in ('name', 'level', 'hp', 'stats', 'weapon'):
+            if key not in member:
+                problems.append(f"{where}: missing '{key}'")
+        stats = member.get('stats', {})
+        if not isinstance(stats, dict) or set(stats) != set(ABILITIES):
+            problems.append(f"{where}: stats must give exactly {', '.join(ABILITIES)}")
+        if 'weapon' in member and member['weapon'] not in weapons:
+            problems.append(f"{where}: unknown weapon {member['weapon']!r}")
+        for key in ('armor', 'shield'):
+            if member.get(key) is not None and member[key] not in armor:
+                problems.append(f"{where}: unknown {key} {member[key]!r}")
+        if member.get('oath') is not None:
+            try:
+                _oath(member['oath'])
+            except LookupError as error:
+                problems.append(f"{where}: {error}")
+            except ImportError as error:
+                problems.append(f"{where}: oath {member['oath']!r} failed to import ({error})")
+        if member.get('spells') and kind != 'Paladin':
+            problems.append(f"{where}: only a Paladin can prepare spells")
+        for spell in member.get('spells', []):
+            try:
+                _spell(spell)
+            except LookupError as error:
+                problems.append(f"{where}: {error}")
+            except ImportError as error:
+                problems.append(f"{where}: spell {spell!r} failed to import ({error})")
+    for index, enemy in enumerate(definition.get('enemies') or []):
+        where = f"enemies[{index}]"
+        try:
+            _enemy_class(enemy.get('type'))
+        except LookupError as error:
+            problems.append(f"{where}: {error}")
+        if not isinstance(enemy.get('count', 1), int) or enemy.get('count', 1) < 1:
+            problems.append(f"{where}: count must be a positive integer")
+    if problems:
+        raise ScenarioError(path, problems)
+
+
+class ScenarioFactory:
+    """Builds a loaded scenario's combatants; picklable, so worker processes can run it."""
+
+    def __init__(self, definition):
+        self.definition = definition
+
+    def _party_member(self, member, weapons, armor):
+        module, name = CHARACTER_CLASSES[member.get('class', 'Character')]
+        character_class = getattr(importlib.import_module(module), name)
+        kwargs = dict(name=member['name'], level=member['level'], hp=member['hp'], stats=dict(member['stats']),
+                      weapon=weapons[member['weapon']], armor=armor.get(member.get('armor')),
+                      shield=armor.get(member.get('shield')), position=member.get('position', 0))
+        if name == 'Paladin':
+            oath = member.get('oath')
+            character = character_class(oath=_oath(oath)() if oath else None, **kwargs)
+            character.prepare_spells([_spell(spell) for spell in member.get('spells', [])])
+            return character
+        return character_class(**kwargs)
+
+    def __call__(self):
+        weapons, armor = equipment_catalog()
+        combatants = [self._party_member(member, weapons, armor) for member in self.definition['party']]
+        for enemy in self.definition['enemies']:
+            enemy_class = _enemy_class(enemy['type'])
+            count = enemy.get('count', 1)
+            position = enemy.get('position', 40)
+            for i in range(count):
+                creature = enemy_class(position=position + 5 * i)
+                base = enemy.get('name', creature.name)
+                creature.name = f"{base} {i + 1}" if count > 1 else base
+                combatants.append(creature)
+        return combatants
+
+
+class Scenario:
+    """A validated scenario file: its factory, AI parameters and engine options."""
+
+    def __init__(self, definition, path):
+        validate_scenario(definition, path)
+        self.path = path
+        self.name = definition.get('name') or os.path.splitext(os.path.basename(path))[0]
+        self.description = definition.get('description', '')
+        self.factory = ScenarioFactory(definition)
+        self.parameters = dict(definition.get('parameters') or {}) or None
+        self.max_rounds = definition.get('max_rounds', DEFAULT_MAX_ROUNDS)
+        self.mob = bool(definition.get('mob', False))
+        self.seed = definition.get('seed', 0)
+
+    def run(self, runs, seed=None, processes=1):
+        """Run the scenario runs times (seeds seed .. seed + runs - 1); returns BatchStatistics."""
+        from enemies import mobify
+        seed = self.seed if seed is None else seed
+        return run_batch_statistics(self.factory, range(seed, seed + runs), self.parameters, processes,
+                                    self.max_rounds, mobify if self.mob else None)
+
+
+def load_scenario(path):
+    """Read and validate a .toml or .json scenario file."""
+    if path.endswith('.toml'):
+        with open(path, 'rb') as f:
+            try:
+                definition = tomllib.load(f)
+            except tomllib.TOMLDecodeError as error:
+                raise ScenarioError(path, [f"invalid TOML: {error}"])
+    else:
+        with open(path) as f:
+            try:
+                definition = json.load(f)
+            except ValueError as error:
+                raise ScenarioError(path, [f"invalid JSON: {error}"])
+    return Scenario(definition, path)
+
+
+def scenario_paths(paths):
+    """The given paths with each directory replaced by the .toml/.json files in it, sorted."""
+    expanded = []
+    for path in paths:
+        if os.path.isdir(path):
+            expanded.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                   if name.endswith(('.toml', '.json'))))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def load_scenarios(paths):
+    """Load every file (validating all of them before any runs); raises one ScenarioError for all problems."""
+    scenarios, problems = [], []
+    for path in scenario_paths(paths):
+        try:
+            scenarios.append(load_scenario(path))
+        except ScenarioError as error:
+            problems.extend(f"{path}: {problem}" for problem in error.problems)
+        except OSError as error:
+            problems.append(f"{path}: {error.strerror}")
+    if problems:
+        raise ScenarioError(', '.join(paths), problems)
+    return scenarios
+
+
+def _row(scenario, statistics):
+    summary = statistics.summary()
+    row = {'scenario': scenario.name, 'fights': summary['fights'],
+           'mean_rounds': round(summary['rounds'].get('mean', 0.0), 3)}
+    for side in ('party', 'monsters', None):
+        low, high = statistics.win_interval(side)
+        label = side or 'draw'
+        row[f'{label}_win_rate'] = round(statistics.win_rate(side), 4)
+        row[f'{label}_win_low'], row[f'{label}_win_high'] = round(low, 4), round(high, 4)
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and batch-run scenario files.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    validate = commands.add_parser('validate')
+    validate.add_argument('paths', nargs='+')
+    run = commands.add_parser('run')
+    run.add_argument('paths', nargs='+')
+    run.add_argument('--runs', type=int, default=1000, help="Fights per scenario")
+    run.add_argument('--jobs', type=int, default=1, help="Worker processes")
+    run.add_argument('--seed', type=int, default=None, help="First seed (default: the file's, else 0)")
+    run.add_argument('--format', choices=('table', 'json', 'csv'), default='table')
+    args = parser.parse_args(argv)
+
+    try:
+        scenarios = load_scenarios(args.paths)
+    except ScenarioError as error:
+        print(f"[SCENARIO] Invalid scenarios:\n  " + "\n  ".join(error.problems), file=sys.stderr)
+        return 2
+    if args.command == 'validate':
+        for scenario in scenarios:
+            print(f"{scenario.path}: OK ({scenario.name})")
+        return 0
+
+    rows = []
+    for scenario in scenarios:
+        rows.append(_row(scenario, scenario.run(args.runs, args.seed, args.jobs)))
+        if args.format == 'table':
+            row = rows[-1]
+            print(f"{row['scenario']:<30} {row['fights']:>7} fights  party wins {row['party_win_rate']:.1%} "
+                  f"[{row['party_win_low']:.1%}, {row['party_win_high']:.1%}]  "
+                  f"mean rounds {row['mean_rounds']:.2f}")
+    if args.format == 'json':
+        print(json.dumps(rows, indent=2))
+    elif args.format == 'csv':
+        writer = csv.DictWriter(sys.stdout, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+# File: systems/simulation/service.py
+"""
+Local simulation service.
+
+A long-running asyncio server that answers "simulate this encounter N
+times" without paying for a fresh interpreter and a full import of
+characters, spells, enemies and AI on every question. It keeps a pool of
+worker processes that have already imported everything (and built each
+scenario once), splits every request into chunks of seeds for them, and
+streams progress back as the chunks finish.
+
+The protocol is JSON-RPC 2.0, one message per line over a localhost TCP
+connection. A request may carry an id; progress arrives as 'progress'
+notifications with the same id, followed by the response:
+
+    -> {"jsonrpc": "2.0", "id": 1, "method": "simulate",
+        "params": {"scenario": "fighter_vs_snake", "fights": 20000, "seed": 0}}
+    <- {"jsonrpc": "2.0", "method": "progress", "params": {"id": 1, "done": 2048, "total": 20000}}
+    <- {"jsonrpc": "2.0", "id": 1, "result": {"fights": 20000, "wins": {...}, ...}}
+
+Identical simulate requests that arrive while one is already running are
+coalesced: they share its chunks and all get its progress and result.
+Other methods: 'scenarios' and 'ping'. With a ResultCache, repeated
+batches are answered from disk (see result_cache.py).
+
+Usage:
+    python -m systems.simulation.service --port 8765 --processes 4
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import SCENARIOS, DEFAULT_MAX_ROUNDS, _run_chunk
+from .result_cache import ResultCache, cache_key
+from .statistics import BatchStatistics
+
+
+DEFAULT_PORT = 8765
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+
+def _warm_worker():
+    """Pool initializer: import the whole game by building every scenario once."""
+    import io
+    from contextlib import redirect_stdout
+    for name, factory in SCENARIOS.items():
+        try:
+            with redirect_stdout(io.StringIO()):
+                factory()
+        except ImportError as error:
+            print(f"[SERVICE] Scenario {name} unavailable in worker: {error}", file=sys.stderr)
+
+
+class RpcError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class SimulationJob:
+    """One running batch and the clients waiting on it."""
+
+    def __init__(self, key, fights):
+        self.key = key
+        self.fights = fights
+        self.done = 0
+        self.listeners = []                    # Progress callbacks: listener(done, total)
+        self.result = asyncio.get_running_loop().create_future()
+
+
+class SimulationService:
+    """The server: a warm process pool plus the in-flight jobs keyed by request."""
+
+    def __init__(self, processes=None, chunk_size=1024, cache=None):
+        self.processes = processes or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.jobs = {}
+        self.requests = 0
+        self.coalesced = 0
+        self._pool = None
+        self._server = None
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT):
+        """Start the pool and listen; port 0 picks a free port (see self.port)."""
+        self._pool = ProcessPoolExecutor(self.processes, initializer=_warm_worker)
+        # Start the workers now rather than on the first request
+        await asyncio.gather(*(asyncio.wrap_future(self._pool.submit(time.sleep, 0))
+                               for _ in range(self.processes)))
+        self._server = await asyncio.start_server(self._handle_client, host, port, limit=1 << 20)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"[SERVICE] Listening on {host}:{self.port} with {self.processes} warm workers")
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    # --- Simulation ---
+
+    async def simulate(self, params, progress=None):
+        """Run (or join) the batch params describe; returns BatchStatistics.summary()."""
+        scenario = params.get('scenario')
+        if scenario not in SCENARIOS:
+            raise RpcError(INVALID_PARAMS, f"Unknown scenario {scenario!r}")
+        fights = params.get('fights', 1000)
+        if not isinstance(fights, int) or fights < 1:
+            raise RpcError(INVALID_PARAMS, "fights must be a positive integer")
+        seed = params.get('seed', 0)
+        parameters = params.get('parameters')
+        max_rounds = params.get('max_rounds', DEFAULT_MAX_ROUNDS)
+
+        self.requests += 1
+        key = json.dumps([scenario, fights, seed, parameters, max_rounds], sort_keys=True)
+        job = self.jobs.get(key)
+        if job is None:
+            job = self.jobs[key] = SimulationJob(key, fights)
+            asyncio.get_running_loop().create_task(self._run_job(job, scenario, seed, parameters, max_rounds))
+        else:
+            self.coalesced += 1
+        if progress is not None:
+            job.listeners.append(progress)
+        return await asyncio.shield(job.result)
+
+    async def _run_job(self, job, scenario, seed, parameters, max_rounds):
+        loop = asyncio.get_running_loop()
+        statistics = BatchStatistics()
+        try:
+            key = None
+            if self.cache is not None:
+                # The first key builds the scenario and hashes the source tree; keep that off the event loop
+                key = await loop.run_in_executor(self._pool, cache_key, scenario, job.fights, seed, parameters,
+                                                 max_rounds)
+                cached = self.cache.get_statistics(key)
+                if cached is not None:
+                    job.result.set_result(cached.summary())
+                    return
+            chunks = [loop.run_in_executor(self._pool, _run_chunk,
+                                           (scenario, range(start, min(start + self.chunk_size, seed + job.fights)),
+                                            parameters, max_rounds, None))
+                      for start in range(seed, seed + job.fights, self.chunk_size)]
+            for chunk in asyncio.as_completed(chunks):
+                partial = await chunk
+                statistics.merge(partial)
+                job.done += partial.fights
+                for listener in list(job.listeners):
+                    try:
+                        await listener(job.done, job.fights)
+                    except ConnectionError:     # That client left; the others still want the result
+                        job.listeners.remove(listener)
+            if key is not None:
+                self.cache.put_statistics(key, statistics)
+            job.result.set_result(statistics.summary())
+        except Exception as error:
+            job.result.set_exception(error)
+        finally:
+            del self.jobs[job.key]
+
+    # --- JSON-RPC over lines ---
+
+    async def _handle_client(self, reader, writer):
+        lock = asyncio.Lock()
+
+        async def send(message):
+            async with lock:
+                writer.write(json.dumps(message).encode() + b"\n")
+                await writer.drain()
+
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._dispatch(line, send))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _dispatch(self, line, send):
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                raise RpcError(PARSE_ERROR, "Parse error")
+            if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                raise RpcError(INVALID_REQUEST, "Invalid request")
+            request_id = request.get('id')
+            result = await self._call(request['method'], request.get('params') or {}, request_id, send)
+            if request_id is not None:
+                await send({'jsonrpc': '2.0', 'id': request_id, 'result': result})
+        except RpcError as error:
+            await send({'jsonrpc': '2.0', 'id': request_id, 'error': {'code': error.code, 'message': str(error)}})
+        except Exception as error:
+            await send({'jsonrpc': '2.0', 'id': request_id, 'error': {'code': -32000, 'message': repr(error)}})
+
+    async def _call(self, method, params, request_id, send):
+        if method == 'ping':
+            return 'pong'
+        if method == 'scenarios':
+            return sorted(SCENARIOS)
+        if method == 'simulate':
+            progress = None
+            if request_id is not None and params.get('progress', True):
+                async def progress(done, total):
+                    await send({'jsonrpc': '2.0', 'method': 'progress',
+                                'params': {'id': request_id, 'done': done, 'total': total}})
+            return await self.simulate(params, progress)
+        raise RpcError(METHOD_NOT_FOUND, f"Unknown method {method!r}")
+
+
+async def call(method, params=None, host='127.0.0.1', port=DEFAULT_PORT, on_progress=None):
+    """Minimal client: send one request and return its result (progress goes to on_progress)."""
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+    try:
+        writer.write(json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or {}}).encode()
+                     + b"\n")
+        await writer.drain()
+        while True:
+            message = json.loads(await reader.readline())
+            if message.get('method') == 'progress':
+                if on_progress is not None:
+                    on_progress(message['params']['done'], message['params']['total'])
+                continue
+            if 'error' in message:
+                raise RpcError(message['error']['code'], message['error']['message'])
+            return message['result']
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def _serve(host, port, processes, chunk_size, cache_dir):
+    cache = ResultCache(cache_dir) if cache_dir else None
+    service = await SimulationService(processes, chunk_size, cache).start(host, port)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve batch simulations over localhost JSON-RPC.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=1024)
+    parser.add_argument('--cache', metavar='DIR', help="Answer repeated batches from a result cache in DIR")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args.host, args.port, args.processes, args.chunk_size, args.cache))
+    except KeyboardInterrupt:
+        print("[SERVICE] Stopped")
+
+
+if __name__ == "__main__":
+    main()
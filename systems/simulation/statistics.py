@@ -0,0 +1,288 @@
+# File: systems/simulation/statistics.py
+"""
+Streaming statistics for batch runs.
+
+BatchStatistics folds fight summaries into constant-size aggregates instead
+of keeping every fight: win counts (reported with Wilson intervals), Welford
+running moments and a mergeable quantile sketch for rounds and HP left,
+damage totals by source and resources spent. Every aggregate merges
+exactly, so worker processes can each summarize their chunk and the parent
+merges the partials - memory is the same for 10^3 or 10^8 fights.
+"""
+
+import math
+
+
+def wilson_interval(successes, trials, z=1.96):
+    """Wilson score interval for a binomial proportion (default 95%)."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+class RunningStats:
+    """Welford's online mean/variance, mergeable with Chan's parallel update."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """Sample variance."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def as_dict(self):
+        return {'count': self.count, 'mean': self.mean, 'std': self.std, 'min': self.min, 'max': self.max}
+
+    def state(self):
+        """JSON-ready internal state (see from_state)."""
+        return [self.count, self.mean, self.m2, self.min, self.max]
+
+    @classmethod
+    def from_state(cls, state):
+        stats = cls()
+        stats.count, stats.mean, stats.m2, stats.min, stats.max = state
+        return stats
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch for non-negative values (DDSketch-style).
+
+    Values fall into logarithmic buckets, so any quantile is returned within
+    `relative_accuracy` of the true value. The number of buckets depends on
+    the value range, not the number of values; past max_buckets the lowest
+    buckets are collapsed together.
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value):
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        self.count += 1
+        if value == 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        return self
+
+    def _collapse(self):
+        keys = sorted(self.buckets)
+        spill = keys[:len(keys) - self.max_buckets + 1]
+        target = spill[-1]
+        self.buckets[target] = sum(self.buckets.pop(key) for key in spill[:-1]) + self.buckets[target]
+
+    def quantile(self, q):
+        """Approximate q-quantile (0 <= q <= 1); None when empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def state(self):
+        return {'relative_accuracy': self.relative_accuracy, 'max_buckets': self.max_buckets,
+                'zero_count': self.zero_count, 'count': self.count, 'buckets': sorted(self.buckets.items())}
+
+    @classmethod
+    def from_state(cls, state):
+        sketch = cls(state['relative_accuracy'], state['max_buckets'])
+        sketch.zero_count = state['zero_count']
+        sketch.count = state['count']
+        sketch.buckets = {key: count for key, count in state['buckets']}
+        return sketch
+
+
+class MetricSummary:
+    """Moments plus a quantile sketch for one metric."""
+
+    def __init__(self):
+        self.moments = RunningStats()
+        self.sketch = QuantileSketch()
+
+    def add(self, value):
+        self.moments.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def as_dict(self, quantiles=(0.05, 0.5, 0.95)):
+        summary = self.moments.as_dict()
+        summary['quantiles'] = {q: self.sketch.quantile(q) for q in quantiles}
+        return summary
+
+    def state(self):
+        return {'moments': self.moments.state(), 'sketch': self.sketch.state()}
+
+    @classmethod
+    def from_state(cls, state):
+        summary = cls()
+        summary.moments = RunningStats.from_state(state['moments'])
+        summary.sketch = QuantileSketch.from_state(state['sketch'])
+        return summary
+
+
+class BatchStatistics:
+    """Constant-memory aggregate of fight summaries (see combat_simulation)."""
+
+    def __init__(self):
+        self.fights = 0
+        self.wins = {}
+        self.rounds = MetricSummary()
+        self.hp_left = {}
+        self.damage_by_source = {}
+        self.resources_spent = {}
+
+    def add(self, result):
+        """Fold one fight summary in."""
+        self.fights += 1
+        self.wins[result['victor']] = self.wins.get(result['victor'], 0) + 1
+        self.rounds.add(result['rounds'])
+        for side, hp in result.get('hp_by_faction', {}).items():
+            self.hp_left.setdefault(side, MetricSummary()).add(hp)
+        for side, sources in result.get('damage_by_source', {}).items():
+            totals = self.damage_by_source.setdefault(side, {})
+            for source, amount in sources.items():
+                totals[source] = totals.get(source, 0) + amount
+        for side, spent in result.get('resources_spent', {}).items():
+            totals = self.resources_spent.setdefault(side, {})
+            for resource, amount in spent.items():
+                totals[resource] = totals.get(resource, 0) + amount
+        return self
+
+    def merge(self, other):
+        """Fold in another worker's partial aggregate."""
+        self.fights += other.fights
+        for side, count in other.wins.items():
+            self.wins[side] = self.wins.get(side, 0) + count
+        self.rounds.merge(other.rounds)
+        for side, summary in other.hp_left.items():
+            self.hp_left.setdefault(side, MetricSummary()).merge(summary)
+        for ledger, other_ledger in ((self.damage_by_source, other.damage_by_source),
+                                     (self.resources_spent, other.resources_spent)):
+            for side, amounts in other_ledger.items():
+                totals = ledger.setdefault(side, {})
+                for name, amount in amounts.items():
+                    totals[name] = totals.get(name, 0) + amount
+        return self
+
+    def win_rate(self, side):
+        return self.wins.get(side, 0) / self.fights if self.fights else 0.0
+
+    def win_interval(self, side, z=1.96):
+        return wilson_interval(self.wins.get(side, 0), self.fights, z)
+
+    def _per_fight(self, ledger):
+        if not self.fights:
+            return {}
+        return {side: {name: amount / self.fights for name, amount in amounts.items()}
+                for side, amounts in ledger.items()}
+
+    def summary(self, z=1.96):
+        """Report-ready dictionary of everything collected."""
+        return {
+            'fights': self.fights,
+            'wins': dict(self.wins),
+            'win_rate': {side: self.win_rate(side) for side in self.wins},
+            'win_interval': {side: self.win_interval(side, z) for side in self.wins},
+            'rounds': self.rounds.as_dict(),
+            'hp_left': {side: summary.as_dict() for side, summary in self.hp_left.items()},
+            'damage_per_fight': self._per_fight(self.damage_by_source),
+            'resources_per_fight': self._per_fight(self.resources_spent),
+        }
+
+    def state(self):
+        """Everything needed to rebuild this aggregate, as plain JSON (draws have a None side, so wins is a list)."""
+        return {
+            'fights': self.fights,
+            'wins': sorted(self.wins.items(), key=lambda item: str(item[0])),
+            'rounds': self.rounds.state(),
+            'hp_left': {side: summary.state() for side, summary in self.hp_left.items()},
+            'damage_by_source': self.damage_by_source,
+            'resources_spent': self.resources_spent,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        statistics = cls()
+        statistics.fights = state['fights']
+        statistics.wins = {side: count for side, count in state['wins']}
+        statistics.rounds = MetricSummary.from_state(state['rounds'])
+        statistics.hp_left = {side: MetricSummary.from_state(s) for side, s in state['hp_left'].items()}
+        statistics.damage_by_source = state['damage_by_source']
+        statistics.resources_spent = state['resources_spent']
+        return statistics
+
+
+def collect(results):
+    """Aggregate an iterable of fight summaries without storing them."""
+    statistics = BatchStatistics()
+    for result in results:
+        statistics.add(result)
+    return statistics
@@ -0,0 +1,171 @@
+# File: systems/simulation/stopping.py
+"""
+Sequential early stopping for Monte Carlo runs.
+
+Balance questions ("is the monsters' win rate above 60%?", "is the win rate
+known to +/-2%?", "does variant A beat variant B?") are usually settled
+long before a fixed number of fights. run_until runs fights in chunks,
+re-checks a stopping rule after every merged chunk and stops as soon as the
+rule has its answer; compare_variants (comparison.py) does the same with
+VariantDifference on the per-seed differences between two variants.
+
+In parallel only a small window of chunks is ever in flight, chunks are
+merged in seed order (never in the order workers finish), and the pool is
+terminated at the decision. A run therefore stops at the same fight with
+the same statistics whatever the number of processes, and the work wasted
+after a decision is bounded by the window.
+"""
+
+import math
+import multiprocessing
+from collections import deque
+
+from .batch import DEFAULT_MAX_ROUNDS, _run_chunk
+from .statistics import BatchStatistics
+
+
+class WinRateThreshold:
+    """
+    Wald's SPRT for "is side's win rate above threshold?".
+
+    Tests p = threshold - indifference against p = threshold + indifference
+    with error rates alpha (wrongly 'above') and beta (wrongly 'below').
+    Decides 'above' or 'below'.
+    """
+
+    def __init__(self, side, threshold, indifference=0.02, alpha=0.05, beta=0.05):
+        self.side = side
+        self.p0 = max(1e-6, threshold - indifference)
+        self.p1 = min(1 - 1e-6, threshold + indifference)
+        self.upper = math.log((1 - beta) / alpha)
+        self.lower = math.log(beta / (1 - alpha))
+
+    def log_likelihood_ratio(self, statistics):
+        wins = statistics.wins.get(self.side, 0)
+        losses = statistics.fights - wins
+        return (wins * math.log(self.p1 / self.p0)
+                + losses * math.log((1 - self.p1) / (1 - self.p0)))
+
+    def check(self, statistics):
+        llr = self.log_likelihood_ratio(statistics)
+        if llr >= self.upper:
+            return 'above'
+        if llr <= self.lower:
+            return 'below'
+        return None
+
+
+class WinRatePrecision:
+    """Stop once the Wilson interval for side's win rate is no wider than +/-half_width."""
+
+    def __init__(self, side, half_width=0.02, z=1.96, min_fights=30):
+        self.side = side
+        self.half_width = half_width
+        self.z = z
+        self.min_fights = min_fights
+
+    def check(self, statistics):
+        if statistics.fights < self.min_fights:
+            return None
+        low, high = statistics.win_interval(self.side, self.z)
+        return 'precise' if (high - low) / 2 <= self.half_width else None
+
+
+class VariantDifference:
+    """
+    Wald's SPRT for "does variant A beat variant B?" on per-seed differences (A - B) in a metric.
+
+    Tests a mean difference of -indifference against +indifference, treating
+    the differences as normal with their sample variance (so paired, common
+    random number differences decide much sooner than independent ones),
+    with error rates alpha (wrongly 'A') and beta (wrongly 'B'). Decides 'A'
+    or 'B'; checked on the RunningStats of the differences.
+    """
+
+    def __init__(self, indifference=0.02, alpha=0.05, beta=0.05, min_fights=30):
+        self.indifference = indifference
+        self.upper = math.log((1 - beta) / alpha)
+        self.lower = math.log(beta / (1 - alpha))
+        self.min_fights = min_fights
+
+    def log_likelihood_ratio(self, differences):
+        if differences.variance == 0:
+            return 0.0
+        return 2 * self.indifference * differences.count * differences.mean / differences.variance
+
+    def check(self, differences):
+        if differences.count < self.min_fights:
+            return None
+        if differences.variance == 0:
+            # Every seed gave the same difference: a constant gap decides, identical variants never do
+            return None if differences.mean == 0 else ('A' if differences.mean > 0 else 'B')
+        llr = self.log_likelihood_ratio(differences)
+        if llr >= self.upper:
+            return 'A'
+        if llr <= self.lower:
+            return 'B'
+        return None
+
+
+class SequentialResult:
+    """Statistics gathered up to the stop, and the rule's decision (None if max_fights ran out)."""
+
+    def __init__(self, statistics, decision, max_fights):
+        self.statistics = statistics
+        self.decision = decision
+        self.max_fights = max_fights
+
+    @property
+    def fights(self):
+        return self.statistics.fights
+
+    @property
+    def stopped_early(self):
+        return self.decision is not None and self.fights < self.max_fights
+
+    def __repr__(self):
+        return f"SequentialResult(decision={self.decision!r}, fights={self.fights}/{self.max_fights})"
+
+
+def run_until(scenario, rule, max_fights=100_000, seed=0, parameters=None, processes=1,
+              chunk_size=64, max_rounds=DEFAULT_MAX_ROUNDS, transform=None, window=None):
+    """
+    Run silent fights in chunks until rule.check() decides or max_fights is
+    reached. With processes > 1, at most window chunks (default two per
+    process) are in flight at once.
+    """
+    seeds = range(seed, seed + max_fights)
+    tasks = ((scenario, seeds[start:start + chunk_size], parameters, max_rounds, transform)
+             for start in range(0, max_fights, chunk_size))
+    statistics = BatchStatistics()
+    decision = None
+
+    if processes <= 1:
+        for task in tasks:
+            statistics.merge(_run_chunk(task))
+            decision = rule.check(statistics)
+            if decision is not None:
+                break
+        return SequentialResult(statistics, decision, max_fights)
+
+    window = window or 2 * processes
+    pool = multiprocessing.Pool(processes)
+    try:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.apply_async(_run_chunk, (task,)))
+            if len(pending) < window:
+                continue
+            # Oldest first, so merges follow the seeds
+            statistics.merge(pending.popleft().get())
+            decision = rule.check(statistics)
+            if decision is not None:
+                break
+        while pending and decision is None:
+            statistics.merge(pending.popleft().get())
+            decision = rule.check(statistics)
+    finally:
+        # Abandon the chunks still in flight rather than waiting for them
+        pool.terminate()
+        pool.join()
+    return SequentialResult(statistics, decision, max_fights)
@@ -0,0 +1,332 @@
+# File: systems/simulation/surrogate.py
+"""
+Surrogate win-probability model for instant encounter estimates.
+
+Simulating an encounter takes a second or more; building one interactively
+needs an answer at once. This module reduces an encounter to stat-block
+features per side (levels or XP from CR, HP, AC, attack bonus, expected
+damage per round against the other side's AC, grapplers, spell slots),
+simulates a spread of random matchups to learn P(party wins) from them with
+a regularized logistic regression, and answers queries from the fitted
+weights in a few microseconds of plain Python.
+
+Every prediction says whether the query lies inside the feature ranges the
+model was trained on; outside them, fall back to simulation.
+
+Usage:
+    python -m systems.simulation.surrogate train --matchups 200 --fights 40 --processes 4
+    python -m systems.simulation.surrogate predict fighter_vs_hobgoblin
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import random
+from contextlib import redirect_stdout
+from functools import partial
+
+from ai.group_blackboard import get_faction
+from .batch import SCENARIOS, DEFAULT_MAX_ROUNDS, run_tasks
+from systems.combat.attack_profiles import require_numpy, attack_profile_from_weapon
+
+
+SURROGATE_MODEL_FILE = os.environ.get(
+    'D_SYSTEM_SURROGATE_MODEL', os.path.join(os.path.dirname(__file__), 'surrogate_model.json'))
+
+FEATURES = (
+    'party_levels', 'party_hp', 'party_ac', 'party_attack_bonus', 'party_dpr', 'party_spell_slots',
+    'party_count', 'monster_xp', 'monster_hp', 'monster_ac', 'monster_attack_bonus', 'monster_dpr',
+    'monster_grapplers', 'monster_count', 'log_exchange',
+)
+
+# Queries may stray this far (as a fraction of the trained range) outside it before they count as out of domain
+DOMAIN_MARGIN = 0.05
+
+
+# --- Features ---
+
+def _weapon_attacks(creature):
+    """Attack profiles a creature uses per turn (both weapons when it has Multiattack)."""
+    attacks = [attack_profile_from_weapon(creature, creature.equipped_weapon)]
+    secondary = getattr(creature, 'secondary_weapon', None)
+    if secondary is not None and any(action.name == "Multiattack" for action in creature.available_actions):
+        attacks.append(attack_profile_from_weapon(creature, secondary))
+    return attacks
+
+
+def expected_damage(attack, target_ac):
+    """Average damage of one attack against an AC by Character.attack's rules (a natural 20 hits, doubling dice)."""
+    dice_average = sum(count * (sides + 1) / 2 for count, sides in attack.dice)
+    hit_chance = min(1.0, max(0.05, (21 - (target_ac - attack.attack_bonus)) / 20))
+    return hit_chance * (dice_average + attack.flat_damage) + 0.05 * dice_average
+
+
+def _is_grappler(creature):
+    weapons = (creature.equipped_weapon, getattr(creature, 'secondary_weapon', None))
+    return any(w is not None and 'Grapple' in w.properties for w in weapons) or hasattr(creature, 'grapple_target')
+
+
+def encounter_features(combatants):
+    """Feature dict for a list of combatants, 'party' faction against everyone else."""
+    party = [c for c in combatants if get_faction(c) == 'party']
+    monsters = [c for c in combatants if get_faction(c) != 'party']
+    if not party or not monsters:
+        raise ValueError("An encounter needs a party and at least one monster")
+
+    def mean(values):
+        return sum(values) / len(values)
+
+    def side(creatures, opponents):
+        opponent_ac = mean([c.ac for c in opponents])
+        attacks = [_weapon_attacks(c) for c in creatures]
+        return {
+            'hp': sum(c.max_hp for c in creatures),
+            'ac': mean([c.ac for c in creatures]),
+            'attack_bonus': mean([a[0].attack_bonus for a in attacks]),
+            'dpr': sum(expected_damage(attack, opponent_ac) for a in attacks for attack in a),
+            'count': len(creatures),
+        }
+
+    ours, theirs = side(party, monsters), side(monsters, party)
+    # How many more rounds the party outlasts the monsters by, on a log scale
+    exchange = (ours['hp'] / max(theirs['dpr'], 0.1)) / (theirs['hp'] / max(ours['dpr'], 0.1))
+    return {
+        'party_levels': sum(c.level for c in party),
+        'party_hp': ours['hp'],
+        'party_ac': ours['ac'],
+        'party_attack_bonus': ours['attack_bonus'],
+        'party_dpr': ours['dpr'],
+        'party_spell_slots': sum(sum(getattr(c, 'spell_slots', {}).values()) for c in party),
+        'party_count': ours['count'],
+        'monster_xp': sum(c.xp_value for c in monsters),
+        'monster_hp': theirs['hp'],
+        'monster_ac': theirs['ac'],
+        'monster_attack_bonus': theirs['attack_bonus'],
+        'monster_dpr': theirs['dpr'],
+        'monster_grapplers': sum(1 for c in monsters if _is_grappler(c)),
+        'monster_count': theirs['count'],
+        'log_exchange': math.log(exchange),
+    }
+
+
+# --- Random matchups for training ---
+
+def _catalogue():
+    from enemies import Goblin, HobgoblinWarrior, GiantConstrictorSnake
+    from equipment.armor import light, medium, heavy
+    from equipment.weapons import martial_melee, simple_melee, longswords
+
+    weapons = {w.name: w for w in (martial_melee.longsword, martial_melee.scimitar, simple_melee.mace,
+                                   simple_melee.greatclub, longswords.plus_one_longsword)}
+    armors = {a.name: a for a in (light.leather, medium.chain_shirt, medium.scale_mail, heavy.chain_mail)}
+    monsters = {'Goblin': Goblin, 'HobgoblinWarrior': HobgoblinWarrior, 'GiantConstrictorSnake': GiantConstrictorSnake}
+    return weapons, armors, monsters
+
+
+def build_matchup(party, monsters):
+    """
+    Combatants for a matchup spec: party is a tuple of (level, hp, strength,
+    dexterity, weapon name, armor name or None, shield), monsters a tuple of
+    (monster class name, count).
+    """
+    from characters.base_character import Character
+    from equipment.armor.shields import shield as shield_item
+
+    weapons, armors, monster_classes = _catalogue()
+    combatants = []
+    for i, (level, hp, strength, dexterity, weapon, armor, shield) in enumerate(party):
+        stats = {'str': strength, 'dex': dexterity, 'con': 14, 'int': 8, 'wis': 12, 'cha': 10}
+        combatants.append(Character(f"Fighter {i + 1}", level, hp, stats, weapons[weapon],
+                                    armor=armors[armor] if armor else None,
+                                    shield=shield_item if shield else None, position=5 * i))
+    position = 30
+    for class_name, count in monsters:
+        for j in range(count):
+            combatants.append(monster_classes[class_name](f"{class_name} {j + 1}", position=position))
+            position += 5
+    return combatants
+
+
+def random_matchups(count, seed=0):
+    """Picklable factories for `count` random party-vs-monsters matchups."""
+    weapons, armors, _ = _catalogue()
+    rng = random.Random(seed)
+    groups = [(('Goblin', 1),), (('Goblin', 2),), (('Goblin', 3),), (('Goblin', 4),),
+              (('HobgoblinWarrior', 1),), (('HobgoblinWarrior', 2),), (('GiantConstrictorSnake', 1),),
+              (('HobgoblinWarrior', 1), ('Goblin', 2))]
+    matchups = []
+    for _ in range(count):
+        party = []
+        for _ in range(rng.choice((1, 1, 2))):
+            level = rng.randint(1, 5)
+            hp = level * rng.randint(7, 11) + rng.randint(0, 6)
+            party.append((level, hp, rng.choice((14, 16, 18)), rng.choice((10, 12, 14)), rng.choice(sorted(weapons)),
+                          rng.choice([None] + sorted(armors)), rng.random() < 0.4))
+        matchups.append(partial(build_matchup, tuple(party), rng.choice(groups)))
+    return matchups
+
+
+def build_training_set(matchups, fights=40, seed=0, processes=1, max_rounds=DEFAULT_MAX_ROUNDS):
+    """Simulate each matchup; returns (features, party wins, fights) rows."""
+    tasks = [(factory, seed + i * fights + k, None, max_rounds) for i, factory in enumerate(matchups)
+             for k in range(fights)]
+    results = run_tasks(tasks, processes)
+    rows = []
+    for i, factory in enumerate(matchups):
+        with redirect_stdout(io.StringIO()):
+            features = encounter_features(factory())
+        wins = sum(1 for r in results[i * fights:(i + 1) * fights] if r['victor'] == 'party')
+        rows.append((features, wins, fights))
+    return rows
+
+
+# --- Model ---
+
+class SurrogatePrediction:
+    """P(party wins) for a query, and whether the model has seen encounters like it."""
+
+    def __init__(self, probability, out_of_domain):
+        self.probability = probability
+        self.out_of_domain = out_of_domain   # Features outside the trained range
+
+    @property
+    def in_domain(self):
+        return not self.out_of_domain
+
+    def __repr__(self):
+        note = "" if self.in_domain else f", outside training domain: {', '.join(self.out_of_domain)}"
+        return f"SurrogatePrediction(P(party wins)={self.probability:.3f}{note})"
+
+
+class WinProbabilityModel:
+    """Logistic regression on standardized encounter features."""
+
+    def __init__(self, means, scales, weights, bias, ranges, trained_on=0):
+        self.means = means
+        self.scales = scales
+        self.weights = weights
+        self.bias = bias
+        self.ranges = ranges              # feature -> (min, max) seen in training
+        self.trained_on = trained_on      # Number of simulated fights
+
+    def probability(self, features):
+        z = self.bias
+        for name in FEATURES:
+            z += self.weights[name] * (features[name] - self.means[name]) / self.scales[name]
+        if z < -30:
+            return 0.0
+        return 1 / (1 + math.exp(-z))
+
+    def out_of_domain(self, features):
+        outside = []
+        for name in FEATURES:
+            low, high = self.ranges[name]
+            margin = DOMAIN_MARGIN * (high - low)
+            if not low - margin <= features[name] <= high + margin:
+                outside.append(name)
+        return outside
+
+    def predict(self, combatants):
+        """Predict from combatants or a ready feature dict."""
+        features = combatants if isinstance(combatants, dict) else encounter_features(combatants)
+        return SurrogatePrediction(self.probability(features), self.out_of_domain(features))
+
+    def to_dict(self):
+        return {'features': list(FEATURES), 'means': self.means, 'scales': self.scales, 'weights': self.weights,
+                'bias': self.bias, 'ranges': self.ranges, 'trained_on': self.trained_on}
+
+    @classmethod
+    def from_dict(cls, data):
+        if tuple(data['features']) != FEATURES:
+            raise ValueError("Surrogate model was trained on different features; retrain it")
+        ranges = {name: tuple(bounds) for name, bounds in data['ranges'].items()}
+        return cls(data['means'], data['scales'], data['weights'], data['bias'], ranges, data.get('trained_on', 0))
+
+
+def fit_surrogate(rows, l2=1.0, iterations=50):
+    """Fit the logistic model to (features, wins, fights) rows by Newton's method."""
+    np = require_numpy()
+    x = np.array([[features[name] for name in FEATURES] for features, _, _ in rows], dtype=float)
+    wins = np.array([w for _, w, _ in rows], dtype=float)
+    fights = np.array([n for _, _, n in rows], dtype=float)
+
+    means = x.mean(axis=0)
+    scales = x.std(axis=0)
+    scales[scales == 0] = 1.0
+    design = np.hstack([np.ones((len(rows), 1)), (x - means) / scales])
+    penalty = l2 * np.eye(design.shape[1])
+    penalty[0, 0] = 0.0  # Don't shrink the intercept
+
+    beta = np.zeros(design.shape[1])
+    for _ in range(iterations):
+        p = 1 / (1 + np.exp(-design @ beta))
+        gradient = design.T @ (wins - fights * p) - penalty @ beta
+        hessian = (design * (fights * p * (1 - p))[:, None]).T @ design + penalty
+        step = np.linalg.solve(hessian, gradient)
+        beta += step
+        if np.abs(step).max() < 1e-8:
+            break
+
+    return WinProbabilityModel(
+        means={name: float(m) for name, m in zip(FEATURES, means)},
+        scales={name: float(s) for name, s in zip(FEATURES, scales)},
+        weights={name: float(b) for name, b in zip(FEATURES, beta[1:])},
+        bias=float(beta[0]),
+        ranges={name: (float(x[:, i].min()), float(x[:, i].max())) for i, name in enumerate(FEATURES)},
+        trained_on=int(fights.sum()),
+    )
+
+
+def train_surrogate(matchups=200, fights=40, seed=0, processes=1, l2=1.0):
+    """Simulate random matchups and fit a model to them."""
+    rows = build_training_set(random_matchups(matchups, seed), fights, seed, processes)
+    return fit_surrogate(rows, l2)
+
+
+def save_surrogate(model, path=SURROGATE_MODEL_FILE):
+    with open(path, 'w') as f:
+        json.dump(model.to_dict(), f, indent=2)
+    return path
+
+
+def load_surrogate(path=SURROGATE_MODEL_FILE):
+    """Load a saved model; None if there is none yet."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return WinProbabilityModel.from_dict(json.load(f))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train or query the surrogate win-probability model.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    train = commands.add_parser('train')
+    train.add_argument('--matchups', type=int, default=200)
+    train.add_argument('--fights', type=int, default=40)
+    train.add_argument('--seed', type=int, default=0)
+    train.add_argument('--processes', type=int, default=1)
+    train.add_argument('--output', default=SURROGATE_MODEL_FILE)
+    predict = commands.add_parser('predict')
+    predict.add_argument('scenario', choices=sorted(SCENARIOS))
+    predict.add_argument('--model', default=SURROGATE_MODEL_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == 'train':
+        model = train_surrogate(args.matchups, args.fights, args.seed, args.processes)
+        print(f"Trained on {model.trained_on} fights; saved to {save_surrogate(model, args.output)}")
+        return model
+
+    model = load_surrogate(args.model)
+    if model is None:
+        raise SystemExit(f"No surrogate model at {args.model}; run the train command first")
+    with redirect_stdout(io.StringIO()):
+        combatants = SCENARIOS[args.scenario]()
+    prediction = model.predict(combatants)
+    print(prediction)
+    return prediction
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# File: systems/simulation/tracing.py
+"""
+Sampled full-fidelity tracing for batches.
+
+Writing the binary event log (systems.combat.event_log) for every fight of
+a big batch is wasted effort - nobody reads a million logs. A trace policy
+picks the few fights worth keeping instead:
+
+    EveryNth(1000)                  uniform 1-in-N sample
+    FirstK(10)                      the first K trials
+    Outliers(rounds_quantile=0.99)  unexpected winners and extreme round counts
+
+EveryNth and FirstK choose trials up front, so only those fights pay for
+logging. Outliers can only judge a fight once it is over; since every fight
+is fully determined by its seed, the flagged trials are simply re-run with
+the log open afterwards (record-on-replay), and the rest of the batch runs
+silent.
+
+Usage:
+    python -m systems.simulation.tracing fighter_vs_snake traces/ --fights 10000 --every 1000 --outliers
+"""
+
+import argparse
+import os
+
+from .batch import DEFAULT_MAX_ROUNDS, run_tasks
+
+
+class EveryNth:
+    """Trace trials offset, offset + n, offset + 2n, ..."""
+
+    def __init__(self, n, offset=0):
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        self.n = n
+        self.offset = offset
+
+    def before(self, trial):
+        return trial >= self.offset and (trial - self.offset) % self.n == 0
+
+    def after(self, trial, result, results):
+        return False
+
+
+class FirstK:
+    """Trace the first k trials."""
+
+    def __init__(self, k):
+        self.k = k
+
+    def before(self, trial):
+        return trial < self.k
+
+    def after(self, trial, result, results):
+        return False
+
+
+class Outliers:
+    """
+    Trace fights that ended unexpectedly: won by a side other than victor
+    (by default the batch's most common winner; draws count as unexpected),
+    or lasting longer than rounds_above / the batch's rounds_quantile, or
+    shorter than rounds_below. limit caps how many are re-run.
+    """
+
+    def __init__(self, victor='majority', rounds_above=None, rounds_below=None, rounds_quantile=None,
+                 limit=None):
+        self.victor = victor
+        self.rounds_above = rounds_above
+        self.rounds_below = rounds_below
+        self.rounds_quantile = rounds_quantile
+        self.limit = limit
+        self._batch = None
+
+    def before(self, trial):
+        return False
+
+    def _thresholds(self, results):
+        """(expected victor, longest ordinary fight) for this batch, computed once."""
+        if self._batch is not results:
+            self._batch = results
+            expected = self.victor
+            if expected == 'majority':
+                wins = {}
+                for result in results:
+                    wins[result['victor']] = wins.get(result['victor'], 0) + 1
+                expected = max(wins, key=wins.get) if wins else None
+            longest = self.rounds_above
+            if self.rounds_quantile is not None and results:
+                rounds = sorted(result['rounds'] for result in results)
+                cut = rounds[min(len(rounds) - 1, int(self.rounds_quantile * len(rounds)))]
+                longest = cut if longest is None else min(longest, cut)
+            self._expected, self._longest = expected, longest
+        return self._expected, self._longest
+
+    def after(self, trial, result, results):
+        expected, longest = self._thresholds(results)
+        if self.victor is not None and result['victor'] != expected:
+            return True
+        if longest is not None and result['rounds'] > longest:
+            return True
+        return self.rounds_below is not None and result['rounds'] < self.rounds_below
+
+
+def trace_path(trace_dir, trial):
+    return os.path.join(trace_dir, f"trial_{trial:06d}.dsev")
+
+
+def run_traced_batch(scenario, seeds, trace_dir, policies, parameters=None, processes=1,
+                     max_rounds=DEFAULT_MAX_ROUNDS, transform=None):
+    """
+    Run one fight per seed like run_batch, writing event logs to trace_dir
+    for the trials the policies pick. Returns (results, traces), traces
+    mapping trial index to its log file; traced results also carry the
+    path as 'trace'.
+    """
+    os.makedirs(trace_dir, exist_ok=True)
+    seeds = list(seeds)
+    traced = {trial for trial in range(len(seeds)) if any(policy.before(trial) for policy in policies)}
+    tasks = [(scenario, seed, parameters, max_rounds, transform, None, None, False, False,
+              trace_path(trace_dir, trial) if trial in traced else None)
+             for trial, seed in enumerate(seeds)]
+    results = run_tasks(tasks, processes)
+
+    # Outliers are only known now: replay them with the log open
+    replays = []
+    for policy in policies:
+        picked = [trial for trial, result in enumerate(results)
+                  if trial not in traced and trial not in replays and policy.after(trial, result, results)]
+        replays.extend(picked[:getattr(policy, 'limit', None)])
+    if replays:
+        tasks = [(scenario, seeds[trial], parameters, max_rounds, transform, None, None, False, False,
+                  trace_path(trace_dir, trial)) for trial in replays]
+        for trial, replayed in zip(replays, run_tasks(tasks, processes)):
+            if replayed['rounds'] != results[trial]['rounds'] or replayed['victor'] != results[trial]['victor']:
+                print(f"[TRACE] Trial {trial} did not reproduce on replay; its trace may not match")
+        traced.update(replays)
+
+    traces = {}
+    for trial in sorted(traced):
+        traces[trial] = results[trial]['trace'] = trace_path(trace_dir, trial)
+    return results, traces
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a silent batch, keeping event logs for sampled fights.")
+    parser.add_argument('scenario')
+    parser.add_argument('trace_dir')
+    parser.add_argument('--fights', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--every', type=int, help="Trace one fight in N")
+    parser.add_argument('--first', type=int, help="Trace the first K fights")
+    parser.add_argument('--outliers', action='store_true', help="Trace unexpected winners and the longest 1%%")
+    args = parser.parse_args(argv)
+
+    policies = []
+    if args.every:
+        policies.append(EveryNth(args.every))
+    if args.first:
+        policies.append(FirstK(args.first))
+    if args.outliers:
+        policies.append(Outliers(rounds_quantile=0.99))
+    results, traces = run_traced_batch(args.scenario, range(args.seed, args.seed + args.fights), args.trace_dir,
+                                       policies, processes=args.processes)
+    print(f"Ran {len(results)} fights, traced {len(traces)} to {args.trace_dir}")
+    return results, traces
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# File: systems/simulation/tuning.py
+"""
+Automated AI parameter tuning.
+
+Searches the tunable AI parameters (ai/parameters.py) for the values that
+win the most silent fights in a scenario. Each generation samples candidate
+parameter vectors - uniformly in the first generation, then around the best
+vector so far with a shrinking step, CMA-ES style - and races them with
+successive halving: every candidate fights a small batch, the worse half is
+discarded, and the survivors fight twice as many. All candidates in a rung
+fight the same seeds, so they are compared on identical dice.
+
+Usage:
+    python -m systems.simulation.tuning fighter_vs_goblin_pack --side monsters --prefix goblin.
+"""
+
+import argparse
+import random
+
+from ai.parameters import (AI_PARAMETERS, DEFAULT_AI_PARAMETERS, PARAMETER_BOUNDS,
+                           parameter_names, save_ai_parameters, TUNED_PARAMETERS_FILE)
+from .batch import run_tasks, win_rate, DEFAULT_MAX_ROUNDS
+
+
+class TuningResult:
+    """Best parameters found plus the full evaluation history."""
+
+    def __init__(self, parameters, score, fights, history):
+        self.parameters = parameters
+        self.score = score
+        self.fights = fights
+        self.history = history
+
+    def __repr__(self):
+        return f"TuningResult(score={self.score:.3f}, fights={self.fights}, parameters={self.parameters})"
+
+
+def _clip(name, value):
+    low, high = PARAMETER_BOUNDS[name]
+    value = min(high, max(low, value))
+    if isinstance(DEFAULT_AI_PARAMETERS[name], int):
+        return int(round(value))
+    return round(value, 4)
+
+
+def _sample_uniform(names, rng):
+    return {name: _clip(name, rng.uniform(*PARAMETER_BOUNDS[name])) for name in names}
+
+
+def _sample_around(center, names, step, rng):
+    return {
+        name: _clip(name, rng.gauss(center[name], step * (PARAMETER_BOUNDS[name][1] - PARAMETER_BOUNDS[name][0])))
+        for name in names
+    }
+
+
+def _race(scenario, side, candidates, min_fights, eta, seed_base, processes, max_rounds, history):
+    """Successive halving over candidates; returns (best, score, fights used)."""
+    fights = min_fights
+    total = 0
+    while True:
+        seeds = [seed_base + i for i in range(fights)]
+        tasks = [(scenario, seed, candidate, max_rounds) for candidate in candidates for seed in seeds]
+        results = run_tasks(tasks, processes)
+        total += len(tasks)
+
+        scored = []
+        for index, candidate in enumerate(candidates):
+            score = win_rate(results[index * fights:(index + 1) * fights], side)
+            scored.append((score, index, candidate))
+            history.append({'fights': fights, 'score': score, 'parameters': candidate})
+        # Stable on ties, so earlier candidates (the incumbent) win them
+        scored.sort(key=lambda entry: (-entry[0], entry[1]))
+
+        keep = max(1, len(candidates) // eta)
+        # The last survivor gets one confirming rung; its score is the reported one
+        if len(candidates) == 1:
+            return scored[0][2], scored[0][0], total
+        print(f"[TUNING] Rung with {fights} fights/candidate: best {scored[0][0]:.1%}, "
+              f"keeping {keep} of {len(candidates)}")
+        candidates = [candidate for _, _, candidate in scored[:keep]]
+        fights *= eta
+
+
+def tune_ai_parameters(scenario, side, prefix='', candidates=16, generations=2, min_fights=8,
+                       eta=2, processes=1, seed=0, max_rounds=DEFAULT_MAX_ROUNDS):
+    """
+    Tune the parameters whose names start with prefix so that side
+    ('party' or 'monsters') wins scenario as often as possible.
+    """
+    names = parameter_names(prefix)
+    if not names:
+        raise ValueError(f"No tunable AI parameters match prefix '{prefix}'")
+
+    rng = random.Random(seed)
+    best = {name: AI_PARAMETERS[name] for name in names}
+    best_score = None
+    history = []
+    total_fights = 0
+
+    for generation in range(generations):
+        step = 0.25 * 0.5 ** (generation - 1)
+        pool = [dict(best)]
+        while len(pool) < candidates:
+            if generation == 0:
+                pool.append(_sample_uniform(names, rng))
+            else:
+                pool.append(_sample_around(best, names, step, rng))
+
+        print(f"[TUNING] Generation {generation + 1}/{generations}: racing {len(pool)} candidates")
+        # Fresh seeds each generation so the winner isn't overfitted to one set of dice
+        winner, score, fights = _race(scenario, side, pool, min_fights, eta, seed * 1_000_003 + generation * 100_003,
+                                      processes, max_rounds, history)
+        total_fights += fights
+        best, best_score = winner, score
+
+    print(f"[TUNING] Best {side} win rate in {scenario}: {best_score:.1%} after {total_fights} fights")
+    return TuningResult(best, best_score, total_fights, history)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tune AI parameters with batched silent fights.")
+    parser.add_argument('scenario')
+    parser.add_argument('--side', default='monsters', help="Faction whose win rate is maximized")
+    parser.add_argument('--prefix', default='', help="Only tune parameters with this prefix, e.g. 'goblin.'")
+    parser.add_argument('--candidates', type=int, default=16)
+    parser.add_argument('--generations', type=int, default=2)
+    parser.add_argument('--min-fights', type=int, default=8)
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=TUNED_PARAMETERS_FILE)
+    args = parser.parse_args(argv)
+
+    result = tune_ai_parameters(args.scenario, args.side, args.prefix, args.candidates, args.generations,
+                                args.min_fights, processes=args.processes, seed=args.seed)
+    parameters = dict(AI_PARAMETERS)
+    parameters.update(result.parameters)
+    path = save_ai_parameters(parameters, args.output)
+    print(f"[TUNING] Wrote {path}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
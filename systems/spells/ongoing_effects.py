@@ -21,7 +21,7 @@ def process_searing_smite_effect(creature):
         ongoing_damage += roll('1d6')
     
     print(f"** {creature.name} takes {ongoing_damage} fire damage ({dice_count}d6) from Searing Smite! **")
-    creature.take_damage(ongoing_damage, attacker=caster)
+    creature.take_damage(ongoing_damage, attacker=caster, source='Searing Smite')
     
     # Constitution saving throw to end the effect
     if creature.is_alive:
@@ -0,0 +1,65 @@
+# File: test_batch_statistics.py
+"""
+Streaming statistics tests - mergeable moments, quantile sketch, Wilson
+intervals and chunked batch aggregation.
+"""
+
+import statistics as reference
+
+from systems.simulation import (run_batch, run_batch_statistics, RunningStats, QuantileSketch,
+                                wilson_interval)
+from systems.simulation.statistics import collect
+
+
+def test_running_stats_merge_matches_single_pass():
+    """Merging partial moments equals one pass over all values."""
+    values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9]
+    left, right = RunningStats(), RunningStats()
+    for v in values[:6]:
+        left.add(v)
+    for v in values[6:]:
+        right.add(v)
+    merged = left.merge(right)
+
+    assert merged.count == len(values)
+    assert abs(merged.mean - reference.mean(values)) < 1e-12
+    assert abs(merged.variance - reference.variance(values)) < 1e-12
+    assert (merged.min, merged.max) == (1, 9)
+    print("✅ PASS: Welford merge")
+
+
+def test_quantile_sketch_accuracy_and_size():
+    """Quantiles are within the relative accuracy and memory doesn't grow with count."""
+    first, second = QuantileSketch(), QuantileSketch()
+    for value in range(1, 50001):
+        (first if value % 2 else second).add(value)
+    sketch = first.merge(second)
+
+    assert sketch.count == 50000
+    assert abs(sketch.quantile(0.5) - 25000) / 25000 <= 0.011
+    assert abs(sketch.quantile(0.99) - 49500) / 49500 <= 0.011
+    assert len(sketch.buckets) < 600
+    print("✅ PASS: Quantile sketch")
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert abs(low - 0.4038) < 1e-3 and abs(high - 0.5962) < 1e-3
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    print("✅ PASS: Wilson interval")
+
+
+def test_chunked_batch_matches_fight_list():
+    """Chunked aggregation gives the same numbers as collecting every fight."""
+    seeds = range(60)
+    streamed = run_batch_statistics('fighter_vs_snake', seeds, chunk_size=16)
+    listed = collect(run_batch('fighter_vs_snake', seeds))
+
+    assert streamed.fights == listed.fights == 60
+    assert streamed.wins == listed.wins
+    assert abs(streamed.rounds.moments.mean - listed.rounds.moments.mean) < 1e-9
+    assert streamed.damage_by_source == listed.damage_by_source
+    assert set(streamed.damage_by_source['monsters']) <= {'Bite', 'Constrict'}
+    summary = streamed.summary()
+    assert summary['resources_per_fight']['party'] == {'spell_slots': 0.0, 'lay_on_hands': 0.0}
+    print("✅ PASS: Chunked aggregation")
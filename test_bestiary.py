@@ -0,0 +1,117 @@
+# File: test_bestiary.py
+"""
+Bestiary tests - stat blocks build the same creatures as the hand-written
+classes, the compiled cache is reused until a data file changes, and
+spawned monsters fight in batches and scenario files.
+"""
+
+import os
+import shutil
+import time
+
+import pytest
+
+from enemies import Goblin, bestiary
+from enemies.bestiary import (STAT_BLOCK_DIR, BestiaryError, BestiaryMonster, _cache_path, load_bestiary,
+                              spawn_monster)
+from systems.simulation import run_batch_statistics
+
+
+def test_goblin_warrior_matches_the_goblin_class():
+    goblin, warrior = Goblin(), spawn_monster('goblin_warrior', name="Goblin", position=30)
+    assert (warrior.stats, warrior.hp, warrior.max_hp, warrior.ac, warrior.cr, warrior.speed) == \
+        (goblin.stats, goblin.hp, goblin.max_hp, goblin.ac, goblin.cr, goblin.speed)
+    assert warrior.equipped_weapon.name == goblin.equipped_weapon.name
+    assert type(warrior.ai_brain) is type(goblin.ai_brain)
+    assert warrior.position == 30
+    print("✅ PASS: goblin_warrior stat block matches Goblin")
+
+
+def test_stat_block_features():
+    wolf = spawn_monster('wolf')
+    assert (wolf.ac, wolf.speed, wolf.equipped_weapon.name) == (12, 40, 'Bite')
+    assert wolf.ai_brain.get_intelligence_tier(wolf) == 'bestial_instinct'
+    assert wolf.traits[0]['name'] == 'Pack Tactics'
+
+    crab = spawn_monster('giant_crab')
+    assert crab.grapple_profile.creature_name == "Giant Crab"
+
+    badger = spawn_monster('giant_badger')
+    assert any(action.name == "Multiattack" for action in badger.available_actions)
+    assert spawn_monster('bandit').secondary_weapon.name == "Light Crossbow"
+    print("✅ PASS: AC override, AI tier, grapple, multiattack and secondary attacks")
+
+
+def test_cache_is_reused_until_a_file_changes(tmp_path):
+    directory = tmp_path / "stat_blocks"
+    shutil.copytree(STAT_BLOCK_DIR, directory, ignore=shutil.ignore_patterns('__pycache__'))
+    first = load_bestiary(str(directory))
+    cache = _cache_path(str(directory))
+    assert os.path.exists(cache)
+
+    written = os.stat(cache).st_mtime_ns
+    assert sorted(load_bestiary(str(directory))) == sorted(first)
+    assert os.stat(cache).st_mtime_ns == written
+
+    beasts = directory / "beasts.toml"
+    beasts.write_text(beasts.read_text().replace("hp = 11\nac = 12", "hp = 20\nac = 12"))
+    os.utime(beasts, ns=(written + 10**9, written + 10**9))
+    assert load_bestiary(str(directory))['wolf'].hp == 20
+
+    (directory / "extra.toml").write_text('[rat]\nhp = 1\nstats = { str = 2 }\n')
+    with pytest.raises(BestiaryError) as error:
+        load_bestiary(str(directory))
+    assert "stats must give" in str(error.value) and "needs a weapon" in str(error.value)
+    print("✅ PASS: compiled cache reused, then rebuilt on change")
+
+
+def test_cache_is_rebuilt_when_the_equipment_code_changes(tmp_path, monkeypatch):
+    directory = tmp_path / "stat_blocks"
+    shutil.copytree(STAT_BLOCK_DIR, directory, ignore=shutil.ignore_patterns('__pycache__'))
+    weapons = tmp_path / "simple_melee.py"
+    weapons.write_text("# stands in for an equipment module\n")
+    monkeypatch.setattr(bestiary, 'equipment_sources', lambda: [str(weapons)])
+    load_bestiary(str(directory))
+    cache = _cache_path(str(directory))
+    written = os.stat(cache).st_mtime_ns
+
+    os.utime(weapons, ns=(written + 10**9, written + 10**9))
+    load_bestiary(str(directory))
+    assert os.stat(cache).st_mtime_ns != written
+    print("✅ PASS: cache rebuilt when equipment/ changes")
+
+
+def test_spawning_is_cheap():
+    spawn_monster('wolf')
+    start = time.perf_counter()
+    wolves = [spawn_monster('wolf', name=f"Wolf {i}", position=30 + 5 * i) for i in range(500)]
+    elapsed = time.perf_counter() - start
+    assert len({id(w.equipped_weapon) for w in wolves}) == 1
+    assert elapsed < 2.0
+    print(f"✅ PASS: 500 wolves in {elapsed * 1000:.0f} ms")
+
+
+def _fighter_vs_wolves():
+    from systems.simulation.batch import SCENARIOS
+    fighter = SCENARIOS['fighter_vs_goblin']()[0]
+    return [fighter] + [spawn_monster('wolf', name=f"Wolf {i}", position=30 + 5 * i) for i in range(1, 3)]
+
+
+def test_monsters_fight_in_batches():
+    statistics = run_batch_statistics(_fighter_vs_wolves, range(20))
+    assert statistics.fights == 20
+    assert all(isinstance(m, BestiaryMonster) for m in _fighter_vs_wolves()[1:])
+    print("✅ PASS: bestiary monsters fight")
+
+
+def test_scenario_files_can_name_stat_blocks(tmp_path):
+    from systems.simulation.scenario_files import load_scenario
+    path = tmp_path / "crabs.toml"
+    path.write_text(
+        '[[party]]\nclass = "Character"\nname = "Fighter"\nlevel = 3\nhp = 28\n'
+        'stats = { str = 16, dex = 12, con = 14, int = 10, wis = 10, cha = 10 }\n'
+        'weapon = "longsword"\narmor = "chain_mail"\n'
+        '[[enemies]]\ntype = "giant_crab"\ncount = 2\nposition = 30\n')
+    combatants = load_scenario(str(path)).factory()
+    assert [(c.name, c.position) for c in combatants[1:]] == [('Giant Crab 1', 30), ('Giant Crab 2', 35)]
+    print("✅ PASS: scenario files spawn stat blocks")
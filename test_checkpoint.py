@@ -0,0 +1,42 @@
+# File: test_checkpoint.py
+"""
+Checkpointed batch tests - an interrupted and resumed job ends with exactly
+the statistics of an uninterrupted one, and checkpoints refuse other jobs.
+"""
+
+import os
+
+import pytest
+
+from systems.simulation.checkpoint import Checkpoint, run_checkpointed
+
+
+def test_resumed_job_matches_uninterrupted_run(tmp_path):
+    seeds = range(100, 400)
+    whole = run_checkpointed('fighter_vs_goblin_pack', seeds, str(tmp_path / "whole.ckpt"), chunk_size=32)
+
+    path = str(tmp_path / "job.ckpt")
+    first = run_checkpointed('fighter_vs_goblin_pack', seeds, path, chunk_size=32, max_chunks=4)
+    assert first.completed == 4 and first.next_seed() == 100 + 4 * 32
+    assert Checkpoint.load(path).statistics.fights == 128
+
+    resumed = run_checkpointed('fighter_vs_goblin_pack', seeds, path, chunk_size=32, resume=True, processes=2,
+                               max_chunks=3)
+    resumed = run_checkpointed('fighter_vs_goblin_pack', seeds, path, chunk_size=32, resume=True)
+    assert resumed.next_seed() is None
+    assert resumed.statistics.summary() == whole.statistics.summary()
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith('.tmp')]
+    print("✅ PASS: resume reproduces the uninterrupted result")
+
+
+def test_checkpoints_are_not_overwritten_or_mixed_up(tmp_path):
+    path = str(tmp_path / "job.ckpt")
+    run_checkpointed('fighter_vs_goblin', range(50), path, chunk_size=10, max_chunks=1)
+
+    with pytest.raises(FileExistsError):
+        run_checkpointed('fighter_vs_goblin', range(50), path, chunk_size=10)
+    with pytest.raises(ValueError, match="seeds"):
+        run_checkpointed('fighter_vs_goblin', range(60), path, chunk_size=10, resume=True)
+    with pytest.raises(ValueError, match="scenario"):
+        run_checkpointed('fighter_vs_snake', range(50), path, chunk_size=10, resume=True)
+    print("✅ PASS: checkpoint job checks")
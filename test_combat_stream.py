@@ -0,0 +1,121 @@
+# File: test_combat_stream.py
+"""
+Streaming combat tests - iter_combat and async_iter_combat yield the fight
+turn by turn, end with the same summary combat_simulation returns, and can
+be paused or stopped between turns.
+"""
+
+import asyncio
+import io
+import random
+from contextlib import redirect_stdout
+
+from combat import iter_combat, async_iter_combat, CombatControl
+from core import seed_dice
+from systems.combat.event_log import event_log_active
+from systems.simulation import SCENARIOS, run_fight
+
+
+def _combatants(scenario, seed):
+    random.seed(seed)
+    seed_dice(seed)
+    return SCENARIOS[scenario]()
+
+
+def test_stream_matches_combat_simulation():
+    with redirect_stdout(io.StringIO()):
+        events = list(iter_combat(_combatants('fighter_vs_goblin_pack', 6), max_rounds=50))
+    seed_dice(None)
+    summary = events[-1]['summary']
+    expected = run_fight('fighter_vs_goblin_pack', 6)
+
+    assert events[0]['type'] == 'start' and len(events[0]['events']) == 4
+    assert [e['type'] for e in events[1:-1]].count('round') == summary['rounds']
+    assert {k: summary[k] for k in ('victor', 'rounds', 'hp_remaining')} == \
+        {k: expected[k] for k in ('victor', 'rounds', 'hp_remaining')}
+
+    turns = [e for e in events if e['type'] == 'turn']
+    damage = sum(d.amount for t in turns for d in t['events'] if d.kind == 'damage')
+    assert damage == sum(sum(s.values()) for s in summary['damage_by_source'].values())
+    assert turns[-1]['hp'] == summary['hp_remaining']
+    assert not event_log_active()
+    print("✅ PASS: streamed fight")
+
+
+def test_cancel_and_close_stop_the_fight():
+    control = CombatControl()
+    with redirect_stdout(io.StringIO()):
+        stream = iter_combat(_combatants('fighter_vs_hobgoblin', 2), control=control)
+        seen = []
+        for event in stream:
+            seen.append(event)
+            if event['type'] == 'turn':
+                control.cancel()
+    seed_dice(None)
+    assert [e['type'] for e in seen] == ['start', 'round', 'turn', 'end']
+    assert seen[-1]['summary']['cancelled'] and seen[-1]['summary']['victor'] is None
+
+    with redirect_stdout(io.StringIO()):
+        stream = iter_combat(_combatants('fighter_vs_hobgoblin', 2))
+        next(stream)
+        stream.close()
+    seed_dice(None)
+    assert not event_log_active()
+    print("✅ PASS: cancellation")
+
+
+def test_async_stream_pauses_between_turns():
+    async def watch():
+        control = CombatControl()
+        turns = []
+
+        async def consume():
+            async for event in async_iter_combat(_combatants('fighter_vs_snake', 3), control=control):
+                if event['type'] == 'turn':
+                    turns.append(event)
+                    if len(turns) == 1:
+                        control.pause()
+            return event
+
+        task = asyncio.create_task(consume())
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert len(turns) == 1 and not task.done()  # Held after the first turn
+        control.resume()
+        return await task, turns
+
+    with redirect_stdout(io.StringIO()):
+        end, turns = asyncio.run(watch())
+    seed_dice(None)
+    assert end['type'] == 'end' and len(turns) > 1
+    print("✅ PASS: async pause and resume")
+
+
+def test_interleaved_fights_keep_their_own_events():
+    with redirect_stdout(io.StringIO()):
+        pack = _combatants('fighter_vs_goblin_pack', 3)
+        snake = _combatants('fighter_vs_snake', 4)
+        snake[0].name = "Snake Fighter"
+        streams = {'pack': iter_combat(pack, max_rounds=50), 'snake': iter_combat(snake, max_rounds=50)}
+        names = {'pack': {c.name for c in pack}, 'snake': {c.name for c in snake}}
+        seen = {'pack': [], 'snake': []}
+        while streams:
+            for key in list(streams):
+                event = next(streams[key], None)
+                if event is None:
+                    del streams[key]
+                    continue
+                seen[key].append(event)
+    seed_dice(None)
+
+    for key, events in seen.items():
+        assert events[-1]['type'] == 'end'
+        for event in events:
+            for logged in event.get('events', []):
+                creatures = {value for field, value in logged._asdict().items()
+                             if field in ('creature', 'attacker', 'target', 'grappler', 'caster', 'killer') and value}
+                assert creatures <= names[key], (key, logged)
+                if event['type'] == 'turn':
+                    assert logged.round == event['round']
+    assert not event_log_active()
+    print("✅ PASS: interleaved streams only see their own fight")
@@ -0,0 +1,70 @@
+# File: test_common_random_numbers.py
+"""
+Common random numbers tests - per-purpose dice streams and paired A/B
+comparisons of builds.
+"""
+
+from core import seed_dice, roll_d20, roll
+from equipment.weapons.longswords import plus_one_longsword
+from equipment.weapons.martial_melee import longsword
+from systems.simulation import VariantDifference, compare_variants, equip_weapon
+
+
+def test_purposes_draw_from_separate_streams():
+    """Extra damage dice don't shift the attack rolls that follow."""
+    try:
+        seed_dice(7)
+        plain = [roll_d20()[0] for _ in range(5)]
+        seed_dice(7)
+        mixed = []
+        for _ in range(5):
+            roll('3d6')
+            mixed.append(roll_d20()[0])
+        assert plain == mixed
+        seed_dice(7)
+        initiative = roll_d20(purpose='initiative')[0]
+        seed_dice(7)
+        roll_d20()
+        assert roll_d20(purpose='initiative')[0] == initiative
+    finally:
+        seed_dice(None)
+    print("✅ PASS: per-purpose dice streams")
+
+
+def test_identical_variants_have_zero_paired_difference():
+    """Both variants of a trial see the same dice, so the same build never differs."""
+    comparison = compare_variants('fighter_vs_goblin', equip_weapon(longsword), equip_weapon(longsword),
+                                  range(50), metric='hp', side='party')
+    assert comparison.difference == 0
+    assert comparison.standard_error == 0
+    print("✅ PASS: identical variants")
+
+
+def test_paired_comparison_cuts_variance():
+    """+1 longsword vs longsword: CRN makes the difference significant with far fewer fights."""
+    paired = compare_variants('fighter_vs_hobgoblin', equip_weapon(plus_one_longsword), equip_weapon(longsword),
+                              range(300), metric='hp', side='monsters')
+    independent = compare_variants('fighter_vs_hobgoblin', equip_weapon(plus_one_longsword),
+                                   equip_weapon(longsword), range(300), metric='hp', side='monsters',
+                                   paired=False)
+
+    assert paired.difference < 0  # The magic sword leaves the hobgoblin with less HP
+    assert paired.significant
+    assert paired.variance_reduction > 4
+    assert paired.standard_error < independent.standard_error
+    print(f"✅ PASS: {paired}")
+
+
+def test_comparison_stops_once_a_variant_wins():
+    """The sequential rule settles +1 longsword vs longsword long before the seed budget."""
+    better = compare_variants('fighter_vs_hobgoblin', equip_weapon(plus_one_longsword), equip_weapon(longsword),
+                              range(20000), rule=VariantDifference(), chunk_size=64)
+    worse = compare_variants('fighter_vs_hobgoblin', equip_weapon(longsword), equip_weapon(plus_one_longsword),
+                             range(20000), rule=VariantDifference(), chunk_size=64)
+    same = compare_variants('fighter_vs_goblin', equip_weapon(longsword), equip_weapon(longsword),
+                            range(200), rule=VariantDifference(), chunk_size=64)
+
+    assert better.decision == 'A' and better.fights < 2000
+    assert worse.decision == 'B' and worse.fights == better.fights
+    assert same.decision is None and same.fights == 200
+    print(f"✅ PASS: {better}")
@@ -0,0 +1,119 @@
+# File: test_decision_cache.py
+"""
+Decision cache tests - memoized tier decisions for IntelligenceBasedAI.
+Validates that cached templates re-bind to fresh creatures and that the
+LRU bound and hit/miss counters behave.
+"""
+
+import io
+import random
+from contextlib import redirect_stdout
+
+from characters.base_character import Character
+from enemies import GiantConstrictorSnake, HobgoblinWarrior
+from equipment.weapons.martial_melee import longsword
+from ai.decision_cache import DecisionCache, make_state_key
+from ai.group_blackboard import clear_group_blackboards
+
+
+def _make_fighter(position=0):
+    return Character("Fighter", 3, 28, {'str': 16, 'dex': 10, 'con': 14, 'int': 8, 'wis': 12, 'cha': 15},
+                     longsword, position=position)
+
+
+def test_cached_decision_rebinds_to_new_trial():
+    """A decision cached in one trial is replayed against fresh combatants in the next."""
+    cache = DecisionCache(max_entries=16)
+
+    for trial in range(3):
+        clear_group_blackboards()
+        fighter = _make_fighter()
+        hobgoblin = HobgoblinWarrior("Hobgoblin", position=40)
+        hobgoblin.ai_brain.decision_cache = cache
+        combatants = [fighter, hobgoblin]
+
+        decision = hobgoblin.ai_brain.choose_actions(hobgoblin, combatants)
+        assert decision['action_target'] is fighter
+        assert decision['action'].weapon is hobgoblin.secondary_weapon
+
+    assert cache.misses == 1
+    assert cache.hits == 2
+    print("✅ PASS: Cached template re-binds across trials")
+
+
+def test_cached_snake_decision_replays_flags():
+    """The snake's critical-decision flag is replayed on a cache hit."""
+    cache = DecisionCache()
+    for trial in range(2):
+        fighter = _make_fighter(position=5)
+        snake = GiantConstrictorSnake(position=0)
+        snake.ai_brain.decision_cache = cache
+        snake.is_grappling = True
+        snake.grapple_target = fighter
+        fighter.is_grappled = True
+
+        decision = snake.ai_brain.choose_actions(snake, [fighter, snake])
+        assert decision['action'] == 'crush_grappled_target'
+        assert decision['action_target'] is fighter
+        assert snake._snake_ai_critical_decision is True
+
+    assert cache.hits == 1
+    print("✅ PASS: Decision side effects replayed from cache")
+
+
+def test_lru_eviction_is_bounded():
+    """The cache never grows past max_entries."""
+    cache = DecisionCache(max_entries=2)
+    for key in range(5):
+        cache.put(key, {'attributes': {}})
+    assert len(cache) == 2
+    assert cache.evictions == 3
+    assert cache.get(0) is None and cache.get(4) is not None
+    assert cache.stats()['hit_rate'] == 0.5
+    print("✅ PASS: LRU eviction bounded")
+
+
+def test_goblin_panic_is_never_cached():
+    from enemies import Goblin
+    cache = DecisionCache()
+    with redirect_stdout(io.StringIO()):
+        fighter = _make_fighter()
+        goblin = Goblin(position=5)
+        goblin.ai_brain.decision_cache = cache
+        random.seed(3)
+        draws = []
+        for _ in range(5):
+            before = random.getstate()
+            goblin.ai_brain.choose_actions(goblin, [fighter, goblin])
+            draws.append(random.getstate() != before)
+    assert all(draws)
+    assert len(cache) == 0
+    print("✅ PASS: goblin panic rolls every turn with caching on")
+
+
+def test_melee_and_bow_range_never_share_an_entry():
+    """The hobgoblin draws its bow past 5 ft, so 5 ft and 6 ft are different states."""
+    cache = DecisionCache()
+    for distance in (5, 6, 5, 6):
+        clear_group_blackboards()
+        fighter = _make_fighter()
+        hobgoblin = HobgoblinWarrior("Hobgoblin", position=distance)
+        hobgoblin.ai_brain.decision_cache = cache
+        decision = hobgoblin.ai_brain.choose_actions(hobgoblin, [fighter, hobgoblin])
+        expected = hobgoblin.secondary_weapon if distance > 5 else hobgoblin.equipped_weapon
+        assert decision['action'].weapon is expected
+    assert cache.misses == 2 and cache.hits == 2
+    print("✅ PASS: distance keyed exactly across the melee line")
+
+
+def test_stat_blocks_dont_share_entries():
+    """Every stat block monster is a BestiaryMonster; the block itself must be in the key."""
+    from enemies.bestiary import BestiaryMonster, StatBlock
+    data = {'hp': 11, 'stats': {'str': 14, 'dex': 15, 'con': 12, 'int': 3, 'wis': 12, 'cha': 6},
+            'attacks': [{'name': 'Bite', 'damage_dice': '1d6', 'damage_type': 'Piercing'}]}
+    fighter = _make_fighter()
+    with redirect_stdout(io.StringIO()):
+        first, second = (BestiaryMonster(StatBlock(key, data, 'test.toml'), position=5) for key in ('wolf', 'jackal'))
+    assert make_state_key('bestial_instinct', first, [fighter])[0] != \
+        make_state_key('bestial_instinct', second, [fighter])[0]
+    print("✅ PASS: stat block keys kept apart")
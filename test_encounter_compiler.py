@@ -0,0 +1,44 @@
+# File: test_encounter_compiler.py
+"""
+Encounter compiler tests - flat action tables and the scalar kernel.
+"""
+
+import pytest
+
+from enemies import GiantConstrictorSnake
+from systems.simulation import run_batch, summarize_results
+from systems.simulation.batch import fighter_vs_hobgoblin, _make_fighter
+from systems.simulation.compiler import (compile_encounter, run_compiled, run_compiled_batch,
+                                         POLICY_MELEE, POLICY_SKIRMISH)
+
+
+def test_tables_precompute_modifiers():
+    """Attack bonus, dice and policy are flattened once at compile time."""
+    encounter = compile_encounter(fighter_vs_hobgoblin())
+    assert encounter.names == ['Fighter', 'Hobgoblin Warrior']
+    # Longsword: STR +3, proficiency +2, 1d8+3
+    assert encounter.melee[0] == (5, (8,), 3, 5)
+    # Poisoned Longbow: DEX +1, proficiency +2, 1d8 + 3d4 poison
+    assert encounter.ranged[1] == (3, (8, 4, 4, 4), 1, 5)
+    assert encounter.policy == [POLICY_MELEE, POLICY_SKIRMISH]
+    assert encounter.ac == [10, 18]
+    print("✅ PASS: Compiled tables")
+
+
+def test_kernel_is_deterministic_and_matches_object_engine():
+    """Same seed, same fight; outcome statistics agree with combat_simulation."""
+    encounter = compile_encounter(fighter_vs_hobgoblin())
+    assert run_compiled(encounter, 42) == run_compiled(encounter, 42)
+
+    compiled = summarize_results(run_compiled_batch('fighter_vs_hobgoblin', range(20000)))
+    objects = summarize_results(run_batch('fighter_vs_hobgoblin', range(400)))
+    assert abs(compiled['win_rate']['monsters'] - objects['win_rate']['monsters']) < 0.08
+    assert abs(compiled['mean_rounds'] - objects['mean_rounds']) < 0.4
+    print("✅ PASS: Kernel matches the object engine")
+
+
+def test_unsupported_encounters_do_not_compile():
+    """Multiattack creatures need the object engine."""
+    with pytest.raises(ValueError):
+        compile_encounter([_make_fighter(), GiantConstrictorSnake(position=40)])
+    print("✅ PASS: Unsupported encounters refused")
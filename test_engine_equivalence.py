@@ -0,0 +1,43 @@
+# File: test_engine_equivalence.py
+"""
+Equivalence harness tests - chi-square/KS helpers and engine comparison
+against the reference combat_simulation.
+"""
+
+import math
+
+from systems.simulation import run_batch
+from systems.simulation.equivalence import (chi_square_test, ks_test, compare_engines, compare_results,
+                                            _regularized_gamma_q)
+
+
+def test_statistics_helpers():
+    """p-values agree with known chi-square and KS values."""
+    # Chi-square with 2 degrees of freedom: Q(1, x/2) = exp(-x/2)
+    assert abs(_regularized_gamma_q(1, 2.0) - math.exp(-2)) < 1e-9
+    # 3.841 is the 5% critical value for 1 degree of freedom
+    assert abs(_regularized_gamma_q(0.5, 3.841 / 2) - 0.05) < 1e-3
+
+    assert chi_square_test({'a': 50, 'b': 50}, {'a': 50, 'b': 50})[1] == 1.0
+    assert chi_square_test({'a': 90, 'b': 10}, {'a': 10, 'b': 90})[1] < 1e-6
+    assert ks_test([1, 2, 3] * 50, [1, 2, 3] * 50) == (0.0, 1.0)
+    assert ks_test(list(range(100)), list(range(50, 150)))[1] < 1e-6
+    print("✅ PASS: Statistics helpers")
+
+
+def test_compiled_engine_is_equivalent():
+    """The compiled kernel matches the reference engine on Fighter vs Hobgoblin."""
+    report = compare_engines('fighter_vs_hobgoblin', 'compiled', fights=300)
+    assert report.passed, str(report)
+    assert [check.metric for check in report.checks] == ['victor', 'rounds', 'hp_left[monsters]', 'hp_left[party]']
+    print("✅ PASS: Compiled engine equivalent")
+
+
+def test_drifted_engine_is_reported():
+    """An engine whose outcomes drift is flagged on the affected metrics."""
+    reference = run_batch('fighter_vs_hobgoblin', range(300))
+    drifted = [dict(r, victor='party', rounds=r['rounds'] + 2) for r in reference]
+    checks = compare_results(reference, drifted)
+    diverging = [check.metric for check in checks if check.diverges]
+    assert diverging == ['victor', 'rounds']
+    print("✅ PASS: Drift reported per metric")
@@ -0,0 +1,76 @@
+# File: test_event_log.py
+"""
+Binary combat event log tests - a fight's events round-trip through the
+compressed log and agree with the fight's summary.
+"""
+
+import gzip
+import os
+
+from systems.simulation import run_fight
+from systems.combat.event_log import EventLogWriter, read_events, log_event, event_log_active
+
+
+def test_fight_events_round_trip(tmp_path):
+    path = str(tmp_path / "fight.dsev")
+    result = run_fight('fighter_vs_goblin_pack', 3, event_log=path)
+    events = list(read_events(path))
+
+    assert not event_log_active()
+    assert events[0].kind == 'fight_start' and events[0].seed == 3
+    assert events[-1].kind == 'fight_end'
+    assert (events[-1].victor, events[-1].rounds) == (result['victor'], result['rounds'])
+    assert sum(1 for e in events if e.kind == 'initiative') == 4
+    assert {e.creature for e in events if e.kind == 'death'} == {
+        name for name, hp in result['hp_remaining'].items() if hp <= 0}
+
+    # Damage events add up to the fight's damage ledger
+    dealt = sum(sum(sources.values()) for sources in result['damage_by_source'].values())
+    assert sum(e.amount for e in events if e.kind == 'damage') == dealt
+    for attack in (e for e in events if e.kind == 'attack'):
+        assert attack.outcome in ('miss', 'hit', 'crit')
+        assert 1 <= attack.roll <= 20
+    print("✅ PASS: event log round trip")
+
+
+def test_logging_does_not_change_the_fight(tmp_path):
+    logged = run_fight('fighter_vs_snake', 11, event_log=str(tmp_path / "fight.dsev"))
+    silent = run_fight('fighter_vs_snake', 11)
+    assert logged['hp_remaining'] == silent['hp_remaining']
+    assert logged['rounds'] == silent['rounds']
+    print("✅ PASS: logging leaves the dice alone")
+
+
+def test_grapples_and_conditions_are_logged(tmp_path):
+    for seed in range(20):
+        path = str(tmp_path / f"snake_{seed}.dsev")
+        run_fight('fighter_vs_snake', seed, event_log=path)
+        grapples = list(read_events(path, kinds={'grapple', 'condition'}))
+        if any(e.kind == 'grapple' and e.started for e in grapples):
+            assert any(e.kind == 'condition' and e.condition == 'Grappled' and e.applied for e in grapples)
+            print("✅ PASS: grapples logged")
+            return
+    raise AssertionError("No grapple in 20 snake fights")
+
+
+def test_writer_compresses_and_reads_lazily(tmp_path):
+    compressed, raw = str(tmp_path / "log.dsev"), str(tmp_path / "log.raw")
+    for path, compress in ((compressed, True), (raw, False)):
+        with EventLogWriter(path, compress=compress) as writer:
+            for i in range(5000):
+                writer.round = i // 50
+                writer.write('attack', 'Fighter', 'Goblin', 1 + i % 20, 5 + i % 20, 15, i % 3)
+
+    assert open(compressed, 'rb').read(2) == b'\x1f\x8b'
+    assert gzip.decompress(open(compressed, 'rb').read()) == open(raw, 'rb').read()
+    assert os.path.getsize(compressed) * 5 < os.path.getsize(raw)
+
+    events = read_events(compressed, kinds={'attack'})
+    first = next(events)
+    assert (first.attacker, first.target, first.roll, first.outcome) == ('Fighter', 'Goblin', 1, 'miss')
+    assert sum(1 for _ in events) == 4999
+    assert [e.outcome for e in read_events(raw)][:3] == ['miss', 'hit', 'crit']
+
+    # With no log open, logging is a no-op
+    log_event('death', 'Fighter', None)
+    print("✅ PASS: compressed writer")
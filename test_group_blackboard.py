@@ -0,0 +1,81 @@
+# File: test_group_blackboard.py
+"""
+Group blackboard tests - pack coordination for goblin and hobgoblin AI.
+Validates that battlefield facts are computed once per round per faction
+and that focus fire spreads out instead of everyone rushing one target.
+"""
+
+from characters.base_character import Character
+from enemies import Goblin, HobgoblinWarrior
+from equipment.weapons.martial_melee import longsword
+from ai.group_blackboard import get_group_blackboard, clear_group_blackboards
+
+
+def _make_fighter(name, position=0):
+    return Character(name, 3, 28, {'str': 16, 'dex': 10, 'con': 14, 'int': 8, 'wis': 12, 'cha': 15},
+                     longsword, position=position)
+
+
+def _start_round(combatants, round_number):
+    for combatant in combatants:
+        combatant.current_round = round_number
+
+
+def test_blackboard_built_once_per_round():
+    """All pack members share the same blackboard within a round."""
+    clear_group_blackboards()
+    fighter = _make_fighter("Fighter")
+    goblins = [Goblin(f"Goblin {i}", position=5) for i in range(3)]
+    combatants = [fighter] + goblins
+    _start_round(combatants, 1)
+
+    boards = {id(get_group_blackboard(g, combatants)) for g in goblins}
+    assert len(boards) == 1
+    board = get_group_blackboard(goblins[0], combatants)
+    assert board.enemies == [fighter]
+    assert len(board.members) == 3
+    assert board.focus_target is fighter
+
+    _start_round(combatants, 2)
+    assert get_group_blackboard(goblins[0], combatants) is not board
+    print("✅ PASS: Blackboard computed once per round per faction")
+
+
+def test_focus_fire_spreads_across_targets():
+    """Members focus the wounded enemy, then spread to the others."""
+    clear_group_blackboards()
+    healthy = _make_fighter("Healthy", position=0)
+    wounded = _make_fighter("Wounded", position=0)
+    wounded.hp = 5
+    goblins = [Goblin(f"Goblin {i}", position=5) for i in range(4)]
+    combatants = [healthy, wounded] + goblins
+    _start_round(combatants, 1)
+
+    board = get_group_blackboard(goblins[0], combatants)
+    assert board.focus_target is wounded
+    assert wounded in board.wounded_enemies
+
+    targets = [board.choose_target(g) for g in goblins]
+    assert targets.count(wounded) == 2
+    assert targets.count(healthy) == 2
+    # Repeated lookups within the round return the same assignment
+    assert board.choose_target(goblins[0]) is targets[0]
+    print("✅ PASS: Focus fire without everyone rushing one target")
+
+
+def test_member_ai_reads_blackboard():
+    """Goblin and hobgoblin AIs pick targets through the shared blackboard."""
+    clear_group_blackboards()
+    fighter = _make_fighter("Fighter", position=0)
+    goblin = Goblin("Goblin", position=5)
+    hobgoblin = HobgoblinWarrior("Hobgoblin", position=40)
+    combatants = [fighter, goblin, hobgoblin]
+    _start_round(combatants, 1)
+
+    for creature in (goblin, hobgoblin):
+        decision = creature.ai_brain.choose_actions(creature, combatants)
+        assert decision['action_target'] is fighter
+
+    board = get_group_blackboard(goblin, combatants)
+    assert board.claims_on(fighter) == 2
+    print("✅ PASS: Member AIs coordinate through the blackboard")
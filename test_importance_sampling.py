@@ -0,0 +1,50 @@
+# File: test_importance_sampling.py
+"""
+Importance sampling tests - tilted dice, likelihood ratios and unbiased
+rare-event estimates.
+"""
+
+from core import seed_dice, tilt_dice, set_acting_faction, likelihood_ratio, roll_d20
+from systems.simulation import importance_sample, run_silent_fight
+
+
+def test_tilt_only_applies_to_the_tilted_faction():
+    """Monster attack rolls run high, party rolls are untouched and keep the ratio at 1."""
+    try:
+        seed_dice(1)
+        tilt_dice({'monsters': 2.0})
+        set_acting_faction('party')
+        [roll_d20() for _ in range(50)]
+        assert likelihood_ratio() == 1.0
+
+        set_acting_faction('monsters')
+        rolls = [roll_d20()[0] for _ in range(400)]
+        assert sum(rolls) / len(rolls) > 12
+        assert likelihood_ratio() != 1.0
+    finally:
+        set_acting_faction(None)
+        tilt_dice(None)
+        seed_dice(None)
+    print("✅ PASS: faction tilt")
+
+
+def test_tilted_fight_reports_likelihood_ratio():
+    plain = run_silent_fight('fighter_vs_goblin', 4)
+    tilted = run_silent_fight('fighter_vs_goblin', 4, tilt={'monsters': 1.0, 'party': -1.0})
+    assert 'likelihood_ratio' not in plain
+    assert tilted['likelihood_ratio'] > 0
+    assert tilted['fallen']['party'] in (0, 1)
+    print("✅ PASS: likelihood ratio in summary")
+
+
+def test_importance_sampling_is_unbiased_and_tighter():
+    """The fighter's ~3.5% chance of dying to a goblin, estimated with and without tilted dice."""
+    plain = importance_sample('fighter_vs_goblin', 'party_member_down', fights=1500, tilt=0)
+    tilted = importance_sample('fighter_vs_goblin', 'party_member_down', fights=1500, tilt=1.0, seed=50_000)
+
+    assert tilted.hits > 3 * plain.hits  # The rare event shows up far more often
+    assert tilted.standard_error < plain.standard_error
+    gap = abs(tilted.probability - plain.probability)
+    assert gap < 3 * (tilted.standard_error ** 2 + plain.standard_error ** 2) ** 0.5
+    assert 0 < tilted.effective_fights < tilted.fights
+    print(f"✅ PASS: {tilted}")
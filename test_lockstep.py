@@ -0,0 +1,44 @@
+# File: test_lockstep.py
+"""
+Lockstep engine tests - vectorized 1v1 fights must agree with the object
+engine on the encounter shapes they support.
+"""
+
+import pytest
+
+from enemies import GiantConstrictorSnake
+from systems.simulation import run_batch, summarize_results
+
+np = pytest.importorskip("numpy")
+
+from systems.simulation.lockstep import profile_from_creature, run_lockstep, run_lockstep_scenario
+
+
+def test_lockstep_matches_object_engine():
+    """Win rate and fight length agree with the object engine for Fighter vs Hobgoblin Warrior."""
+    objects = summarize_results(run_batch('fighter_vs_hobgoblin', range(400)))
+    lockstep = run_lockstep_scenario('fighter_vs_hobgoblin', 20000, seed=5)
+
+    assert lockstep['fights'] == 20000
+    assert abs(lockstep['win_rate']['monsters'] - objects['win_rate']['monsters']) < 0.08
+    assert abs(lockstep['mean_rounds'] - objects['mean_rounds']) < 0.4
+    print("✅ PASS: Lockstep statistics match the object engine")
+
+
+def test_finished_fights_are_masked():
+    """Every fight ends with exactly one side at 0 HP and HP never goes negative."""
+    from systems.simulation.batch import fighter_vs_goblin
+    fighter, goblin = fighter_vs_goblin()
+    result = run_lockstep(profile_from_creature(fighter), profile_from_creature(goblin), 5000, seed=2)
+
+    assert (result['hp_a'] >= 0).all() and (result['hp_b'] >= 0).all()
+    assert ((result['hp_a'] == 0) != (result['hp_b'] == 0)).all()
+    assert ((result['victor'] == 0) == (result['hp_b'] == 0)).all()
+    print("✅ PASS: Finished fights are masked out")
+
+
+def test_unsupported_creatures_are_refused():
+    """Multiattack creatures fall back to the object engine."""
+    with pytest.raises(ValueError):
+        profile_from_creature(GiantConstrictorSnake())
+    print("✅ PASS: Unsupported creatures refused")
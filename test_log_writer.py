@@ -0,0 +1,97 @@
+# File: test_log_writer.py
+"""
+Asynchronous log writer tests - output is complete, ordered and batched,
+and a slow stream applies backpressure instead of growing the queue.
+"""
+
+import io
+import threading
+import time
+
+import pytest
+
+from systems.combat.log_writer import AsyncLogWriter, buffered_output
+from systems.simulation import run_fight
+
+
+class SlowStream(io.TextIOBase):
+    """A stream that takes a while per write, like a terminal."""
+
+    def __init__(self, delay=0.001):
+        self.delay = delay
+        self.writes = []
+
+    def write(self, text):
+        time.sleep(self.delay)
+        self.writes.append(text)
+        return len(text)
+
+
+def test_lines_arrive_in_order_in_few_writes():
+    stream = SlowStream()
+    with buffered_output(stream):
+        for i in range(2000):
+            print(f"line {i}")
+
+    assert ''.join(stream.writes) == ''.join(f"line {i}\n" for i in range(2000))
+    assert len(stream.writes) < 200
+    print("✅ PASS: batched, ordered output")
+
+
+def test_full_queue_blocks_the_writer():
+    release = threading.Event()
+
+    class StuckStream(io.TextIOBase):
+        def __init__(self):
+            self.text = []
+
+        def write(self, text):
+            release.wait()
+            self.text.append(text)
+            return len(text)
+
+    stream = StuckStream()
+    writer = AsyncLogWriter(stream, max_pending=4, batch_size=1)
+    done = threading.Event()
+
+    def produce():
+        for i in range(50):
+            writer.write(f"{i},")
+        done.set()
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    assert not done.wait(0.2)          # Stuck behind the full queue
+    release.set()
+    producer.join(5)
+    writer.close()
+    assert ''.join(stream.text) == ''.join(f"{i}," for i in range(50))
+    print("✅ PASS: backpressure")
+
+
+def test_flush_waits_and_stream_errors_surface():
+    stream = SlowStream(delay=0.01)
+    writer = AsyncLogWriter(stream)
+    writer.write("a")
+    writer.write("b")
+    writer.flush()
+    assert ''.join(stream.writes) == "ab"
+
+    class BrokenStream(io.TextIOBase):
+        def write(self, text):
+            raise OSError("disk full")
+
+    broken = AsyncLogWriter(BrokenStream())
+    broken.write("lost")
+    with pytest.raises(OSError):
+        broken.close()
+    print("✅ PASS: flush and errors")
+
+
+def test_verbose_fight_log_is_unchanged(capsys):
+    run_fight('fighter_vs_goblin', 4, verbose=True)
+    buffered = capsys.readouterr().out
+    assert "===== COMBAT ENDS =====" in buffered
+    run_fight('fighter_vs_goblin', 4, verbose=True)
+    assert capsys.readouterr().out == buffered
+    print("✅ PASS: verbose fight through the writer")
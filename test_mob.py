@@ -0,0 +1,128 @@
+# File: test_mob.py
+"""
+Mob tests - homogeneous monster groups resolved in bulk.
+Validates per-member HP bookkeeping, aggregated damage application and
+that large encounters resolve through combat_simulation.
+"""
+
+import io
+import random
+from contextlib import redirect_stdout
+
+import pytest
+
+from characters.base_character import Character
+from enemies import Goblin
+from equipment.weapons.martial_melee import longsword
+from combat import combat_simulation
+
+pytest.importorskip("numpy")
+
+from enemies import Mob
+
+
+def _make_fighter(name="Fighter", position=0):
+    return Character(name, 3, 28, {'str': 16, 'dex': 10, 'con': 14, 'int': 8, 'wis': 12, 'cha': 15},
+                     longsword, position=position)
+
+
+def test_members_die_one_at_a_time():
+    """Damage lands on the front member and does not spill over."""
+    mob = Mob(Goblin, 3)
+    fighter = _make_fighter()
+
+    mob.take_damage(20, attacker=fighter)
+    assert list(mob.member_hp) == [0, 7, 7]
+    assert mob.alive_count == 2 and mob.hp == 14 and mob.is_alive
+
+    mob.take_damage(7)
+    mob.take_damage(3)
+    assert mob.alive_count == 1 and mob.hp == 4
+    mob.take_damage(4)
+    assert not mob.is_alive
+    print("✅ PASS: Mob members die individually")
+
+
+def test_one_damage_application_per_target():
+    """The whole group's attacks on a target arrive as one take_damage call."""
+    random.seed(3)
+    fighters = [_make_fighter("Fighter A"), _make_fighter("Fighter B")]
+    mob = Mob(Goblin, 10, position=5)
+
+    calls = []
+    for fighter in fighters:
+        original = fighter.take_damage
+        fighter.take_damage = lambda damage, attacker=None, source=None, f=original, n=fighter.name: (
+            calls.append(n), f(damage, attacker, source))
+
+    with redirect_stdout(io.StringIO()):
+        mob.take_turn(fighters + [mob])
+    assert calls and sorted(calls) == sorted(set(calls))
+    print("✅ PASS: Aggregated damage per target")
+
+
+def test_casualties_reach_the_event_log():
+    from systems.combat.event_log import EventSink, use_event_sink
+    mob = Mob(Goblin, 2)
+    fighter = _make_fighter()
+    sink = EventSink()
+    with use_event_sink(sink), redirect_stdout(io.StringIO()):
+        mob.take_damage(20, attacker=fighter, source='Weapon')
+        mob.take_damage(20, attacker=fighter, source='Weapon')
+    events = sink.take()
+    assert [event.kind for event in events] == ['damage', 'death', 'damage', 'death', 'death']
+    assert [event.creature for event in events if event.kind == 'death'] == ['Goblin #1', 'Goblin #2', mob.name]
+    assert events[0].target == mob.name and events[0].hp_left == 7
+    print("✅ PASS: mob damage and deaths are logged")
+
+
+def test_volleys_only_reach_enemies_in_range():
+    from enemies import HobgoblinWarrior
+    random.seed(5)
+    near, far = _make_fighter("Near", position=60), _make_fighter("Far", position=400)
+    mob = Mob(HobgoblinWarrior, 6)
+    calls = []
+    for fighter in (near, far):
+        original = fighter.take_damage
+        fighter.take_damage = lambda damage, attacker=None, source=None, f=original, n=fighter.name: (
+            calls.append(n), f(damage, attacker, source))
+    with redirect_stdout(io.StringIO()):
+        mob.take_turn([near, far, mob])
+    assert calls == ["Near"]
+    print("✅ PASS: ranged volleys stay in range")
+
+
+def test_stat_block_monsters_form_mobs():
+    from enemies import mobify, spawn_monster
+    wolves = [spawn_monster('wolf', position=30 + 5 * i) for i in range(3)]
+    bandits = [spawn_monster('bandit', position=60), spawn_monster('bandit', position=65)]
+    with redirect_stdout(io.StringIO()):
+        combatants = mobify([_make_fighter()] + wolves + bandits)
+    mobs = [c for c in combatants if isinstance(c, Mob)]
+    assert [(mob.member_name, len(mob.member_hp)) for mob in mobs] == [("Wolf", 3), ("Bandit", 2)]
+    assert mobs[1].ranged_profile is not None
+    print("✅ PASS: stat block mobs")
+
+
+def test_large_encounter_resolves():
+    """Four fighters against forty goblins runs through the normal combat loop."""
+    random.seed(11)
+    party = [_make_fighter(f"Fighter {i}") for i in range(4)]
+    mob = Mob(Goblin, 40, position=40)
+
+    with redirect_stdout(io.StringIO()):
+        result = combat_simulation(party + [mob], max_rounds=20)
+    assert result['victor'] in ('party', 'monsters', None)
+    assert mob.hp == sum(int(hp) for hp in mob.member_hp)
+    assert mob.alive_count < 40
+    print("✅ PASS: Large mob encounter resolves")
+
+
+def test_enemies_dont_import_the_simulation_package():
+    import subprocess
+    import sys
+    script = ("import sys, enemies; from enemies.bestiary import compile_stat_blocks; compile_stat_blocks(); "
+              "print(sorted(m for m in sys.modules if m.startswith('systems.simulation')))")
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines()[-1] == "[]"
+    print("✅ PASS: importing enemies and compiling stat blocks leaves systems.simulation alone")
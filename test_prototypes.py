@@ -0,0 +1,86 @@
+# File: test_prototypes.py
+"""
+Prototype cloning tests - spawned combatants share their stat blocks but
+not their fight state, fight exactly like freshly built ones, and are
+cheaper to make.
+"""
+
+import io
+import time
+from contextlib import redirect_stdout
+
+import pytest
+
+from enemies import Goblin, GiantConstrictorSnake
+from systems.simulation.batch import SCENARIOS, run_silent_fight
+
+
+def _quietly(factory):
+    with redirect_stdout(io.StringIO()):
+        return factory()
+
+
+def test_clones_share_stat_blocks_but_not_state():
+    prototype = _quietly(Goblin)
+    first, second = prototype.spawn("Goblin 1", 30), prototype.spawn("Goblin 2", 35)
+    assert (first.name, first.position, second.name, second.position) == ("Goblin 1", 30, "Goblin 2", 35)
+    assert first.stats is prototype.stats and first.equipped_weapon is prototype.equipped_weapon
+    assert first.available_actions is not prototype.available_actions
+    assert first.available_actions[0] is prototype.available_actions[0]
+    assert first.ai_brain is not prototype.ai_brain and type(first.ai_brain) is type(prototype.ai_brain)
+
+    first.take_damage(5)
+    first.active_effects.append("poisoned")
+    first.damage_dealt['Scimitar'] = 3
+    assert (prototype.hp, second.hp) == (7, 7)
+    assert prototype.active_effects == [] and second.damage_dealt == {}
+    print("✅ PASS: stat blocks shared, fight state copied")
+
+
+def test_actions_bound_to_the_prototype_are_rebound():
+    snake = _quietly(GiantConstrictorSnake).spawn()
+    multiattack = next(a for a in snake.available_actions if a.name == "Multiattack")
+    assert multiattack.creature is snake and multiattack.action is multiattack
+    print("✅ PASS: Multiattack rebound to the clone")
+
+
+def test_cloned_fights_match_freshly_built_ones():
+    for scenario in ('fighter_vs_goblin_pack', 'fighter_vs_snake'):
+        factory = SCENARIOS[scenario]
+        for seed in range(15):
+            # A lambda is a new scenario every time, so it builds fresh prototypes
+            fresh = run_silent_fight(lambda: factory(), seed)
+            assert run_silent_fight(scenario, seed) == fresh
+    print("✅ PASS: cloned combatants fight exactly like new ones")
+
+
+def test_paladin_clone_has_its_own_resources():
+    from systems.simulation.batch import paladin_vs_snake
+    try:
+        prototype = _quietly(paladin_vs_snake)[0]
+    except ImportError as error:
+        pytest.skip(f"Paladin unavailable: {error}")
+    clone = prototype.spawn()
+    clone.spell_slots[1] -= 1
+    clone.lay_on_hands_pool -= 5
+    assert prototype.spell_slots[1] == clone.spell_slots[1] + 1
+    assert prototype.lay_on_hands_pool == clone.lay_on_hands_pool + 5
+    assert clone.prepared_spells is prototype.prepared_spells
+    print("✅ PASS: Paladin clone has its own slots and pools")
+
+
+def test_spawning_is_cheaper_than_building():
+    prototype = _quietly(Goblin)
+    prototype.spawn()
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(2000):
+            Goblin()
+        built = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(2000):
+        prototype.spawn()
+    spawned = time.perf_counter() - start
+    assert spawned < built
+    print(f"✅ PASS: spawn {spawned / 2:.1f} us vs __init__ {built / 2:.1f} us per goblin")
+
@@ -0,0 +1,63 @@
+# File: test_replay.py
+"""
+Deterministic replay tests - recorded batches re-run bit-exactly, with the
+AI decision log pinpointing divergence.
+"""
+
+import json
+
+from systems.simulation import record_batch, replay_fight, find_trials, run_fight, run_silent_fight
+from systems.simulation.replay import load_recording
+
+
+def test_recording_is_compact_and_complete(tmp_path):
+    path = tmp_path / "batch.jsonl"
+    results = record_batch('fighter_vs_hobgoblin', 20, str(path), master_seed=100)
+    manifest, outcomes = load_recording(str(path))
+
+    assert manifest.scenario == 'fighter_vs_hobgoblin'
+    assert manifest.trial_seed(7) == 107
+    assert len(outcomes) == 20
+    assert [o['victor'] for o in outcomes] == [r['victor'] for r in results]
+    assert 'decisions' not in outcomes[0]
+    print("✅ PASS: batch recording")
+
+
+def test_replay_reproduces_every_recorded_trial(tmp_path, capsys):
+    path = str(tmp_path / "batch.jsonl")
+    record_batch('fighter_vs_goblin_pack', 8, path, master_seed=5, decisions=True)
+
+    for trial in range(8):
+        assert replay_fight(path, trial, verbose=False).matches
+
+    replay = replay_fight(path, 3)
+    output = capsys.readouterr().out
+    assert "[REPLAY] fighter_vs_goblin_pack trial 3 (seed 8)" in output
+    assert "===== COMBAT BEGINS =====" in output
+    assert replay.matches
+    print("✅ PASS: replays match the recording")
+
+
+def test_verbose_and_silent_runs_agree():
+    """Logging doesn't touch the dice: a replayed fight equals its silent original."""
+    silent = run_silent_fight('fighter_vs_snake', 42)
+    replayed = run_fight('fighter_vs_snake', 42, verbose=True, decisions=True)
+    assert silent['hp_remaining'] == replayed['hp_remaining']
+    assert silent['rounds'] == replayed['rounds']
+    print("✅ PASS: verbose re-run is bit-exact")
+
+
+def test_divergence_is_located(tmp_path):
+    path = tmp_path / "batch.jsonl"
+    record_batch('fighter_vs_hobgoblin', 3, str(path), decisions=True)
+    lines = path.read_text().splitlines()
+    tampered = json.loads(lines[2])
+    tampered['decisions'][1][2] = "Dodge"
+    lines[2] = json.dumps(tampered)
+    path.write_text("\n".join(lines) + "\n")
+
+    replay = replay_fight(str(path), 1, verbose=False)
+    assert replay.matches is False
+    assert replay.first_divergence == 1
+    assert find_trials(str(path), lambda o: o['rounds'] >= 1) == [0, 1, 2]
+    print("✅ PASS: divergence located")
@@ -0,0 +1,94 @@
+# File: test_result_cache.py
+"""
+Result cache tests - keys follow the scenario's content, repeated batches
+come from disk, and the cache stays under its size bound.
+"""
+
+import json
+import os
+import tempfile
+
+from systems.simulation import SCENARIOS, run_batch_statistics
+from systems.simulation.result_cache import ResultCache, cache_key, cached_batch_statistics
+import systems.simulation.result_cache as result_cache
+
+
+def _renamed_goblin_fight():
+    return SCENARIOS['fighter_vs_goblin']()
+
+
+def _tougher_goblin_fight():
+    combatants = SCENARIOS['fighter_vs_goblin']()
+    combatants[1].max_hp = combatants[1].hp = 12
+    return combatants
+
+
+def test_keys_follow_the_scenario_content():
+    base = cache_key('fighter_vs_goblin', 100)
+    assert cache_key(_renamed_goblin_fight, 100) == base
+    assert cache_key(_tougher_goblin_fight, 100) != base
+    assert cache_key('fighter_vs_goblin', 101) != base
+    assert cache_key('fighter_vs_goblin', 100, seed=1) != base
+    assert cache_key('fighter_vs_goblin', 100, parameters={'goblin.panic_hp': 0.5}) != base
+    print("✅ PASS: content-addressed keys")
+
+
+def test_repeated_batches_come_from_the_cache(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    first = cached_batch_statistics('fighter_vs_goblin', 60, seed=3, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    def no_fights(*args, **kwargs):
+        raise AssertionError("cache hit expected")
+
+    monkeypatch.setattr(result_cache, 'run_batch_statistics', no_fights)
+    second = cached_batch_statistics('fighter_vs_goblin', 60, seed=3, cache=cache)
+    assert cache.hits == 1
+    assert second.summary() == first.summary() == run_batch_statistics('fighter_vs_goblin', range(3, 63)).summary()
+    print("✅ PASS: cache hits")
+
+
+def test_engine_change_invalidates(monkeypatch):
+    before = cache_key('fighter_vs_goblin', 100)
+    monkeypatch.setattr(result_cache, 'ENGINE_VERSION', result_cache.ENGINE_VERSION + 1)
+    assert cache_key('fighter_vs_goblin', 100) != before
+    print("✅ PASS: engine version in key")
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=2500)
+    for i in range(3):
+        cache.put(f"entry{i}", "x" * 1000)
+        os.utime(os.path.join(str(tmp_path), f"entry{i}.json"), ns=(i * 10**9, i * 10**9))
+    cache.evict()
+    assert cache.get('entry0') is None          # Oldest went first
+    assert cache.get('entry1') == "x" * 1000    # ... and this use makes entry1 the newest
+    cache.put('entry3', "x" * 1000)
+    assert cache.get('entry2') is None
+    assert cache.get('entry1') is not None and cache.get('entry3') is not None
+    assert cache.size() <= 2500
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith('.tmp')]
+    print("✅ PASS: LRU eviction")
+
+
+def test_engine_hash_covers_the_batch_code():
+    files = set(result_cache.engine_files())
+    for path in ('combat.py', 'systems/simulation/batch.py', 'systems/simulation/statistics.py',
+                 'systems/simulation/result_cache.py', 'enemies/stat_blocks/beasts.toml'):
+        assert os.path.normpath(path) in files
+    assert not any(os.path.basename(path).startswith('test_') for path in files)
+    print("✅ PASS: engine hash covers the code that runs and scores batches")
+
+
+def test_entries_are_private_json(tmp_path):
+    directory = tmp_path / "private"
+    cache = ResultCache(str(directory))
+    cached_batch_statistics('fighter_vs_goblin', 20, cache=cache)
+    if os.name == 'posix':
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+    entries = os.listdir(directory)
+    assert len(entries) == 1 and entries[0].endswith('.json')
+    with open(directory / entries[0]) as f:
+        assert json.load(f)['fights'] == 20
+    assert not result_cache.RESULT_CACHE_DIR.startswith(os.path.join(tempfile.gettempdir(), ''))
+    print("✅ PASS: private JSON entries")
@@ -0,0 +1,78 @@
+# File: test_scenario_files.py
+"""
+Scenario file tests - files load into the same encounters as the Python
+factories, every problem is reported up front, and the CLI runs batches.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from systems.simulation import run_batch_statistics
+from systems.simulation.scenario_files import ScenarioError, load_scenario, load_scenarios, main
+
+
+def test_goblin_pack_file_matches_the_builtin_scenario():
+    scenario = load_scenario('scenarios/fighter_vs_goblin_pack.toml')
+    combatants = scenario.factory()
+    assert [(c.name, c.position) for c in combatants] == [
+        ('Fighter', 0), ('Goblin 1', 30), ('Goblin 2', 35), ('Goblin 3', 40)]
+
+    from_file = scenario.run(80, seed=7)
+    builtin = run_batch_statistics('fighter_vs_goblin_pack', range(7, 87))
+    assert from_file.summary() == builtin.summary()
+    print("✅ PASS: scenario file builds the same fight")
+
+
+def test_every_problem_is_reported(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps({
+        'party': [{'class': 'Wizard', 'name': 'Merlin', 'level': 3, 'hp': 18,
+                   'stats': {'str': 8, 'dex': 14}, 'weapon': 'wand', 'armor': 'robe'}],
+        'enemies': [{'type': 'Dragon'}, {'type': 'Goblin', 'count': 0}],
+        'parameters': {'goblin.courage': 1},
+        'turbo': True,
+    }))
+    with pytest.raises(ScenarioError) as error:
+        load_scenario(str(path))
+    problems = "\n".join(error.value.problems)
+    for expected in ("unknown keys: turbo", "unknown class 'Wizard'", "stats must give", "unknown weapon 'wand'",
+                     "unknown armor 'robe'", "unknown enemy type 'Dragon'", "count must be", "'goblin.courage'"):
+        assert expected in problems
+    print("✅ PASS: validation")
+
+
+def test_all_files_validate_before_anything_runs(tmp_path):
+    bad = tmp_path / "bad.toml"
+    bad.write_text("party = [")
+    with pytest.raises(ScenarioError) as error:
+        load_scenarios(['scenarios/fighter_vs_goblin_pack.toml', str(bad), str(tmp_path / "missing.json")])
+    assert len(error.value.problems) == 2
+    print("✅ PASS: up-front validation")
+
+
+def test_cli_runs_a_grid(capsys):
+    assert main(['run', 'scenarios/fighter_vs_goblin_pack.toml', 'scenarios/fighter_vs_hobgoblins.json',
+                 '--runs', '40', '--seed', '3', '--format', 'json']) == 0
+    rows = json.loads(capsys.readouterr().out)
+    assert [row['scenario'] for row in rows] == ['fighter_vs_goblin_pack', 'fighter_vs_hobgoblins']
+    assert all(row['fights'] == 40 for row in rows)
+    assert abs(rows[0]['party_win_rate'] + rows[0]['monsters_win_rate'] + rows[0]['draw_win_rate'] - 1) < 1e-9
+    print("✅ PASS: scenario CLI")
+
+
+def test_a_directory_means_every_scenario_in_it(capsys):
+    assert main(['validate', 'scenarios']) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(':')[0] for line in lines] == ['scenarios/fighter_vs_goblin_pack.toml',
+                                                      'scenarios/fighter_vs_hobgoblins.json']
+    print("✅ PASS: scenario directories")
+
+
+def test_main_hands_off_before_the_game_imports():
+    result = subprocess.run([sys.executable, 'main.py', 'validate', 'scenarios/'], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert 'fighter_vs_goblin_pack' in result.stdout
+    print("✅ PASS: main.py batch handoff")
@@ -0,0 +1,87 @@
+# File: test_sequential_stopping.py
+"""
+Sequential early stopping tests - SPRT and precision rules stop batch runs
+as soon as they have an answer, serially and across worker processes.
+"""
+
+from systems.simulation import run_until, run_batch_statistics, WinRateThreshold, WinRatePrecision, VariantDifference
+from systems.simulation.statistics import BatchStatistics, RunningStats
+
+
+def test_sprt_decides_clear_cases_quickly():
+    """The fighter clearly beats one goblin and clearly loses to a hobgoblin."""
+    above = run_until('fighter_vs_goblin', WinRateThreshold('party', 0.5), max_fights=2000, chunk_size=16)
+    below = run_until('fighter_vs_hobgoblin', WinRateThreshold('party', 0.5), max_fights=2000, chunk_size=16)
+
+    assert above.decision == 'above' and above.stopped_early
+    assert below.decision == 'below' and below.stopped_early
+    assert above.fights < 200 and below.fights < 200
+    print(f"✅ PASS: SPRT decided after {above.fights} and {below.fights} fights")
+
+
+def test_sprt_log_likelihood_ratio():
+    """Each win for the side pushes the LLR up, each loss pushes it down."""
+    rule = WinRateThreshold('party', 0.5, indifference=0.1)
+    statistics = BatchStatistics()
+    for victor in ['party'] * 10 + ['monsters'] * 10:
+        statistics.add({'victor': victor, 'rounds': 1})
+    assert abs(rule.log_likelihood_ratio(statistics)) < 1e-12
+    assert rule.check(statistics) is None
+    print("✅ PASS: SPRT log-likelihood ratio")
+
+
+def test_variant_difference_sprt():
+    """Differences favouring A push the LLR up until it decides; balanced ones cancel out."""
+    rule = VariantDifference(indifference=0.1, min_fights=10)
+    differences = RunningStats()
+    for value in [1.0, -1.0, 0.0, 0.0] * 5:
+        differences.add(value)
+    assert abs(rule.log_likelihood_ratio(differences)) < 1e-12
+    assert rule.check(differences) is None
+    for value in [1.0, 0.0] * 20:
+        differences.add(value)
+    assert rule.log_likelihood_ratio(differences) > 0
+    assert rule.check(differences) == 'A'
+    print("✅ PASS: paired-difference SPRT")
+
+
+def test_precision_target_matches_fixed_run():
+    """Stopping on CI width gives the same counts as a fixed run of that many seeds."""
+    rule = WinRatePrecision('party', half_width=0.05)
+    result = run_until('fighter_vs_hobgoblin', rule, max_fights=3000, chunk_size=32)
+
+    assert result.decision == 'precise' and result.stopped_early
+    low, high = result.statistics.win_interval('party')
+    assert (high - low) / 2 <= 0.05
+    fixed = run_batch_statistics('fighter_vs_hobgoblin', range(result.fights))
+    assert fixed.wins == result.statistics.wins
+    print(f"✅ PASS: ±5% reached after {result.fights} fights")
+
+
+def test_parallel_run_stops_early():
+    """Workers stop picking up chunks once the parent has a decision."""
+    result = run_until('fighter_vs_goblin', WinRateThreshold('party', 0.5), max_fights=20000,
+                       processes=2, chunk_size=16)
+    assert result.decision == 'above'
+    assert result.fights < 20000
+    print(f"✅ PASS: parallel run stopped after {result.fights} fights")
+
+
+def test_undecided_at_max_fights():
+    """A rule that can't decide within the budget returns no decision."""
+    rule = WinRatePrecision('party', half_width=0.001)
+    result = run_until('fighter_vs_goblin', rule, max_fights=40, chunk_size=16)
+    assert result.decision is None
+    assert not result.stopped_early
+    assert result.fights == 40
+    print("✅ PASS: no decision within max_fights")
+
+
+def test_parallel_stop_matches_sequential():
+    """Chunks merge in seed order, so processes don't change where the run stops or what it found."""
+    rule = WinRateThreshold('party', 0.5)
+    sequential = run_until('fighter_vs_goblin_pack', rule, max_fights=4000, chunk_size=16)
+    parallel = run_until('fighter_vs_goblin_pack', rule, max_fights=4000, processes=2, chunk_size=16)
+    assert (parallel.decision, parallel.fights) == (sequential.decision, sequential.fights)
+    assert parallel.statistics.wins == sequential.statistics.wins
+    print(f"✅ PASS: parallel and sequential runs both stop after {sequential.fights} fights")
@@ -0,0 +1,98 @@
+# File: test_simulation_service.py
+"""
+Local simulation service tests - a warm pool on localhost answers JSON-RPC
+requests, streams progress and coalesces identical concurrent requests.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from systems.simulation import run_batch_statistics
+from systems.simulation.service import SimulationService, RpcError, call, METHOD_NOT_FOUND, INVALID_PARAMS
+
+
+def _with_service(body):
+    async def run():
+        service = await SimulationService(processes=2, chunk_size=50).start(port=0)
+        try:
+            return await body(service)
+        finally:
+            await service.stop()
+    return asyncio.run(run())
+
+
+def test_simulate_streams_progress_and_matches_a_local_batch():
+    async def body(service):
+        progress = []
+        result = await call('simulate', {'scenario': 'fighter_vs_goblin', 'fights': 200, 'seed': 10},
+                            port=service.port, on_progress=lambda done, total: progress.append((done, total)))
+        return result, progress
+
+    result, progress = _with_service(body)
+    local = json.loads(json.dumps(run_batch_statistics('fighter_vs_goblin', range(10, 210)).summary()))
+    assert result['fights'] == 200
+    assert result['wins'] == local['wins']
+    assert result['rounds']['mean'] == pytest.approx(local['rounds']['mean'])
+    assert [done for done, _ in progress] == [50, 100, 150, 200]
+    print("✅ PASS: simulate over JSON-RPC")
+
+
+def test_identical_requests_are_coalesced():
+    async def body(service):
+        params = {'scenario': 'fighter_vs_hobgoblin', 'fights': 300, 'seed': 0}
+        results = await asyncio.gather(*(call('simulate', params, port=service.port) for _ in range(3)))
+        other = await call('simulate', dict(params, seed=1), port=service.port)
+        return results, other, service.coalesced
+
+    results, other, coalesced = _with_service(body)
+    assert coalesced == 2
+    assert results[0] == results[1] == results[2]
+    assert other['fights'] == 300
+    print("✅ PASS: request coalescing")
+
+
+def test_errors_come_back_as_json_rpc_errors():
+    async def body(service):
+        errors = []
+        for method, params in (('simulate', {'scenario': 'dragon'}), ('teleport', {})):
+            try:
+                await call(method, params, port=service.port)
+            except RpcError as error:
+                errors.append(error.code)
+        reader, writer = await asyncio.open_connection('127.0.0.1', service.port)
+        writer.write(b"not json\n")
+        await writer.drain()
+        parse_error = json.loads(await reader.readline())
+        writer.close()
+        return errors, parse_error, await call('scenarios', port=service.port)
+
+    errors, parse_error, scenarios = _with_service(body)
+    assert errors == [INVALID_PARAMS, METHOD_NOT_FOUND]
+    assert parse_error['error']['code'] == -32700
+    assert 'fighter_vs_snake' in scenarios
+    print("✅ PASS: JSON-RPC errors")
+
+
+def test_cached_results_are_served_without_blocking(tmp_path):
+    from systems.simulation.result_cache import ResultCache
+
+    async def run():
+        cache = ResultCache(str(tmp_path / "cache"))
+        service = await SimulationService(processes=2, chunk_size=50, cache=cache).start(port=0)
+        try:
+            params = {'scenario': 'fighter_vs_goblin', 'fights': 100, 'seed': 3}
+            # The cache key is worked out in a worker, so the server keeps answering meanwhile
+            first, pong = await asyncio.gather(call('simulate', params, port=service.port),
+                                               call('ping', port=service.port))
+            second = await call('simulate', params, port=service.port)
+            return first, second, pong, cache.hits
+        finally:
+            await service.stop()
+
+    first, second, pong, hits = asyncio.run(run())
+    assert pong == 'pong'
+    assert first == second
+    assert hits == 1
+    print("✅ PASS: service answers repeats from the result cache")
@@ -0,0 +1,81 @@
+# File: test_surrogate_model.py
+"""
+Surrogate win-probability model tests - features, fitting, persistence and
+out-of-domain detection.
+"""
+
+import io
+import time
+from contextlib import redirect_stdout
+
+import pytest
+
+from systems.simulation import SCENARIOS, encounter_features, load_surrogate, save_surrogate
+from systems.combat.attack_profiles import AttackProfile
+from systems.simulation.surrogate import (build_matchup, build_training_set, expected_damage, fit_surrogate,
+                                         random_matchups)
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def model():
+    return fit_surrogate(build_training_set(random_matchups(60, seed=1), fights=20, seed=0))
+
+
+def _scenario(name):
+    with redirect_stdout(io.StringIO()):
+        return SCENARIOS[name]()
+
+
+def test_features_reflect_the_stat_blocks():
+    features = encounter_features(_scenario('fighter_vs_goblin_pack'))
+    assert features['party_levels'] == 3
+    assert features['party_hp'] == 28
+    assert features['monster_count'] == 3
+    assert features['monster_xp'] == 150  # Three CR 1/4 goblins
+    assert features['monster_grapplers'] == 0
+    assert encounter_features(_scenario('fighter_vs_snake'))['monster_grapplers'] == 1
+    print("✅ PASS: encounter features")
+
+
+def test_expected_damage_uses_the_engine_hit_rule():
+    # Character.attack has no natural-1 miss: +10 against AC 5 always hits, and a 20 still doubles the dice
+    assert expected_damage(AttackProfile(10, [(1, 8)], 0), 5) == pytest.approx(4.5 * 1.05)
+    # Only a natural 20 hits AC 30
+    assert expected_damage(AttackProfile(0, [(1, 8)], 2), 30) == pytest.approx(0.05 * 6.5 + 0.05 * 4.5)
+    print("✅ PASS: expected damage")
+
+
+def test_model_tracks_held_out_simulations(model):
+    held_out = build_training_set(random_matchups(20, seed=99), fights=30, seed=10**6)
+    error = sum(abs(model.probability(f) - wins / fights) for f, wins, fights in held_out) / len(held_out)
+    assert error < 0.12
+    print(f"✅ PASS: mean absolute error {error:.3f} on held-out matchups")
+
+
+def test_prediction_is_instant_and_ordered(model):
+    weak = build_matchup(((1, 9, 14, 10, 'Mace', None, False),), (('HobgoblinWarrior', 2),))
+    strong = build_matchup(((5, 50, 18, 14, 'Longsword', 'Chain Mail', True),), (('Goblin', 1),))
+    start = time.perf_counter()
+    prediction = model.predict(strong)
+    assert time.perf_counter() - start < 0.1  # Well under a fight; loose enough for a loaded machine
+    assert prediction.probability > model.predict(weak).probability
+    print(f"✅ PASS: {prediction}")
+
+
+def test_out_of_domain_queries_are_flagged(model):
+    huge_party = build_matchup(((20, 300, 18, 14, 'Longsword', 'Chain Mail', True),), (('Goblin', 1),))
+    prediction = model.predict(huge_party)
+    assert not prediction.in_domain
+    assert 'party_levels' in prediction.out_of_domain
+    print(f"✅ PASS: {prediction}")
+
+
+def test_save_and_load_round_trip(model, tmp_path):
+    path = save_surrogate(model, str(tmp_path / "surrogate.json"))
+    loaded = load_surrogate(path)
+    features = encounter_features(_scenario('fighter_vs_hobgoblin'))
+    assert loaded.probability(features) == pytest.approx(model.probability(features))
+    assert load_surrogate(str(tmp_path / "missing.json")) is None
+    print("✅ PASS: surrogate persistence")
@@ -0,0 +1,47 @@
+# File: test_trace_sampling.py
+"""
+Trace sampling tests - only the trials a policy picks get an event log, and
+outlier traces recorded on replay match the silent fights they describe.
+"""
+
+import os
+
+from systems.simulation import run_batch
+from systems.simulation.tracing import EveryNth, FirstK, Outliers, run_traced_batch
+from systems.combat.event_log import read_events
+
+
+def test_up_front_policies_trace_only_their_trials(tmp_path):
+    results, traces = run_traced_batch('fighter_vs_goblin', range(40), str(tmp_path), [EveryNth(10, offset=5), FirstK(2)])
+
+    assert sorted(traces) == [0, 1, 5, 15, 25, 35]
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(path) for path in traces.values())
+    assert all(('trace' in result) == (trial in traces) for trial, result in enumerate(results))
+    # Tracing doesn't change the fights
+    assert [r['hp_remaining'] for r in results] == [r['hp_remaining'] for r in run_batch('fighter_vs_goblin', range(40))]
+    print("✅ PASS: uniform and first-K sampling")
+
+
+def test_outliers_are_traced_on_replay(tmp_path):
+    policy = Outliers(victor='monsters', rounds_above=6, limit=5)
+    results, traces = run_traced_batch('fighter_vs_goblin_pack', range(100), str(tmp_path), [policy])
+
+    unexpected = [t for t, r in enumerate(results) if r['victor'] != 'monsters' or r['rounds'] > 6]
+    assert list(traces) == unexpected[:5]
+    for trial, path in traces.items():
+        end = list(read_events(path, kinds={'fight_end'}))[0]
+        assert (end.victor, end.rounds) == (results[trial]['victor'], results[trial]['rounds'])
+    print("✅ PASS: outlier record-on-replay")
+
+
+def test_majority_winner_and_round_quantile(tmp_path):
+    results, traces = run_traced_batch('fighter_vs_snake', range(60), str(tmp_path), [Outliers(rounds_quantile=0.9)])
+    wins = {}
+    for result in results:
+        wins[result['victor']] = wins.get(result['victor'], 0) + 1
+    usual = max(wins, key=wins.get)
+    rounds = sorted(r['rounds'] for r in results)
+    longest = rounds[54]
+
+    assert set(traces) == {t for t, r in enumerate(results) if r['victor'] != usual or r['rounds'] > longest}
+    print("✅ PASS: outlier thresholds from the batch")
@@ -0,0 +1,93 @@
+# File: test_turn_budget.py
+"""
+Turn budget tests - deadline-aware AI decisions.
+Validates that an expired deadline still yields a legal heuristic answer,
+that a generous deadline yields the full tier decision, and that overruns
+are counted.
+"""
+
+import time
+
+from characters.base_character import Character
+from enemies import HobgoblinWarrior
+from equipment.weapons.martial_melee import longsword
+from ai.base_ai import AIBrain
+from ai.group_blackboard import clear_group_blackboards
+from ai.turn_budget import TURN_BUDGET_STATS, Deadline
+
+
+def _make_fighter(position=0):
+    return Character("Fighter", 3, 28, {'str': 16, 'dex': 10, 'con': 14, 'int': 8, 'wis': 12, 'cha': 15},
+                     longsword, position=position)
+
+
+def test_expired_deadline_returns_heuristic():
+    """With no time left the brain answers with the cheap heuristic only."""
+    clear_group_blackboards()
+    TURN_BUDGET_STATS.reset()
+    fighter = _make_fighter()
+    hobgoblin = HobgoblinWarrior("Hobgoblin", position=40)
+
+    decision = hobgoblin.ai_brain.choose_actions(hobgoblin, [fighter, hobgoblin], deadline=Deadline(0))
+    assert decision['action_target'] is fighter
+    assert decision['action'].weapon is hobgoblin.equipped_weapon
+    assert TURN_BUDGET_STATS.truncated == 1
+    print("✅ PASS: Expired deadline falls back to heuristic")
+
+
+def test_generous_deadline_runs_full_tier():
+    """With time to spare the full tier decision is returned."""
+    clear_group_blackboards()
+    TURN_BUDGET_STATS.reset()
+    fighter = _make_fighter()
+    hobgoblin = HobgoblinWarrior("Hobgoblin", position=40)
+
+    decision = hobgoblin.ai_brain.choose_actions(hobgoblin, [fighter, hobgoblin], deadline=5.0)
+    assert decision['action'].weapon is hobgoblin.secondary_weapon
+    assert TURN_BUDGET_STATS.truncated == 0
+    assert TURN_BUDGET_STATS.overruns == 0
+    print("✅ PASS: Generous deadline runs the full tier")
+
+
+def test_overrun_is_recorded():
+    """A stage that runs past the budget is counted as an overrun."""
+    TURN_BUDGET_STATS.reset()
+    fighter = _make_fighter()
+    brain = AIBrain()
+
+    def slow_stage(character, combatants):
+        time.sleep(0.01)
+        return None
+
+    decision = brain.refine_until_deadline(fighter, [fighter], 0.001, [brain.heuristic_actions, slow_stage])
+    # The untimed slow stage is tried, produces nothing, and the heuristic then runs past the deadline
+    assert decision is not None
+    assert TURN_BUDGET_STATS.overruns == 1
+    assert TURN_BUDGET_STATS.as_dict()['overruns_by_brain'] == {'AIBrain': 1}
+    print("✅ PASS: Overruns are instrumented")
+
+
+def test_budget_skips_the_heuristic_when_the_tier_fits():
+    """Under a budget the tier stage runs alone when it fits, and is skipped once it is known not to."""
+    TURN_BUDGET_STATS.reset()
+    fighter = _make_fighter()
+    brain = AIBrain()
+    calls = []
+
+    def heuristic(character, combatants):
+        calls.append('heuristic')
+        return brain.heuristic_actions(character, combatants)
+
+    def deep(character, combatants):
+        calls.append('deep')
+        time.sleep(0.005)
+        return brain.heuristic_actions(character, combatants)
+
+    brain.refine_until_deadline(fighter, [fighter], 1.0, [heuristic, deep])
+    assert calls == ['deep']
+
+    calls.clear()
+    brain.refine_until_deadline(fighter, [fighter], 0.001, [heuristic, deep])
+    assert calls == ['heuristic']
+    assert TURN_BUDGET_STATS.truncated == 1
+    print("✅ PASS: Budget picks one stage by its expected cost")